@@ -1,39 +1,62 @@
 import logging
 import os
-import re
+import time
+from typing import Optional
 from urllib.parse import urlparse
 import streamlit as st
-import boto3
 import st_yled
 import dotenv
 
+import edithistory
+import exportcache
+import instrumentation
+import sessiongc
+import sharelink
+import themelibrary
 import uiconfig
+import utils
+from configtemplate import load_config_template
+from elementregistry import get_element_registry, get_style_name
+from elementstate import get_element_cards
+from feedback import LogTransport, SesTransport, get_feedback_worker
+from themeschema import THEME_PROPERTIES
+from themestate import get_theme_state
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 dotenv.load_dotenv()
 
-try:
-    ses_client = boto3.client(
-        "ses",
+# Opt-in timing spans, viewable on the hidden debug page
+if os.getenv("STUDIO_INSTRUMENTATION"):
+    instrumentation.enable()
+
+# SES client is built lazily by the transport, off the first page load
+feedback_email = os.getenv("FEEDBACK_MAIL")
+
+if feedback_email:
+    feedback_transport = SesTransport(
+        feedback_email,
         region_name=os.getenv("AWS_REGION"),
         aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
         aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
     )
+else:
+    logger.error("FEEDBACK_MAIL not set in environment variables")
+    feedback_transport = LogTransport()
 
-    feedback_email = os.getenv("FEEDBACK_MAIL")
-    if not feedback_email:
-        msg = "FEEDBACK_MAIL not set in environment variables"
-        raise ValueError(msg)
-
-except Exception as e:
-    logger.error(f"Failed to create SES client: {e}")
-    ses_client = None
+# Feedback is delivered by a background worker, the dialog only enqueues
+feedback_worker = get_feedback_worker(
+    uiconfig.FEEDBACK_OUTBOX_PATH, feedback_transport
+)
 
 
+@instrumentation.timed("get_updated_theme_config")
 def get_updated_theme_config():
-    """Check in session state which theme values were updated compared to default
+    """Collect theme values which were updated compared to default
+
+    Only properties flagged as changed in the theme state are visited, each is
+    formatted by the toml serializer of its schema property.
 
     dict structure
 
@@ -45,30 +68,10 @@ def get_updated_theme_config():
         dict: updated theme config values
 
     """
-
-    updated_config = {}
-
-    for key in st.session_state:
-        if key.startswith("theme-") and not key.endswith("-default"):
-            default_key = f"{key}-default"
-            if st.session_state[key] != st.session_state.get(default_key, None):
-                # Format correctly for toml
-                if isinstance(st.session_state[key], bool):
-                    updated_config[key] = "true" if st.session_state[key] else "false"
-                elif isinstance(st.session_state[key], tuple):
-                    size_value, size_unit = st.session_state[key]
-
-                    # Round float values to 2 decimal places
-                    if isinstance(size_value, float):
-                        size_value = round(size_value, 2)
-
-                    updated_config[key] = f'"{size_value}{size_unit}"'
-                elif isinstance(st.session_state[key], int):
-                    updated_config[key] = f"{st.session_state[key]}"
-                else:
-                    updated_config[key] = f'"{st.session_state[key]}"'
-
-    return updated_config
+    return {
+        key: THEME_PROPERTIES[key].to_toml(value)
+        for key, value in get_theme_state().changed().items()
+    }
 
 
 def format_theme_toml(theme_txt: str, section_name: str) -> str:
@@ -83,52 +86,10 @@ def format_theme_toml(theme_txt: str, section_name: str) -> str:
     return toml_line
 
 
+@instrumentation.timed("set_config_toml")
 def set_config_toml(template_path: str, updated_themes: dict) -> str:
-    with open(template_path, "r") as f:
-        config_toml = f.readlines()
-
-    form_type = None
-    config_lines_update = []
-
-    theme_updates = []
-    theme_sidebar_updates = []
-
-    for line in config_toml:
-        # Remove newlines
-        line = line.rstrip("\n")
-
-        if line.startswith("[theme]"):
-            form_type = "theme"
-        elif line.startswith("[theme.sidebar]"):
-            form_type = "theme-sidebar"
-        elif line.startswith("["):
-            form_type = None
-
-        if form_type and re.match(r"^# [a-zA-Z]+ =$", line.strip()):
-            config_key = line.strip().replace("# ", "").replace(" =", "")
-            config_key_form = f"{form_type}-{config_key}"
-
-            if config_key_form in updated_themes:
-                key_line = f"{config_key} = {updated_themes[config_key_form]}"
-                config_lines_update.append(key_line)
-
-                if form_type == "theme":
-                    theme_updates.append(key_line)
-                elif form_type == "theme-sidebar":
-                    theme_sidebar_updates.append(key_line)
-                else:
-                    raise ValueError("Unknown form type")
-            else:
-                config_lines_update.append(line)
-
-        else:
-            config_lines_update.append(line)
-
-    return (
-        "\n".join(config_lines_update),
-        "\n".join(theme_updates),
-        "\n".join(theme_sidebar_updates),
-    )
+    template = load_config_template(template_path)
+    return template.render(updated_themes)
 
 
 def format_css_from_dict(css_dict: dict) -> str:
@@ -144,14 +105,80 @@ def format_css_from_dict(css_dict: dict) -> str:
     return "\n".join(css_lines)
 
 
+def get_theme_export(config_toml_template_path: str) -> tuple[str, str, str]:
+    """Return config.toml and the section snippets of the session theme
+
+    Artifacts are shared across sessions, keyed by the changed theme values.
+    """
+    cache_key = exportcache.theme_export_key(
+        get_theme_state().changed(), config_toml_template_path
+    )
+    return exportcache.get_export_cache().get_or_build(
+        cache_key,
+        lambda: set_config_toml(config_toml_template_path, get_updated_theme_config()),
+    )
+
+
+def build_elements_css(element_cards: list) -> tuple[str, str]:
+    """Return st-styled.css of the element cards and a note on excluded elements"""
+    # Extract all values related to elements from the element cards
+    # Get for those elements the values and related css properties
+    # Write properties into css format
+
+    export_elements = {}
+    excluded_elements_message = ""
+
+    for element_card in element_cards:
+        for variant, values in element_card.styles.items():
+            if not values:
+                continue
+
+            # Take care of variants
+            element_name = get_style_name(element_card.name, variant)
+
+            if element_card.name not in uiconfig.ELEMENTS_EXCLUDED_FROM_CSS:
+                export_elements[element_name] = values
+            else:
+                excluded_elements_message = f'Some elements are excluded from CSS export, e.g., {element_name}. Use "Copy Python" in the element editor instead.'
+
+    # Get CSS for element from precomputed selector targets
+    export_css = {}
+    element_styles = get_element_registry().styles
+
+    for element_name in export_elements.keys():
+        element_targets = element_styles[element_name].targets
+
+        for css_prop_format, value in export_elements[element_name].items():
+            # css_prop example: background-color
+            for css_selector, css_prop in element_targets[css_prop_format]:
+                if css_selector not in export_css:
+                    export_css[css_selector] = {}
+
+                export_css[css_selector][css_prop] = value
+
+    # Convert export dict into css
+    return format_css_from_dict(export_css), excluded_elements_message
+
+
+def get_elements_export() -> tuple[str, str]:
+    """Return st-styled.css of the session element cards
+
+    Artifacts are shared across sessions, keyed by the styles of all cards.
+    """
+    element_cards = list(get_element_cards().values())
+    cache_key = exportcache.elements_export_key(element_cards, st_yled.__version__)
+    return exportcache.get_export_cache().get_or_build(
+        cache_key, lambda: build_elements_css(element_cards)
+    )
+
+
 def render_export_theme(config_toml_template_path: str):
     st_yled.init(
     bypass_css_validation = True
 )
 
-    updated_themes = get_updated_theme_config()
-    config_toml, theme_updates, theme_sidebar_updates = set_config_toml(
-        config_toml_template_path, updated_themes
+    config_toml, theme_updates, theme_sidebar_updates = get_theme_export(
+        config_toml_template_path
     )
 
     st.write("")
@@ -241,58 +268,13 @@ def render_export_theme(config_toml_template_path: str):
             st.rerun()
 
 
+@instrumentation.timed("render_export_elements")
 def render_export_elements():
     st_yled.init(
     bypass_css_validation = True
 )
 
-    # Extract all values related to elements from session state
-    # Get for those elements the values and related css properties
-    # Write properties into css format
-    # Provide option to download css file OR copy code
-
-    export_elements = {}
-    excluded_elements_message = ""
-
-    for key in st.session_state:
-        if key.startswith("element-") and key.endswith("-value"):
-            
-            css_prop_format = key.split("-")[-2]
-            # Take care of variants
-            element_name = key.split("-")[1:-2]
-            element_name = "_".join(element_name)
-
-            if element_name not in uiconfig.ELEMENTS_EXCLUDED_FROM_CSS:
-                if element_name not in export_elements:
-                    export_elements[element_name] = {}
-                export_elements[element_name][css_prop_format] = st.session_state[key]
-            else:
-                excluded_elements_message = f'Some elements are excluded from CSS export, e.g., {element_name}. Use "Copy Python" in the element editor instead.'
-
-    # Get CSS for element
-    export_css = {}
-
-    for element_name in export_elements.keys():
-        element_config = st_yled.styler.get_element_style(element_name)
-        element_config_css = element_config["css"]
-
-        for css_prop_format in export_elements[element_name]:
-
-            css_format = element_config_css[css_prop_format]
-
-            for css_selector in css_format.keys():
-                # css_prop example: background-color
-                css_prop = list(css_format[css_selector].keys())[0]
-
-                if css_selector not in export_css:
-                    export_css[css_selector] = {}
-
-                export_css[css_selector][css_prop] = export_elements[element_name][
-                    css_prop_format
-                ]
-
-    # Convert export dict into css
-    export_css_format = format_css_from_dict(export_css)
+    export_css_format, excluded_elements_message = get_elements_export()
 
     cont = st.container(key="export-elements-container")
 
@@ -676,17 +658,12 @@ Send us your **feedback** and **ideas**!
                 if email.strip() != "":
                     logger.info("Feedback received from %s", email)
 
-                if ses_client:
-                    email_message = f"Feedback:\n{feedback}\n\n"
-                    if email.strip() != "":
-                        email_message += f"From: {email}\n"
+                email_message = f"Feedback:\n{feedback}\n\n"
+                if email.strip() != "":
+                    email_message += f"From: {email}\n"
 
-                    ses_client.send_email(
-                        Source=feedback_email, Destination={"ToAddresses": [feedback_email]}, Message={
-                                "Subject": {"Data": "st_yled studio Feedback"},
-                                "Body": {"Text": {"Data": email_message}},
-                            }
-                    )
+                # Delivery happens in the background, returns immediately
+                feedback_worker.submit("st_yled studio Feedback", email_message)
 
                 logger.info("Feedback received: %s", feedback)
 
@@ -699,12 +676,107 @@ Send us your **feedback** and **ideas**!
     st.write("")
 
 
-# region UI
+def get_library_owner() -> Optional[str]:
+    """Return the owner of saved themes, None if the library is not available
+
+    Logged in users own their themes. Without login all visitors would share
+    one owner, the library is then only offered for local single-user runs
+    with STUDIO_LOCAL_THEME_LIBRARY set.
+    """
+    if st.user.get("is_logged_in"):
+        return st.user.get("email")
+    if os.getenv("STUDIO_LOCAL_THEME_LIBRARY"):
+        return uiconfig.THEME_LIBRARY_LOCAL_OWNER
+    return None
+
 
-st_yled.init(
+@st.dialog("Theme library", width="medium")
+def render_library_dialog():
+    st_yled.init(
     bypass_css_validation = True
 )
 
+    owner = get_library_owner()
+    if owner is None:
+        st_yled.info("Log in to save themes", key="library-login-info")
+        return
+
+    theme_library = themelibrary.get_theme_library(uiconfig.THEME_LIBRARY_PATH)
+
+    with st_yled.container(
+        key="library-dialog-save-container",
+        horizontal=True,
+        vertical_alignment="bottom",
+    ):
+        name = st_yled.text_input(
+            "Save theme and element styles as",
+            max_chars=uiconfig.THEME_LIBRARY_NAME_MAX_CHARS,
+            placeholder="Theme name",
+            key="library-name-input",
+        )
+
+        if st.button(
+            "Save", icon=":material/save:", type="primary", key="library-save-button"
+        ):
+            if name.strip() == "":
+                st_yled.warning("Please provide a name", key="library-name-warning")
+            else:
+                snapshot = sharelink.encode_share_state(
+                    get_theme_state().changed(), get_element_cards().values()
+                )
+                theme_library.save(owner, name.strip(), snapshot)
+                st.toast(f"Saved {name.strip()}", icon=":material/check_circle:")
+
+    st.write("")
+
+    saved_themes = theme_library.list(owner, uiconfig.THEME_LIBRARY_LIST_LIMIT)
+
+    if not saved_themes:
+        st_yled.info(
+            "**:material/notifications: No saved themes - yet**", key="library-empty-info"
+        )
+
+    for saved_name, updated_at in saved_themes:
+        with st.container(
+            horizontal=True,
+            vertical_alignment="center",
+            key=f"library-theme-container-{saved_name}",
+        ):
+            st.markdown(f"**{saved_name}**")
+            st_yled.caption(
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(updated_at)),
+                width=120,
+            )
+
+            if st.button("Load", key=f"library-load-{saved_name}"):
+                snapshot = theme_library.load(owner, saved_name)
+
+                try:
+                    share_state = sharelink.decode_share_state(snapshot or "")
+                except ValueError as e:
+                    st_yled.warning(f"{saved_name} can not be loaded: {e}")
+                else:
+                    # Replaces theme and element state, the page is built once with it
+                    sharelink.hydrate_session(share_state)
+                    st.session_state["library-loaded"] = saved_name
+                    st_yled.rerun()
+
+            if st.button(
+                "Delete", icon=":material/delete:", key=f"library-delete-{saved_name}"
+            ):
+                theme_library.delete(owner, saved_name)
+                st.rerun(scope="fragment")
+
+
+# region UI
+
+with instrumentation.span("st_yled_init"):
+    st_yled.init(
+        bypass_css_validation = True
+    )
+
+utils.inject_studio_css()
+
 theme_page = st.Page("pages/theme.py", title="Theme")
 element_page = st.Page("pages/elements.py", title="Elements")
 components_page = st.Page("pages/components.py", title="New Components")
@@ -713,7 +785,16 @@ components_detail = st.Page(
 )
 
 
-pg = st.navigation([theme_page, element_page, components_page, components_detail])
+pages = [theme_page, element_page, components_page, components_detail]
+
+if instrumentation.is_enabled():
+    pages.append(
+        st.Page(
+            "pages/debug.py", title="Debug", url_path="debug", visibility="hidden"
+        )
+    )
+
+pg = st.navigation(pages)
 
 st.set_page_config(page_title="st_yled studio", page_icon="assets/st_yled Logo.png")
 
@@ -728,6 +809,12 @@ if "feedback-submitted" in st.session_state:
         )
         del st.session_state["feedback-submitted"]
 
+if "library-loaded" in st.session_state:
+    st.toast(
+        f"Loaded {st.session_state.pop('library-loaded')}",
+        icon=":material/check_circle:",
+    )
+
 # region SIDEBAR FOOTER
 
 with st.sidebar.container(key="sidebar-footer-container"):
@@ -776,6 +863,10 @@ with st.sidebar.container(key="sidebar-footer-container"):
         st.image("https://evo-byte.com/wp-content/uploads/2026/04/EVOBYTE-Data-Science-scaled.webp", width=136, link="https://evo-byte.com/")
 
 
+# Edits of the last run, including callbacks of this run, form one undo step
+edit_history = edithistory.get_edit_history()
+edithistory.record_edits()
+
 # region HEADER
 
 sticky_header_bg = st_yled.container(
@@ -807,6 +898,24 @@ with sticky_header:
     with st.container(
         horizontal=True, horizontal_alignment="right", vertical_alignment="center"
     ):
+        st_yled.button(
+            "Undo",
+            icon=":material/undo:",
+            key="undo-button",
+            type="tertiary",
+            on_click=edithistory.undo_edit,
+            disabled=not edit_history.can_undo(),
+        )
+
+        st_yled.button(
+            "Redo",
+            icon=":material/redo:",
+            key="redo-button",
+            type="tertiary",
+            on_click=edithistory.redo_edit,
+            disabled=not edit_history.can_redo(),
+        )
+
         st_yled.button(
             "Export to your app",
             type="primary",
@@ -819,6 +928,17 @@ with sticky_header:
         # with st_yled.popover("Export Theme", icon=':material/file_export:', background_color=uiconfig.PRIMARY_COLOR_DEFAULT, width=172, color="#ffffff"):
         #     render_export_theme()
 
+        if get_library_owner() is not None:
+            st_yled.button(
+                "Library",
+                icon=":material/bookmarks:",
+                key="library-button",
+                type="secondary",
+                on_click=render_library_dialog,
+                border_style="none",
+                background_color="#97a6c326",
+            )
+
         st_yled.button(
             "Help",
             icon=":material/help:",
@@ -840,4 +960,11 @@ with sticky_header:
         )
 
 
+# A newly opened share link replaces the session state before the page is built
+sharelink.sync_query_params()
+
 pg.run()
+
+# Drop widget states of stale seeds, runs after the page on every full run
+with instrumentation.span("session_gc"):
+    sessiongc.collect_stale_widget_keys()
@@ -0,0 +1,404 @@
+"""Rerun benchmark for st_yled studio
+
+Drives app.py headlessly with streamlit's AppTest and times user workloads.
+Every scenario runs in a fresh interpreter and records:
+- wall_ms: time of the measured interaction, including AppTest overhead
+- script_ms: time spent in script runs, from script start to stop events
+- script_runs: number of script runs of the interaction
+- peak_rss_mb: peak resident memory of the scenario process
+
+Results are compared against a stored baseline, regressions exit with code 1.
+Run from the repository root:
+
+    python benchmarks/reruns.py --repeat 3 --json reruns.json
+    python benchmarks/reruns.py --save-baseline
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "reruns_baseline.json"
+
+BASE_URL = "http://localhost:8501/"
+
+# Picked in the edit scenarios, differs from the primaryColor default
+EDIT_COLOR = "#1a73e8"
+
+# Elements added in order by the add_elements scenarios
+ELEMENT_NAMES = [
+    "write",
+    "text_input",
+    "metric",
+    "container",
+    "expander",
+    "popover",
+    "selectbox",
+    "checkbox",
+    "slider",
+    "markdown",
+    "title",
+    "header",
+    "subheader",
+    "caption",
+    "text",
+    "code",
+    "info",
+    "success",
+    "warning",
+    "error",
+    "toggle",
+    "radio",
+    "multiselect",
+    "number_input",
+    "text_area",
+    "date_input",
+    "time_input",
+    "color_picker",
+    "file_uploader",
+    "camera_input",
+    "download_button",
+    "link_button",
+    "form_submit_button",
+    "menu_button",
+    "pills",
+    "segmented_control",
+    "select_slider",
+    "progress",
+    "status",
+    "tabs",
+]
+
+
+class ScriptTimer:
+    """Collects script run durations from the events of AppTest's script runner"""
+
+    STOP_EVENTS = (
+        "SCRIPT_STOPPED_WITH_SUCCESS",
+        "SCRIPT_STOPPED_WITH_COMPILE_ERROR",
+        "SCRIPT_STOPPED_FOR_RERUN",
+        "FRAGMENT_STOPPED_WITH_SUCCESS",
+    )
+
+    def __init__(self):
+        self.durations = []
+        self._started_at = None
+
+    def install(self):
+        from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+        timer = self
+        init = LocalScriptRunner.__init__
+
+        def timed_init(runner, *args, **kwargs):
+            init(runner, *args, **kwargs)
+            runner.on_event.connect(timer.on_event, weak=False)
+
+        LocalScriptRunner.__init__ = timed_init
+
+    def on_event(self, sender, event, **kwargs):
+        if event.name == "SCRIPT_STARTED":
+            self._started_at = time.perf_counter()
+        elif event.name in self.STOP_EVENTS and self._started_at is not None:
+            self.durations.append(time.perf_counter() - self._started_at)
+            self._started_at = None
+
+    def reset(self):
+        self.durations.clear()
+
+
+def set_url(path: str):
+    """AppTest has no browser URL, the export button routes by st.context.url"""
+    import streamlit.runtime.context as context
+
+    context.ContextProxy.url = property(lambda self: BASE_URL + path)
+
+
+def new_app():
+    from streamlit.testing.v1 import AppTest
+
+    set_url("")
+    return AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+
+
+def check(at):
+    if at.exception:
+        raise RuntimeError(f"Script raised: {at.exception[0].value}")
+    return at
+
+
+def open_page(at, page: str, path: str, **query_params):
+    set_url(path)
+    at.switch_page(page)
+    for key, value in query_params.items():
+        at.query_params[key] = value
+    return at
+
+
+def add_elements(at, names: list[str]):
+    for name in names:
+        check(at.selectbox(key="elements-search-select").select(name).run())
+        check(at.button(key="elements-add-element-selection").click().run())
+
+
+def open_export(at, path: str):
+    """Return to app.py's header and open the export dialog of a page"""
+    at.switch_page("app.py")
+    check(at.run())
+    set_url(path)
+    return at.button(key="export-button").click()
+
+
+# Scenarios return (setup, measured) callables, measured returns the AppTest to check
+
+
+def first_load(page: str, path: str, **query_params):
+    def setup():
+        at = new_app()
+        if page:
+            check(at.run())
+            open_page(at, page, path, **query_params)
+        return at
+
+    return setup, lambda at: at.run()
+
+
+def theme_color_edit():
+    def setup():
+        return check(new_app().run())
+
+    return setup, lambda at: check_theme_changed(
+        at.color_picker[0].pick(EDIT_COLOR).run()
+    )
+
+
+def add_elements_scenario(count: int):
+    def setup():
+        at = check(new_app().run())
+        return check(open_page(at, "pages/elements.py", "elements").run())
+
+    def measure(at):
+        add_elements(at, ELEMENT_NAMES[:count])
+        return at
+
+    return setup, measure
+
+
+def check_theme_changed(at):
+    from themestate import THEME_STATE_KEY
+
+    if not at.session_state[THEME_STATE_KEY].changed():
+        raise RuntimeError("Theme edit did not change the theme")
+    return at
+
+
+def export_theme():
+    def setup():
+        at = check(new_app().run())
+        return check_theme_changed(check(at.color_picker[0].pick(EDIT_COLOR).run()))
+
+    return setup, lambda at: at.button(key="export-button").click().run()
+
+
+def export_elements():
+    def setup():
+        at = check(new_app().run())
+        check(open_page(at, "pages/elements.py", "elements").run())
+        add_elements(at, ELEMENT_NAMES[:3])
+        check(at.color_picker[0].pick(EDIT_COLOR).run())
+        return open_export(at, "elements")
+
+    return setup, lambda at: at.run()
+
+
+def export_components():
+    def setup():
+        at = check(new_app().run())
+        check(open_page(at, "pages/components.py", "components").run())
+        return open_export(at, "components")
+
+    return setup, lambda at: at.run()
+
+
+def component_detail():
+    def setup():
+        at = check(new_app().run())
+        return check(open_page(at, "pages/components.py", "components").run())
+
+    def measure(at):
+        open_page(
+            at, "pages/component_detail.py", "component-detail",
+            component="badge_card_one",
+        )
+        return at.run()
+
+    return setup, measure
+
+
+SCENARIOS = {
+    "first_load_theme": lambda: first_load(None, ""),
+    "first_load_elements": lambda: first_load("pages/elements.py", "elements"),
+    "first_load_components": lambda: first_load("pages/components.py", "components"),
+    "first_load_component_detail": lambda: first_load(
+        "pages/component_detail.py", "component-detail", component="badge_card_one"
+    ),
+    "theme_color_edit": theme_color_edit,
+    "add_elements_1": lambda: add_elements_scenario(1),
+    "add_elements_10": lambda: add_elements_scenario(10),
+    "add_elements_40": lambda: add_elements_scenario(40),
+    "export_theme": export_theme,
+    "export_elements": export_elements,
+    "export_components": export_components,
+    "component_detail": component_detail,
+}
+
+
+def run_child(name: str):
+    """Run a single scenario in this process and print its result as json"""
+    sys.path.insert(0, str(ROOT))
+
+    timer = ScriptTimer()
+    timer.install()
+
+    setup, measure = SCENARIOS[name]()
+    at = setup()
+    timer.reset()
+
+    start = time.perf_counter()
+    at = measure(at)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    check(at)
+
+    print(
+        json.dumps(
+            {
+                "wall_ms": wall_ms,
+                "script_ms": sum(timer.durations) * 1000,
+                "script_runs": len(timer.durations),
+                "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            }
+        )
+    )
+
+
+def measure_scenario(name: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", name],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario {name} failed:\n{result.stderr[-2000:]}")
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(names: list[str], repeat: int) -> dict:
+    results = {}
+
+    for name in names:
+        samples = [measure_scenario(name) for _ in range(repeat)]
+        results[name] = {
+            key: statistics.median(sample[key] for sample in samples)
+            for key in samples[0]
+        }
+
+    return {"python": sys.version.split()[0], "repeat": repeat, "scenarios": results}
+
+
+def compare(report: dict, baseline: dict, tolerance: float, min_delta_ms: float):
+    """Return regressions of wall and script time against the baseline"""
+    regressions = []
+
+    for name, result in report["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+
+        for key in ("wall_ms", "script_ms"):
+            delta = result[key] - base[key]
+            if delta > min_delta_ms and result[key] > base[key] * (1 + tolerance):
+                regressions.append((name, key, base[key], result[key]))
+
+    return regressions
+
+
+def print_report(report: dict, baseline: dict = None):
+    print(f"  {'scenario':<30} {'wall':>9} {'script':>9} {'runs':>5} {'rss':>9}")
+
+    for name, result in report["scenarios"].items():
+        line = (
+            f"  {name:<30} {result['wall_ms']:7.0f}ms {result['script_ms']:7.0f}ms "
+            f"{result['script_runs']:5.0f} {result['peak_rss_mb']:6.1f} MB"
+        )
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base:
+            line += f"  (baseline wall {base['wall_ms']:.0f}ms)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run, default all")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--json", type=Path, help="write the report as json")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the report as baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative slowdown"
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=20.0, help="ignore smaller slowdowns"
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = run(args.scenarios or list(SCENARIOS), args.repeat)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print_report(report)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    print_report(report, baseline)
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline")
+        return
+
+    regressions = compare(report, baseline, args.tolerance, args.min_delta_ms)
+    for name, key, before, after in regressions:
+        print(f"REGRESSION {name} {key}: {before:.0f}ms -> {after:.0f}ms")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Startup benchmark for st_yled studio
+
+Measures in fresh interpreters:
+- import cost of app.py dependencies, self time aggregated by top-level package
+- import cost of heavy dependencies on their own
+- first script run of every page and the peak memory of that process
+
+Run from the repository root:
+
+    python benchmarks/startup.py --repeat 3 --json startup.json
+"""
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Heavy dependencies measured on their own
+DEPENDENCIES = ["streamlit", "st_yled", "boto3", "numpy", "pandas", "openpyxl"]
+
+# Page name to (page script, query params), None runs app.py's default page
+PAGES = {
+    "theme": (None, {}),
+    "elements": ("pages/elements.py", {}),
+    "components": ("pages/components.py", {}),
+    "component_detail": ("pages/component_detail.py", {"component": "badge_card_one"}),
+}
+
+PAGE_RUN_SCRIPT = """
+import json, resource, sys, time
+
+rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+from streamlit.testing.v1 import AppTest
+
+page, query_params = sys.argv[1], json.loads(sys.argv[2])
+
+at = AppTest.from_file("app.py", default_timeout=120)
+if page:
+    at.switch_page(page)
+for key, value in query_params.items():
+    at.query_params[key] = value
+
+start = time.perf_counter()
+at.run()
+first_run_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+at.run()
+second_run_ms = (time.perf_counter() - start) * 1000
+
+print(json.dumps({
+    "first_run_ms": first_run_ms,
+    "second_run_ms": second_run_ms,
+    "rss_start_mb": rss_start / 1024,
+    "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "exceptions": [e.value for e in at.exception],
+}))
+"""
+
+
+def get_app_imports(path: Path = ROOT / "app.py") -> list[str]:
+    """Return the modules imported at the top level of app.py, in order"""
+    modules = []
+
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            names = [node.module]
+        else:
+            continue
+
+        modules.extend(name for name in names if name not in modules)
+
+    return modules
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int]]:
+    """Parse -X importtime output into (module, self us, cumulative us)"""
+    rows = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return rows
+
+
+def measure_imports(modules: list[str]) -> dict:
+    """Import modules in a fresh interpreter, aggregate self time by package"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows = parse_importtime(result.stderr)
+
+    by_package = defaultdict(int)
+    for module, self_us, _ in rows:
+        by_package[module.split(".")[0]] += self_us
+
+    return {
+        "total_ms": sum(self_us for _, self_us, _ in rows) / 1000,
+        "modules": len(rows),
+        "by_package_ms": {
+            package: self_us / 1000
+            for package, self_us in sorted(
+                by_package.items(), key=lambda item: item[1], reverse=True
+            )
+        },
+    }
+
+
+def measure_page(page: str, query_params: dict) -> dict:
+    """Run a page for the first time in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", PAGE_RUN_SCRIPT, page or "", json.dumps(query_params)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median_of(samples: list[dict], key: str) -> float:
+    return statistics.median(sample[key] for sample in samples)
+
+
+def run(repeat: int, top: int) -> dict:
+    report = {"python": sys.version.split()[0], "repeat": repeat}
+
+    # Modules imported by app.py before the first page renders
+    app_imports = get_app_imports()
+    app_samples = [measure_imports(app_imports) for _ in range(repeat)]
+    report["app_imports"] = {
+        "total_ms": median_of(app_samples, "total_ms"),
+        "modules": app_samples[0]["modules"],
+        "by_package_ms": dict(list(app_samples[0]["by_package_ms"].items())[:top]),
+    }
+
+    report["dependencies"] = {}
+    for dependency in DEPENDENCIES:
+        samples = [measure_imports([dependency]) for _ in range(repeat)]
+        report["dependencies"][dependency] = median_of(samples, "total_ms")
+
+    report["pages"] = {}
+    for name, (page, query_params) in PAGES.items():
+        samples = [measure_page(page, query_params) for _ in range(repeat)]
+        report["pages"][name] = {
+            "first_run_ms": median_of(samples, "first_run_ms"),
+            "second_run_ms": median_of(samples, "second_run_ms"),
+            "rss_start_mb": median_of(samples, "rss_start_mb"),
+            "rss_peak_mb": median_of(samples, "rss_peak_mb"),
+            "exceptions": samples[-1]["exceptions"],
+        }
+
+    return report
+
+
+def print_report(report: dict):
+    app_imports = report["app_imports"]
+    print(
+        f"app.py imports: {app_imports['total_ms']:.0f} ms "
+        f"({app_imports['modules']} modules)"
+    )
+    for package, ms in app_imports["by_package_ms"].items():
+        print(f"  {package:<24} {ms:8.1f} ms")
+
+    print("\nDependencies imported alone:")
+    for dependency, ms in report["dependencies"].items():
+        print(f"  {dependency:<24} {ms:8.1f} ms")
+
+    print("\nFirst page run:")
+    print(f"  {'page':<24} {'first':>8} {'second':>8} {'rss':>10}")
+    for name, page in report["pages"].items():
+        print(
+            f"  {name:<24} {page['first_run_ms']:6.0f}ms {page['second_run_ms']:6.0f}ms "
+            f"{page['rss_peak_mb']:7.1f} MB"
+        )
+        for exception in page["exceptions"]:
+            print(f"    exception: {exception}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    parser.add_argument("--top", type=int, default=15, help="packages to report")
+    parser.add_argument("--json", type=Path, help="write the report as json")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.top)
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
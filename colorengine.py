@@ -0,0 +1,194 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Sequence, Union
+
+from lazyimport import lazy_import
+
+# numpy is executed on the first color resolved, not on import
+np = lazy_import("numpy")
+
+HEX_COLOR_PATTERN = re.compile(r"^#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
+
+DEFAULT_BACKGROUND = "#FFFFFF"
+
+# Scalar results kept in the LRU front
+COLOR_CACHE_SIZE = 1024
+
+# Positions of the 8 RGBA nibbles in the hex digits of each format,
+# position 8 is an appended 'f' for the alpha of formats without alpha
+_NIBBLE_POSITIONS = {
+    3: (0, 0, 1, 1, 2, 2, 8, 8),  # RGB
+    4: (0, 0, 1, 1, 2, 2, 3, 3),  # RGBA
+    6: (0, 1, 2, 3, 4, 5, 8, 8),  # RRGGBB
+    8: (0, 1, 2, 3, 4, 5, 6, 7),  # RRGGBBAA
+}
+
+
+def _build_hex_lookup():
+    lookup = np.full(256, 255, dtype=np.uint8)
+    for digit in "0123456789abcdef":
+        lookup[ord(digit)] = int(digit, 16)
+        lookup[ord(digit.upper())] = int(digit, 16)
+    return lookup
+
+
+_hex_lookup = None
+
+
+def is_hex_color(value) -> bool:
+    return isinstance(value, str) and HEX_COLOR_PATTERN.match(value) is not None
+
+
+def parse_hex_colors(colors: Sequence[str]):
+    """Parse hex colors in #RGB, #RGBA, #RRGGBB or #RRGGBBAA format
+
+    Returns:
+        np.ndarray: uint8 array of shape (n, 4) with RGBA channels
+    """
+    global _hex_lookup
+    if _hex_lookup is None:
+        _hex_lookup = _build_hex_lookup()
+
+    digits = [color[1:] if color.startswith("#") else color for color in colors]
+    lengths = np.fromiter((len(d) for d in digits), dtype=np.int64, count=len(digits))
+
+    valid_length = np.isin(lengths, tuple(_NIBBLE_POSITIONS))
+    if not valid_length.all():
+        invalid = colors[int(np.argmin(valid_length))]
+        raise ValueError(f"Expected #RGB, #RGBA, #RRGGBB or #RRGGBBAA, got {invalid}")
+
+    # Fixed width ascii buffer, the 9th column is the implicit alpha 'f'
+    ascii_digits = "".join(d.ljust(8, "0") + "f" for d in digits).encode(
+        "ascii", errors="replace"
+    )
+    nibbles = _hex_lookup[np.frombuffer(ascii_digits, dtype=np.uint8)].reshape(-1, 9)
+
+    positions = np.empty((len(digits), 8), dtype=np.int64)
+    for length, length_positions in _NIBBLE_POSITIONS.items():
+        positions[lengths == length] = length_positions
+
+    nibbles = np.take_along_axis(nibbles, positions, axis=1)
+    if (nibbles == 255).any():
+        invalid = colors[int(np.argmax((nibbles == 255).any(axis=1)))]
+        raise ValueError(f"Invalid hex color {invalid}")
+
+    return nibbles[:, 0::2] * 16 + nibbles[:, 1::2]
+
+
+def blend_over(rgba, background_rgb):
+    """Alpha-blend RGBA colors over opaque backgrounds, rounded half to even
+
+    Args:
+        rgba: array of shape (n, 4), channels 0-255
+        background_rgb: array of shape (n, 3) or (3,), channels 0-255
+    """
+    alpha = rgba[:, 3:4] / 255.0
+    blended = (1 - alpha) * background_rgb + alpha * rgba[:, :3]
+    return np.rint(blended).astype(np.uint8)
+
+
+def _resolve_backgrounds(backgrounds, count: int):
+    if isinstance(backgrounds, str):
+        backgrounds = [backgrounds]
+
+    background_rgba = parse_hex_colors(backgrounds).astype(np.float64)
+
+    # Backgrounds with alpha are made opaque over white first
+    white = np.full(3, 255.0)
+    background_rgb = blend_over(background_rgba, white).astype(np.float64)
+
+    if len(background_rgb) == 1:
+        return background_rgb[0]
+    if len(background_rgb) != count:
+        raise ValueError("Expected one background or one background per color")
+    return background_rgb
+
+
+def format_hex_colors(rgb) -> list[str]:
+    """Format an (n, 3) array of channels as #RRGGBB strings"""
+    return [f"#{r:02X}{g:02X}{b:02X}" for r, g, b in rgb.tolist()]
+
+
+class _ColorCache:
+    """Thread-safe LRU of resolved colors by (color, background)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def update(self, items):
+        with self._lock:
+            for key, value in items:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+_color_cache = _ColorCache(COLOR_CACHE_SIZE)
+
+
+def blend_colors(
+    colors: Sequence[str], backgrounds: Union[str, Sequence[str]] = DEFAULT_BACKGROUND
+):
+    """Return colors blended over their backgrounds as uint8 array of shape (n, 3)"""
+    rgba = parse_hex_colors(colors).astype(np.float64)
+    background_rgb = _resolve_backgrounds(backgrounds, len(colors))
+    return blend_over(rgba, background_rgb)
+
+
+def resolve_colors(
+    colors: Sequence[str], backgrounds: Union[str, Sequence[str]] = DEFAULT_BACKGROUND
+) -> list[str]:
+    """Resolve hex colors to opaque #RRGGBB in one vectorized pass
+
+    Colors with alpha are blended over their background, either one
+    background for all colors or one per color. Results fill the scalar cache.
+    """
+    if not colors:
+        return []
+
+    resolved = format_hex_colors(blend_colors(colors, backgrounds))
+
+    if isinstance(backgrounds, str):
+        backgrounds = [backgrounds] * len(colors)
+    _color_cache.update(zip(zip(colors, backgrounds), resolved))
+
+    return resolved
+
+
+def resolve_color(color: str, background: str = DEFAULT_BACKGROUND) -> str:
+    """Resolve a single hex color to opaque #RRGGBB, cached"""
+    resolved = _color_cache.get((color, background))
+    if resolved is None:
+        resolved = resolve_colors([color], background)[0]
+    return resolved
+
+
+def relative_luminance(rgb):
+    """WCAG 2 relative luminance of an (n, 3) array of sRGB channels 0-255"""
+    channels = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(
+        channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4
+    )
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_matrix(rgb):
+    """WCAG 2 contrast ratios of all color pairs, array of shape (n, n)
+
+    Ratios are symmetric and range from 1 (same luminance) to 21.
+    """
+    luminance = relative_luminance(rgb) + 0.05
+    return np.maximum.outer(luminance, luminance) / np.minimum.outer(
+        luminance, luminance
+    )
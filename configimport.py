@@ -0,0 +1,124 @@
+import re
+import tomllib
+from dataclasses import dataclass
+
+import colorengine
+import uiconfig
+from themeschema import CONFIG_PROPERTIES, SECTION_PREFIXES, ThemeProperty
+
+# Size strings as written by the export, e.g. "0.5rem" or "14px"
+SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(px|rem)\s*$")
+
+# Google Fonts as written by the font input, e.g. "'Inter':https://fonts...",
+# weights in the url are separated by ';', the value is only written into a
+# quoted config.toml string and never into CSS
+GOOGLE_FONT_PATTERN = re.compile(r"^'?[\w ,.-]+'?(?::[^\s{}<>\"'\\]*)?$")
+
+
+@dataclass(frozen=True)
+class ConfigImport:
+    """Theme values parsed from a config.toml
+
+    values maps theme state keys, e.g. 'theme-baseRadius', to values in the
+    editor format, e.g. (0.5, 'rem'). skipped lists config keys which were
+    not imported with the reason, e.g. 'theme.baseRadius: unsupported value'.
+    """
+
+    values: dict
+    skipped: tuple[str, ...]
+
+
+def parse_size(value) -> tuple:
+    """Convert a size, e.g. '0.5rem', '14px' or 14 (px), into (value, unit)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number, unit = float(value), "px"
+    else:
+        match = SIZE_PATTERN.match(str(value))
+        if match is None:
+            raise ValueError(f"unsupported size {value!r}")
+        number, unit = float(match.group(1)), match.group(2)
+
+    # Keep integers as written, e.g. 14px and not 14.0px on export
+    return (int(number) if number.is_integer() else number), unit
+
+
+def convert_value(value, theme_property: ThemeProperty):
+    """Convert a toml value to the value type of a theme property"""
+    value_type = theme_property.value_type
+
+    if value_type is bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"expected true or false, got {value!r}")
+        return value
+
+    if value_type is tuple:
+        size = parse_size(value)
+        if size[1] not in theme_property.allowed_units:
+            raise ValueError(
+                f"unit {size[1]} not supported, use {' or '.join(theme_property.allowed_units)}"
+            )
+        return size
+
+    if value_type is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"expected an integer, got {value!r}")
+        return value
+
+    if not isinstance(value, str):
+        raise ValueError(f"expected a string, got {value!r}")
+
+    # Theme strings are colors, e.g. primaryColor, or fonts, e.g. headingFont
+    if theme_property.config_key.endswith("Color"):
+        if not colorengine.is_hex_color(value):
+            raise ValueError(f"expected a hex color, got {value!r}")
+    elif value not in uiconfig.FONT_FAMILY_OPTIONS and not GOOGLE_FONT_PATTERN.match(
+        value
+    ):
+        raise ValueError(f"unsupported font {value!r}")
+
+    return value
+
+
+def _section_items(config: dict, section: str) -> dict:
+    table = config
+    for name in section.split("."):
+        table = table.get(name, {})
+        if not isinstance(table, dict):
+            return {}
+    return table
+
+
+def parse_config_toml(config_text: str) -> ConfigImport:
+    """Parse [theme] and [theme.sidebar] into values for the theme state
+
+    Only keys of the theme schema are imported, values are converted to the
+    value type of their property.
+
+    Raises:
+        ValueError: if the text is not valid toml
+    """
+    try:
+        config = tomllib.loads(config_text)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Invalid config.toml: {e}") from e
+
+    values = {}
+    skipped = []
+
+    for section in SECTION_PREFIXES:
+        for config_key, value in _section_items(config, section).items():
+            # Nested tables are handled as own sections or not supported
+            if isinstance(value, dict):
+                continue
+
+            theme_property = CONFIG_PROPERTIES.get((section, config_key))
+            if theme_property is None:
+                skipped.append(f"{section}.{config_key}: not supported by the editor")
+                continue
+
+            try:
+                values[theme_property.key] = convert_value(value, theme_property)
+            except ValueError as e:
+                skipped.append(f"{section}.{config_key}: {e}")
+
+    return ConfigImport(values=values, skipped=tuple(skipped))
@@ -0,0 +1,98 @@
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+# Commented template keys, e.g. "# primaryColor ="
+TEMPLATE_KEY_PATTERN = re.compile(r"^# ([a-zA-Z]+) =$")
+
+# Template section headers mapped to the prefix of theme state keys
+TEMPLATE_SECTIONS = {
+    "[theme]": "theme",
+    "[theme.sidebar]": "theme-sidebar",
+}
+
+
+@dataclass(frozen=True)
+class ConfigTemplate:
+    """Pre-split config.toml template with an index of its theme key slots
+
+    slots maps (section, key), e.g. ('theme-sidebar', 'primaryColor'), to the
+    line position of the commented key in lines.
+    """
+
+    lines: tuple[str, ...]
+    slots: Mapping[tuple[str, str], int]
+
+    def render(self, updated_themes: dict) -> tuple[str, str, str]:
+        """Splice updated theme values into the template
+
+        Args:
+            updated_themes: toml formatted values by theme state key,
+                e.g. {'theme-primaryColor': '"#ff0000"'}
+
+        Returns:
+            tuple: full config.toml, [theme] lines and [theme.sidebar] lines
+        """
+        config_lines = list(self.lines)
+        updates = []
+
+        for theme_key, value in updated_themes.items():
+            section, _, config_key = theme_key.rpartition("-")
+            line_ix = self.slots.get((section, config_key))
+
+            if line_ix is None:
+                continue
+
+            key_line = f"{config_key} = {value}"
+            config_lines[line_ix] = key_line
+            updates.append((line_ix, section, key_line))
+
+        # Keep section snippets in template order
+        updates.sort()
+
+        theme_updates = [line for _, sec, line in updates if sec == "theme"]
+        theme_sidebar_updates = [
+            line for _, sec, line in updates if sec == "theme-sidebar"
+        ]
+
+        return (
+            "\n".join(config_lines),
+            "\n".join(theme_updates),
+            "\n".join(theme_sidebar_updates),
+        )
+
+
+@lru_cache(maxsize=4)
+def _compile_config_template(template_path: str, mtime_ns: int) -> ConfigTemplate:
+    with open(template_path, "r") as f:
+        lines = tuple(line.rstrip("\n") for line in f)
+
+    section = None
+    slots = {}
+
+    for line_ix, line in enumerate(lines):
+        if line.startswith("["):
+            section = next(
+                (
+                    prefix
+                    for header, prefix in TEMPLATE_SECTIONS.items()
+                    if line.startswith(header)
+                ),
+                None,
+            )
+
+        if section:
+            match = TEMPLATE_KEY_PATTERN.match(line.strip())
+            if match:
+                slots[(section, match.group(1))] = line_ix
+
+    return ConfigTemplate(lines=lines, slots=MappingProxyType(slots))
+
+
+def load_config_template(template_path: str) -> ConfigTemplate:
+    """Return the compiled template, recompiled only if the file changed"""
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    return _compile_config_template(template_path, mtime_ns)
@@ -0,0 +1,246 @@
+import re
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping
+
+import uiconfig
+from elementregistry import get_element_registry
+from elementstate import is_valid_element_value
+
+# Rules without nested blocks, e.g. '.stButton > button { color: red; }'
+CSS_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class CssImport:
+    """Element styles parsed from a st-styled.css
+
+    styles maps element name to variant to style properties, e.g.
+    {'button': {'primary': {'background_color': '#ff0000'}}}.
+    unmatched counts declarations which belong to no element style. skipped
+    lists values the element inputs do not support, e.g. a size in vw, and
+    elements whose selectors match only declarations already explained by
+    another imported element, e.g. select_slider next to slider.
+    """
+
+    styles: dict
+    unmatched: int
+    skipped: tuple[str, ...] = ()
+
+
+def normalize_selector(selector: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", selector).strip()
+
+
+def split_selectors(selector_group: str) -> list[str]:
+    """Split a selector group on commas outside of parentheses and brackets"""
+    selectors = []
+    depth = 0
+    start = 0
+
+    for ix, char in enumerate(selector_group):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(selector_group[start:ix])
+            start = ix + 1
+
+    selectors.append(selector_group[start:])
+    return [normalize_selector(s) for s in selectors if s.strip()]
+
+
+def parse_css(css_text: str) -> dict[tuple[str, str], str]:
+    """Parse a stylesheet into values by (selector, css property)
+
+    Later declarations win as in the browser.
+    """
+    css_text = CSS_COMMENT_PATTERN.sub("", css_text)
+    declarations = {}
+
+    for selector_group, block in CSS_RULE_PATTERN.findall(css_text):
+        selectors = split_selectors(selector_group)
+
+        for declaration in block.split(";"):
+            css_prop, _, value = declaration.partition(":")
+            css_prop = css_prop.strip().lower()
+            value = value.replace("!important", "").strip()
+            if not css_prop or not value:
+                continue
+
+            for selector in selectors:
+                declarations[(selector, css_prop)] = value
+
+    return declarations
+
+
+@cache
+def get_selector_index() -> Mapping[tuple[str, str], tuple[tuple[str, str], ...]]:
+    """Reverse selector index of the registry with whitespace-normalized selectors"""
+    index = {}
+    for (selector, css_prop), entries in get_element_registry().selectors.items():
+        key = (normalize_selector(selector), css_prop)
+        index[key] = index.get(key, ()) + entries
+
+    return MappingProxyType(index)
+
+
+def _targets_match(style_name: str, prop: str, value: str, declarations: dict) -> bool:
+    # An exported property writes all its targets with the same value, targets
+    # shared with other properties of the style may have been overwritten
+    targets = get_element_registry().styles[style_name].targets[prop]
+    selector_index = get_selector_index()
+
+    for selector, css_prop in targets:
+        target = (normalize_selector(selector), css_prop)
+        declared = declarations.get(target)
+        if declared == value:
+            continue
+
+        overwritten = declared is not None and any(
+            other_style == style_name and other_prop != prop
+            for other_style, other_prop in selector_index.get(target, ())
+        )
+        if not overwritten:
+            return False
+
+    return True
+
+
+def _drop_duplicates(candidates: list) -> list:
+    # Properties of a style with the same targets, e.g. font_size and
+    # label_font_size, export the same css, keep the first one
+    registry = get_element_registry()
+    seen = set()
+    unique = []
+    for style_name, prop in candidates:
+        key = (style_name, frozenset(registry.styles[style_name].targets[prop]))
+        if key not in seen:
+            seen.add(key)
+            unique.append((style_name, prop))
+    return unique
+
+
+def _select_elements(
+    resolved: dict, declarations: dict, preferred: tuple
+) -> tuple[set, tuple]:
+    # Elements sharing selectors, e.g. slider and select_slider, all resolve
+    # the shared declarations. An element is kept only if no other element
+    # explains a superset of its declarations, of elements explaining the
+    # same declarations the first preferred or else in registry order is kept.
+    registry = get_element_registry()
+    covered = {}
+    for style_name, prop in resolved:
+        element_style = registry.styles[style_name]
+        covered.setdefault(element_style.element, set()).update(
+            target
+            for target in (
+                (normalize_selector(selector), css_prop)
+                for selector, css_prop in element_style.targets[prop]
+            )
+            if target in declarations
+        )
+
+    elements = set()
+    skipped = []
+    ordered = [e for e in preferred if e in covered] + [
+        e for e in registry.variants if e in covered and e not in preferred
+    ]
+    for element in ordered:
+        explained_by = [
+            other
+            for other in covered
+            if other != element
+            and (
+                covered[other] > covered[element]
+                or (covered[other] == covered[element] and other in elements)
+            )
+        ]
+        if explained_by:
+            skipped.append(f"{element}: selectors shared with {explained_by[0]}")
+        else:
+            elements.add(element)
+
+    return elements, tuple(skipped)
+
+
+def import_css(css_text: str, preferred: tuple[str, ...] = ()) -> CssImport:
+    """Resolve the declarations of a stylesheet to element style properties
+
+    Each declaration is looked up in the reverse selector index. Candidates
+    are kept only if all selectors of their property carry the same value,
+    apart from selectors overwritten by other properties of the element style.
+    If a declaration still matches several properties, properties and styles
+    which matched unambiguously elsewhere are preferred. Elements whose
+    declarations are all explained by another element are skipped, elements
+    in preferred, e.g. those with a card, win over others with the same
+    selectors.
+    """
+    declarations = parse_css(css_text)
+    selector_index = get_selector_index()
+
+    resolved = {}  # (style name, prop) -> value
+    ambiguous = []
+    unmatched = 0
+
+    for target, value in declarations.items():
+        candidates = _drop_duplicates(
+            [
+                (style_name, prop)
+                for style_name, prop in selector_index.get(target, ())
+                if _targets_match(style_name, prop, value, declarations)
+            ]
+        )
+
+        if not candidates:
+            unmatched += 1
+        elif len(candidates) == 1:
+            resolved[candidates[0]] = value
+        else:
+            ambiguous.append((candidates, value))
+
+    matched_styles = {style_name for style_name, _ in resolved}
+
+    for candidates, value in ambiguous:
+        # Prefer properties, then element styles, matched by other declarations
+        best = (
+            [c for c in candidates if c in resolved]
+            or [c for c in candidates if c[0] in matched_styles]
+            or candidates
+        )
+        for candidate in best:
+            resolved.setdefault(candidate, value)
+
+    # Values the element inputs can not show are reported instead of imported
+    rejected = {}
+    for (style_name, prop), value in list(resolved.items()):
+        input_widget = uiconfig.css_properties_input_widget.get(prop)
+        if value == "0" and input_widget == "size_input":
+            value = resolved[(style_name, prop)] = "0px"
+
+        if not is_valid_element_value(prop, value):
+            del resolved[(style_name, prop)]
+            rejected[f"{style_name}.{prop}: unsupported value {value!r}"] = None
+
+    registry = get_element_registry()
+    elements, skipped = _select_elements(resolved, declarations, preferred)
+
+    # Properties in registry order, so that properties sharing targets
+    # overwrite each other on export as in the imported stylesheet
+    styles = {}
+    for style_name, element_style in registry.styles.items():
+        if element_style.element not in elements:
+            continue
+        for prop in element_style.properties:
+            if (style_name, prop) in resolved:
+                styles.setdefault(element_style.element, {}).setdefault(
+                    element_style.variant, {}
+                )[prop] = resolved[(style_name, prop)]
+
+    return CssImport(
+        styles=styles, unmatched=unmatched, skipped=tuple(rejected) + skipped
+    )
@@ -0,0 +1,242 @@
+import uuid
+from typing import Optional
+
+import streamlit as st
+
+import editlog
+import uiconfig
+from editlog import CARDS_KEY
+from elementregistry import get_element_registry
+from elementstate import ElementCard, get_element_cards
+from persistentmap import REMOVED, PersistentMap
+from themestate import get_theme_state
+
+EDIT_HISTORY_KEY = "edit-history"
+
+
+class EditHistory:
+    """Undo and redo over snapshots of the theme and element state
+
+    Snapshots are persistent maps of flat keys, see editlog, e.g.
+    ('theme', key) or ('style', element name, variant, prop). A recorded
+    step stores the keys it changed and a new snapshot sharing all unchanged
+    nodes with the previous one. Undo and redo move the position in the
+    snapshot list and return the values of the keys changed by the step.
+    """
+
+    __slots__ = ("snapshots", "step_keys", "position", "max_steps")
+
+    def __init__(self, initial: PersistentMap, max_steps: int):
+        self.snapshots = [initial]
+        self.step_keys: list[tuple] = [()]
+        self.position = 0
+        self.max_steps = max_steps
+
+    @property
+    def current(self) -> PersistentMap:
+        return self.snapshots[self.position]
+
+    def can_undo(self) -> bool:
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        return self.position < len(self.snapshots) - 1
+
+    def record(self, values: dict) -> bool:
+        """Add a step for values differing from the current snapshot
+
+        values holds the edited keys only, REMOVED for keys without value.
+        Steps after the current position are dropped, a new edit ends the
+        redo history. Returns whether a step was added.
+        """
+        current = self.current
+        changes = {
+            key: value
+            for key, value in values.items()
+            if current.get(key, REMOVED) != value
+        }
+        if not changes:
+            return False
+
+        del self.snapshots[self.position + 1 :]
+        del self.step_keys[self.position + 1 :]
+        self.snapshots.append(current.update(changes))
+        self.step_keys.append(tuple(changes))
+
+        if len(self.snapshots) > self.max_steps + 1:
+            del self.snapshots[0]
+            del self.step_keys[0]
+
+        self.position = len(self.snapshots) - 1
+        return True
+
+    def _step_values(self, keys: tuple) -> dict:
+        return {key: self.current.get(key, REMOVED) for key in keys}
+
+    def undo(self) -> Optional[dict]:
+        """Step back, returns the values of the keys changed by the step"""
+        if not self.can_undo():
+            return None
+        keys = self.step_keys[self.position]
+        self.position -= 1
+        return self._step_values(keys)
+
+    def redo(self) -> Optional[dict]:
+        """Step forward, returns the values of the keys changed by the step"""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self._step_values(self.step_keys[self.position])
+
+
+def get_edit_history() -> EditHistory:
+    """Return the edit history of the current session, create if missing"""
+    if EDIT_HISTORY_KEY not in st.session_state:
+        # The state of the first run is the oldest step, edits before are in it
+        editlog.pop_edits()
+        st.session_state[EDIT_HISTORY_KEY] = EditHistory(
+            PersistentMap().update(snapshot_values()), uiconfig.EDIT_HISTORY_MAX_STEPS
+        )
+
+    return st.session_state[EDIT_HISTORY_KEY]
+
+
+def snapshot_values() -> dict:
+    """Flatten theme overrides and element cards of the session"""
+    values = {
+        editlog.theme_key(key): value
+        for key, value in get_theme_state().changed().items()
+    }
+
+    element_cards = get_element_cards()
+    values[CARDS_KEY] = tuple(card.name for card in element_cards.values())
+
+    for element_card in element_cards.values():
+        for variant, styles in element_card.styles.items():
+            for prop, value in styles.items():
+                values[editlog.style_key(element_card.name, variant, prop)] = value
+
+    return values
+
+
+def _cards_by_name() -> dict[str, ElementCard]:
+    return {card.name: card for card in get_element_cards().values()}
+
+
+def edited_values() -> dict:
+    """Return the current values of the keys in the edit log"""
+    theme_state = get_theme_state()
+    element_cards = None
+    values = {}
+
+    for key in editlog.pop_edits():
+        if key[0] == "theme":
+            theme_key = key[1]
+            values[key] = (
+                theme_state[theme_key] if theme_state.is_dirty(theme_key) else REMOVED
+            )
+        elif key == CARDS_KEY:
+            values[key] = tuple(card.name for card in get_element_cards().values())
+        else:
+            _, name, variant, prop = key
+            if element_cards is None:
+                element_cards = _cards_by_name()
+            element_card = element_cards.get(name)
+            values[key] = (
+                element_card.styles[variant].get(prop, REMOVED)
+                if element_card is not None
+                else REMOVED
+            )
+
+    return values
+
+
+def _restore_cards(names: tuple):
+    # Cards keep their hash, cards removed since the step are created again
+    registry = get_element_registry()
+    element_cards = get_element_cards()
+    card_hashes = {card.name: card_hash for card_hash, card in element_cards.items()}
+    previous_cards = dict(element_cards)
+    element_cards.clear()
+
+    for name in names:
+        card_hash = card_hashes.get(name)
+        if card_hash is None:
+            element_cards[str(uuid.uuid4())] = ElementCard(
+                name, registry.variants[name]
+            )
+        else:
+            element_cards[card_hash] = previous_cards[card_hash]
+
+    st.session_state["element-select-names"] = list(names)
+    st.session_state["element-first-open"] = False
+
+
+def restore_values(values: dict):
+    """Write the values of an undo or redo step into the session
+
+    Only the given keys are written. Theme inputs of written keys get new
+    seeds, cards get a new seed if one of their styles was written.
+    """
+    theme_state = get_theme_state()
+
+    if CARDS_KEY in values:
+        _restore_cards(values[CARDS_KEY])
+
+    element_cards = None
+    reseeded = set()
+
+    for key, value in values.items():
+        if key[0] == "theme":
+            if value is REMOVED:
+                theme_state.reset([key[1]])
+            else:
+                theme_state[key[1]] = value
+            st.session_state.pop(key[1] + "-seed", None)
+        elif key[0] == "style":
+            _, name, variant, prop = key
+            if element_cards is None:
+                element_cards = _cards_by_name()
+            element_card = element_cards.get(name)
+            if element_card is None:
+                continue
+
+            if value is not REMOVED:
+                element_card.set_value(variant, prop, value)
+            elif prop in element_card.styles[variant]:
+                element_card.remove_value(variant, prop)
+            reseeded.add(element_card)
+
+    for element_card in reseeded:
+        element_card.renew_seed()
+
+    # Written values match the step, there is nothing to record
+    editlog.pop_edits()
+
+
+def record_edits():
+    """Record the edits since the last step as a new step
+
+    Called once per full run. Only keys noted in the edit log by the theme
+    state and element card setters are compared, a run costs O(edited keys).
+    """
+    get_edit_history().record(edited_values())
+
+
+def undo_edit():
+    # Edits since the last run, e.g. in card fragments, are recorded first
+    edit_history = get_edit_history()
+    edit_history.record(edited_values())
+
+    values = edit_history.undo()
+    if values is not None:
+        restore_values(values)
+
+
+def redo_edit():
+    edit_history = get_edit_history()
+    edit_history.record(edited_values())
+
+    values = edit_history.redo()
+    if values is not None:
+        restore_values(values)
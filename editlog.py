@@ -0,0 +1,32 @@
+import streamlit as st
+
+EDIT_LOG_KEY = "edit-log"
+
+# Key of the card order, element names of the cards
+CARDS_KEY = ("cards",)
+
+
+def theme_key(key: str) -> tuple:
+    return ("theme", key)
+
+
+def style_key(element_name: str, variant: str, prop: str) -> tuple:
+    return ("style", element_name, variant, prop)
+
+
+def log_edit(key: tuple):
+    """Note a key of the theme or element state written since the last step
+
+    Called by the setters of the theme state and the element cards, the edit
+    history then compares only the noted keys against its current step.
+    """
+    if EDIT_LOG_KEY not in st.session_state:
+        st.session_state[EDIT_LOG_KEY] = {}
+
+    # Dict as ordered set, keys are noted once per step
+    st.session_state[EDIT_LOG_KEY][key] = None
+
+
+def pop_edits() -> list[tuple]:
+    """Return and clear the keys noted since the last call"""
+    return list(st.session_state.pop(EDIT_LOG_KEY, None) or ())
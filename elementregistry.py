@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import st_yled
+
+
+DEFAULT_VARIANT = "default"
+
+
+@dataclass(frozen=True)
+class ElementStyle:
+    """Styling definition of a single element variant
+
+    targets maps each style property, e.g. 'background_color', to the
+    (selector, css-property) pairs it is applied to.
+    """
+
+    style_name: str
+    element: str
+    variant: str
+    category: str
+    properties: tuple[str, ...]
+    targets: Mapping[str, tuple[tuple[str, str], ...]]
+    example: Optional[str]
+
+
+@dataclass(frozen=True)
+class ElementRegistry:
+    """Process-wide index over the st_yled element styles
+
+    styles: style name, e.g. 'button_primary', to element style
+    variants: element name to variants editable in the element cards
+    selectors: (selector, css-property) to (style name, property) pairs
+    """
+
+    styles: Mapping[str, ElementStyle]
+    variants: Mapping[str, tuple[str, ...]]
+    selectors: Mapping[tuple[str, str], tuple[tuple[str, str], ...]]
+
+    def get(self, element_name: str, variant: str = DEFAULT_VARIANT) -> ElementStyle:
+        return self.styles[get_style_name(element_name, variant)]
+
+
+def get_style_name(element_name: str, variant: str = DEFAULT_VARIANT) -> str:
+    """Return the st_yled style name of an element variant"""
+    if variant == DEFAULT_VARIANT:
+        return element_name
+    return f"{element_name}_{variant}"
+
+
+def _build_element_style(style_name: str, element_name: str, variant: str):
+    element_config = st_yled.styler.get_element_style(style_name)
+
+    targets = {}
+    for prop, css_format in element_config["css"].items():
+        targets[prop] = tuple(
+            (css_selector, css_prop)
+            for css_selector, css_props in css_format.items()
+            for css_prop in css_props
+        )
+
+    return ElementStyle(
+        style_name=style_name,
+        element=element_name,
+        variant=variant,
+        category=element_config.get("category", "unknown"),
+        properties=tuple(targets.keys()),
+        targets=MappingProxyType(targets),
+        example=element_config.get("example"),
+    )
+
+
+@cache
+def get_element_registry() -> ElementRegistry:
+    """Build the element registry once per process from the st_yled styler"""
+    styles = {}
+    variants = {}
+    selectors = {}
+
+    for element_name in st_yled.styler.get_stylable_elements(include_variants=False):
+        element_variants = st_yled.styler.get_element_variants(element_name)
+        variants[element_name] = tuple(element_variants) or (DEFAULT_VARIANT,)
+
+        for variant in variants[element_name]:
+            style_name = get_style_name(element_name, variant)
+            element_style = _build_element_style(style_name, element_name, variant)
+            styles[style_name] = element_style
+
+            # Reverse lookup only for variants editable in element cards
+            for prop, prop_targets in element_style.targets.items():
+                for target in prop_targets:
+                    selectors.setdefault(target, []).append((style_name, prop))
+
+    # Base styles of elements with variants are not editable, keep for lookups
+    for style_name in st_yled.styler.get_stylable_elements(include_variants=True):
+        if style_name not in styles and style_name in variants:
+            styles[style_name] = _build_element_style(
+                style_name, style_name, DEFAULT_VARIANT
+            )
+
+    return ElementRegistry(
+        styles=MappingProxyType(styles),
+        variants=MappingProxyType(variants),
+        selectors=MappingProxyType(
+            {target: tuple(entries) for target, entries in selectors.items()}
+        ),
+    )
@@ -0,0 +1,192 @@
+import re
+import uuid
+from collections.abc import MutableMapping
+from typing import Iterable, Iterator, Optional
+
+import streamlit as st
+
+import colorengine
+import editlog
+import uiconfig
+from elementregistry import get_element_registry
+
+ELEMENT_SELECT_KEY = "element-select"
+
+# Element sizes as written by the size inputs, e.g. "12px" or "1.5rem"
+ELEMENT_SIZE_PATTERN = re.compile(
+    rf"^\d+(?:\.\d+)?(?:{'|'.join(uiconfig.ELEMENT_SIZE_UNITS)})$"
+)
+
+# Element values are written into the component CSS, values holding any of
+# these characters could close the declaration or the style block
+CSS_UNSAFE_CHARS = frozenset("{};<>")
+
+
+class VariantValues(MutableMapping):
+    """Style properties of a card variant as written by the input callbacks"""
+
+    __slots__ = ("_card", "_variant")
+
+    def __init__(self, card: "ElementCard", variant: str):
+        self._card = card
+        self._variant = variant
+
+    def __getitem__(self, prop: str):
+        return self._card.styles[self._variant][prop]
+
+    def __setitem__(self, prop: str, value):
+        self._card.set_value(self._variant, prop, value)
+
+    def __delitem__(self, prop: str):
+        self._card.remove_value(self._variant, prop)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._card.styles[self._variant])
+
+    def __len__(self) -> int:
+        return len(self._card.styles[self._variant])
+
+
+class ElementCard:
+    """Styles of an element card in the element editor
+
+    styles maps each variant of the element, e.g. 'primary' or 'default', to
+    the style properties set by the user, e.g. {'background_color': '#ff0000'}.
+    styles is read only, writes go through the card and are noted in the
+    edit log. All input widgets of a card share one seed, a new seed renders
+    fresh widgets.
+    """
+
+    __slots__ = ("name", "variants", "styles", "seed", "split_key")
+
+    def __init__(self, name: str, variants: tuple[str, ...]):
+        self.name = name
+        self.variants = variants
+        self.styles = {variant: {} for variant in variants}
+        self.seed = str(uuid.uuid4())
+        self.split_key = str(uuid.uuid4())
+
+    def values(self, variant: str) -> VariantValues:
+        """Return the style properties set for a variant"""
+        return VariantValues(self, variant)
+
+    def set_value(self, variant: str, prop: str, value):
+        editlog.log_edit(editlog.style_key(self.name, variant, prop))
+        self.styles[variant][prop] = value
+
+    def remove_value(self, variant: str, prop: str):
+        editlog.log_edit(editlog.style_key(self.name, variant, prop))
+        del self.styles[variant][prop]
+
+    def reset(self):
+        """Remove all style properties and render new input widgets"""
+        for variant, values in self.styles.items():
+            for prop in values:
+                editlog.log_edit(editlog.style_key(self.name, variant, prop))
+            values.clear()
+
+        self.renew_seed()
+
+    def update(self, styles: dict):
+        """Set style properties of several variants and render new input widgets
+
+        Args:
+            styles: style properties by variant, e.g. {'primary': {'color': 'red'}}
+        """
+        for variant, values in styles.items():
+            for prop, value in values.items():
+                self.set_value(variant, prop, value)
+
+        self.renew_seed()
+
+    def renew_seed(self):
+        """Render new input widgets with the current style properties"""
+        self.seed = str(uuid.uuid4())
+
+    def renew_split_key(self):
+        """Render a new split button to reset its selected action"""
+        self.split_key = str(uuid.uuid4())
+
+
+def is_valid_element_value(prop: str, value) -> bool:
+    """Check an element style value against the input of its property"""
+    if not isinstance(value, str) or CSS_UNSAFE_CHARS.intersection(value):
+        return False
+
+    widget_type = uiconfig.css_properties_input_widget.get(prop)
+    if widget_type == "color_picker":
+        return colorengine.is_hex_color(value)
+    if widget_type == "size_input":
+        return ELEMENT_SIZE_PATTERN.match(value) is not None
+    if prop == "border_style":
+        return value in uiconfig.BORDER_STYLE_OPTIONS
+    if prop.endswith("font_weight"):
+        return value in uiconfig.FONT_WEIGHT_OPTIONS
+    return False
+
+
+def get_element_cards() -> dict[str, ElementCard]:
+    """Return the element cards of the current session by card hash"""
+    if ELEMENT_SELECT_KEY not in st.session_state:
+        st.session_state[ELEMENT_SELECT_KEY] = dict()
+
+    return st.session_state[ELEMENT_SELECT_KEY]
+
+
+def add_element_card(element_name: str) -> str:
+    """Add an empty card for an element, returns the card hash"""
+    element_hash = str(uuid.uuid4())
+    get_element_cards()[element_hash] = ElementCard(
+        element_name, get_element_registry().variants[element_name]
+    )
+    editlog.log_edit(editlog.CARDS_KEY)
+    return element_hash
+
+
+def remove_element_card(element_hash: str) -> ElementCard:
+    """Remove a card with its styles, returns the removed card"""
+    element_card = get_element_cards().pop(element_hash)
+    # Styles of the card are gone as well, undo restores them with the card
+    element_card.reset()
+    editlog.log_edit(editlog.CARDS_KEY)
+    return element_card
+
+
+def replace_element_cards(cards: Iterable[tuple[Optional[str], str, dict]]):
+    """Replace the element cards of the session in one step
+
+    cards lists (card hash, element name, styles by variant) in card order.
+    A card of a known hash is kept with its styles replaced, other cards are
+    created, a hash of None gets a new one. Only the first card of an
+    element is kept.
+    """
+    registry = get_element_registry()
+    element_cards = get_element_cards()
+    previous_cards = dict(element_cards)
+    element_cards.clear()
+
+    element_names = []
+    for card_hash, name, styles in cards:
+        if name in element_names:
+            continue
+
+        element_card = previous_cards.get(card_hash)
+        if element_card is None:
+            element_card = ElementCard(name, registry.variants[name])
+        else:
+            element_card.reset()
+
+        element_card.update(styles)
+        element_cards[card_hash or str(uuid.uuid4())] = element_card
+        element_names.append(name)
+
+    # Styles of dropped cards are gone with them
+    kept_cards = set(element_cards.values())
+    for element_card in previous_cards.values():
+        if element_card not in kept_cards:
+            element_card.reset()
+    editlog.log_edit(editlog.CARDS_KEY)
+
+    # Replaced cards also replace the default button card of a first visit
+    st.session_state["element-select-names"] = element_names
+    st.session_state["element-first-open"] = False
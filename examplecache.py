@@ -0,0 +1,58 @@
+import hashlib
+import logging
+from functools import cache
+from types import CodeType, MappingProxyType
+from typing import Mapping, Optional
+
+import streamlit as st
+import st_yled
+
+from elementregistry import ElementStyle, get_element_registry
+
+logger = logging.getLogger(__name__)
+
+
+def get_example_key(style_name: str, example: str) -> tuple[str, str]:
+    """Return the cache key of an example: style name and source hash"""
+    source_hash = hashlib.sha256(example.encode()).hexdigest()
+    return style_name, source_hash
+
+
+@cache
+def get_example_cache() -> Mapping[tuple[str, str], CodeType]:
+    """Compile all element examples once per process
+
+    Examples which fail to compile are logged here and skipped on render.
+    """
+    example_codes = {}
+
+    for element_style in get_element_registry().styles.values():
+        example = element_style.example
+        if not example:
+            continue
+
+        key = get_example_key(element_style.style_name, example)
+        try:
+            example_codes[key] = compile(
+                example, f"<example {element_style.style_name}>", "eval"
+            )
+        except SyntaxError as e:
+            logger.error(
+                "Failed to compile example for %s: %s", element_style.style_name, e
+            )
+
+    return MappingProxyType(example_codes)
+
+
+def get_example_code(element_style: ElementStyle) -> Optional[CodeType]:
+    """Return the compiled example of an element, None if not available"""
+    example = element_style.example
+    if not example:
+        return None
+    key = get_example_key(element_style.style_name, example)
+    return get_example_cache().get(key)
+
+
+def example_namespace(kwargs: dict) -> dict:
+    """Return the namespace compiled examples are evaluated in"""
+    return {"st": st, "st_yled": st_yled, "kwargs": kwargs}
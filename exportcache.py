@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import cache
+from typing import Callable, Iterable
+
+import instrumentation
+
+# Bounds of the process-wide export cache
+EXPORT_CACHE_MAX_ENTRIES = 256
+EXPORT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+def canonical_hash(*parts) -> str:
+    """Return a stable hash of json serializable parts, independent of dict order"""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def theme_export_key(changed_theme: dict, template_path: str) -> str:
+    """Key theme exports by changed theme values and the template version"""
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    return canonical_hash("theme", template_path, mtime_ns, changed_theme)
+
+
+def elements_export_key(element_cards: Iterable, st_yled_version: str) -> str:
+    """Key element exports by the styles of all cards in card order
+
+    Card order is part of the key as it decides the order of css rules.
+    """
+    cards = [
+        (
+            card.name,
+            {variant: values for variant, values in card.styles.items() if values},
+        )
+        for card in element_cards
+    ]
+    return canonical_hash("elements", st_yled_version, cards)
+
+
+def _artifact_size(value) -> int:
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_artifact_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ExportCache:
+    """Bounded LRU of export artifacts shared by all sessions of the process
+
+    Entries are evicted least recently used first, once either the entry
+    count or the approximate size of the cached artifacts is exceeded.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (artifact, size)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: str, build: Callable):
+        """Return the cached artifact of key, build and store it on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock, concurrent misses of a key build twice
+        artifact = build()
+        size = _artifact_size(artifact)
+
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (artifact, size)
+                self._bytes += size
+                self._evict()
+
+        return artifact
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+@cache
+def get_export_cache() -> ExportCache:
+    """Return the process-wide export cache, reported as 'export_cache' metrics"""
+    export_cache = ExportCache(EXPORT_CACHE_MAX_ENTRIES, EXPORT_CACHE_MAX_BYTES)
+    instrumentation.register_collector("export_cache", export_cache.stats)
+    return export_cache
@@ -0,0 +1,304 @@
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Optional, Protocol
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class FeedbackTransport(Protocol):
+    """Delivers a feedback message, raises on failure"""
+
+    def send(self, subject: str, body: str) -> None: ...
+
+
+class SesTransport:
+    """Send feedback as email via AWS SES
+
+    boto3 is imported and the client is built on first use, once per process.
+    A failed client creation is cached and not retried on every send.
+    """
+
+    def __init__(
+        self,
+        feedback_email: str,
+        region_name: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+    ):
+        self.feedback_email = feedback_email
+        self.region_name = region_name
+        self.aws_access_key_id = aws_access_key_id
+        self.aws_secret_access_key = aws_secret_access_key
+
+        self._lock = threading.Lock()
+        self._client = None
+        self._client_error: Optional[Exception] = None
+
+    def get_client(self):
+        with self._lock:
+            if self._client is None and self._client_error is None:
+                try:
+                    import boto3
+
+                    self._client = boto3.client(
+                        "ses",
+                        region_name=self.region_name,
+                        aws_access_key_id=self.aws_access_key_id,
+                        aws_secret_access_key=self.aws_secret_access_key,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to create SES client: {e}")
+                    self._client_error = e
+
+            if self._client_error is not None:
+                raise self._client_error
+
+            return self._client
+
+    def warm(self):
+        """Create the client ahead of the first send, errors stay cached"""
+        try:
+            self.get_client()
+        except Exception as e:
+            logger.warning("SES client not available, sends will fail: %s", e)
+
+    def send(self, subject: str, body: str) -> None:
+        self.get_client().send_email(
+            Source=self.feedback_email,
+            Destination={"ToAddresses": [self.feedback_email]},
+            Message={
+                "Subject": {"Data": subject},
+                "Body": {"Text": {"Data": body}},
+            },
+        )
+
+
+class LogTransport:
+    """Local stub transport, logs feedback instead of sending it"""
+
+    def send(self, subject: str, body: str) -> None:
+        logger.info("Feedback delivered to log (%s): %s", subject, body)
+
+
+class FeedbackOutbox:
+    """sqlite-backed outbox holding feedback messages until they are delivered
+
+    Messages which exhausted their attempts are kept with status 'failed'.
+    """
+
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_due "
+                "ON outbox (status, next_attempt_at)"
+            )
+
+    def add(self, subject: str, body: str) -> int:
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (subject, body, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (subject, body, now, now),
+            )
+        return cursor.lastrowid
+
+    def due(self, now: float, limit: int = 50) -> list[tuple[int, str, str, int]]:
+        """Return pending messages due for delivery as (id, subject, body, attempts)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, subject, body, attempts FROM outbox "
+                "WHERE status = 'pending' AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (now, limit),
+            ).fetchall()
+
+    def next_due_at(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        return row[0]
+
+    def mark_sent(self, message_id: int):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (message_id,))
+
+    def mark_retry(self, message_id: int, error: str, next_attempt_at: float):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?, "
+                "next_attempt_at = ? WHERE id = ?",
+                (error, next_attempt_at, message_id),
+            )
+
+    def mark_failed(self, message_id: int, error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?, "
+                "status = 'failed' WHERE id = ?",
+                (error, message_id),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class FeedbackWorker:
+    """Background thread delivering feedback from the outbox
+
+    Submitted messages are persisted first and the worker is woken through a
+    bounded queue. If the queue is full, the message is picked up on the next
+    poll of the outbox. Failed deliveries are retried with exponential backoff.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        outbox: FeedbackOutbox,
+        transport: FeedbackTransport,
+        queue_size: int = 100,
+        max_attempts: int = 6,
+        base_delay: float = 2.0,
+        max_delay: float = 300.0,
+        poll_interval: float = 30.0,
+        warm_delay: float = 10.0,
+    ):
+        self.outbox = outbox
+        self.transport = transport
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.warm_delay = warm_delay
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name="feedback-worker", daemon=True
+        )
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, subject: str, body: str) -> int:
+        """Persist a message and wake the worker, returns without waiting"""
+        message_id = self.outbox.add(subject, body)
+
+        try:
+            self._queue.put_nowait(message_id)
+        except queue.Full:
+            logger.warning("Feedback queue full, message %s waits for poll", message_id)
+
+        return message_id
+
+    def stop(self, timeout: float = 10.0):
+        """Deliver due messages and stop the worker"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+
+        if self._thread.is_alive():
+            try:
+                self._queue.put(self._STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("Feedback queue full, stopping without drain")
+            self._thread.join(timeout)
+
+        self.outbox.close()
+
+    def backoff_delay(self, attempts: int) -> float:
+        return min(self.base_delay * 2**attempts, self.max_delay)
+
+    def deliver_due(self):
+        for message_id, subject, body, attempts in self.outbox.due(time.time()):
+            try:
+                self.transport.send(subject, body)
+            except Exception as e:
+                if attempts + 1 >= self.max_attempts:
+                    logger.error("Feedback %s failed permanently: %s", message_id, e)
+                    self.outbox.mark_failed(message_id, str(e))
+                else:
+                    delay = self.backoff_delay(attempts)
+                    logger.warning(
+                        "Feedback %s failed, retry in %.0fs: %s", message_id, delay, e
+                    )
+                    self.outbox.mark_retry(message_id, str(e), time.time() + delay)
+            else:
+                self.outbox.mark_sent(message_id)
+
+    def _wait_timeout(self) -> float:
+        next_due_at = self.outbox.next_due_at()
+        if next_due_at is None:
+            return self.poll_interval
+        return min(max(next_due_at - time.time(), 0.0), self.poll_interval)
+
+    def _run(self):
+        # Build transport clients off the script thread, after the first page load
+        warm = getattr(self.transport, "warm", None)
+        warm_at = time.time() + self.warm_delay
+
+        while True:
+            timeout = self._wait_timeout()
+            if warm is not None:
+                timeout = min(timeout, max(warm_at - time.time(), 0.0))
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if warm is not None and time.time() >= warm_at:
+                warm()
+                warm = None
+
+            try:
+                self.deliver_due()
+            except Exception as e:
+                logger.error("Feedback delivery loop failed: %s", e)
+
+            if item is self._STOP:
+                return
+
+
+_worker_lock = threading.Lock()
+_worker: Optional[FeedbackWorker] = None
+
+
+def get_feedback_worker(
+    db_path: str, transport: FeedbackTransport
+) -> FeedbackWorker:
+    """Return the process-wide feedback worker, started on first call"""
+    global _worker
+
+    with _worker_lock:
+        if _worker is None:
+            _worker = FeedbackWorker(FeedbackOutbox(db_path), transport)
+            _worker.start()
+            atexit.register(_worker.stop)
+
+    return _worker
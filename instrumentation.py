@@ -0,0 +1,199 @@
+import functools
+import math
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+# Upper bounds in seconds of the histogram buckets, +Inf is added on export
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Recent durations kept per span for percentiles on the debug page
+WINDOW_SIZE = 1000
+
+_enabled = False
+_lock = threading.Lock()
+_histograms: dict[str, "SpanHistogram"] = {}
+_collectors: dict[str, Callable[[], dict]] = {}
+
+
+class SpanHistogram:
+    """Durations of a span, cumulative buckets and a rolling window
+
+    Bucket counts, count and sum grow monotonically for Prometheus, the
+    window holds the last WINDOW_SIZE durations for percentiles.
+    """
+
+    __slots__ = ("bucket_counts", "count", "total", "window")
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.window = deque(maxlen=WINDOW_SIZE)
+
+    def observe(self, duration: float):
+        for ix, upper_bound in enumerate(BUCKETS):
+            if duration <= upper_bound:
+                self.bucket_counts[ix] += 1
+        self.count += 1
+        self.total += duration
+        self.window.append(duration)
+
+    def summary(self) -> dict:
+        """Return count and window percentiles in milliseconds"""
+        window = sorted(self.window)
+        if not window:
+            return {"count": self.count}
+
+        def percentile(q: float) -> float:
+            # Nearest-rank percentile
+            return window[max(math.ceil(q * len(window)) - 1, 0)] * 1000
+
+        return {
+            "count": self.count,
+            "mean_ms": statistics.fmean(window) * 1000,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": window[-1] * 1000,
+        }
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def observe(name: str, duration: float):
+    """Record a duration in seconds for a span"""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = SpanHistogram()
+        histogram.observe(duration)
+
+
+def span(name: str):
+    """Time a block, e.g. with span("st_yled_init"): ...
+
+    Does nothing unless instrumentation is enabled.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str):
+    """Decorator timing every call of a function as span"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def register_collector(name: str, collect: Callable[[], dict]):
+    """Register a callable returning numeric gauges, e.g. cache statistics
+
+    Collectors are reported on the debug page and exported as
+    studio_<name>_<gauge> regardless of whether spans are enabled.
+    """
+    with _lock:
+        _collectors[name] = collect
+
+
+def collect() -> dict[str, dict]:
+    """Return the current gauges of every registered collector by name"""
+    with _lock:
+        collectors = dict(_collectors)
+    return {name: gauges() for name, gauges in sorted(collectors.items())}
+
+
+def summaries() -> dict[str, dict]:
+    """Return the summary of every recorded span by span name"""
+    with _lock:
+        return {name: h.summary() for name, h in sorted(_histograms.items())}
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def render_prometheus() -> str:
+    """Return all spans in the Prometheus text exposition format"""
+    lines = [
+        "# HELP studio_span_seconds Duration of instrumented script run stages",
+        "# TYPE studio_span_seconds histogram",
+    ]
+
+    with _lock:
+        for name, histogram in sorted(_histograms.items()):
+            for upper_bound, bucket_count in zip(BUCKETS, histogram.bucket_counts):
+                lines.append(
+                    f'studio_span_seconds_bucket{{span="{name}",le="{upper_bound}"}} '
+                    f"{bucket_count}"
+                )
+            lines.append(
+                f'studio_span_seconds_bucket{{span="{name}",le="+Inf"}} '
+                f"{histogram.count}"
+            )
+            lines.append(f'studio_span_seconds_sum{{span="{name}"}} {histogram.total}')
+            lines.append(
+                f'studio_span_seconds_count{{span="{name}"}} {histogram.count}'
+            )
+
+    for name, gauges in collect().items():
+        for gauge, value in gauges.items():
+            metric = f"studio_{name}_{gauge}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """Write spans as Prometheus text file, replaced atomically for collectors"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
@@ -0,0 +1,41 @@
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+_import_lock = threading.Lock()
+
+
+class _LazyModule(ModuleType):
+    """Module proxy which imports the module on first attribute access
+
+    Each session runs its script in its own thread, the first access of
+    concurrent sessions is serialized by a lock. The import itself goes
+    through importlib, so other imports of the module see a fully executed
+    module and never this proxy.
+    """
+
+    def __getattr__(self, attr: str):
+        with _import_lock:
+            module = importlib.import_module(self.__name__)
+            # Later accesses are plain attribute lookups on the proxy
+            self.__dict__.update(module.__dict__)
+
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module which is executed on first attribute access
+
+    Used for dependencies not needed by every page, e.g. numpy for the color
+    engine. The theme page needs it on its first run, the component pages
+    never and the element page only for colors with alpha. Modules already
+    imported are returned as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    return _LazyModule(name)
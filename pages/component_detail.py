@@ -9,7 +9,7 @@ st_yled.init(
 )
 
 qparams = st.query_params
-components = utils.load_components()
+catalog = utils.load_component_catalog()
 
 # Check if selected qparam was changed
 if "current_component_slug" not in st.session_state:
@@ -103,8 +103,9 @@ with st.container(key="component-detail-main-container"):
             st.session_state["current_component_slug"] = select_slug
             st.session_state["show_code_example"] = False
 
-        if select_slug in components:
-            select_component = components[select_slug]
+        select_component = catalog.by_slug.get(select_slug)
+
+        if select_component is not None:
             main(select_slug, select_component)
         else:
             st_yled.warning(f"Component with slug '{select_slug}' not found.")
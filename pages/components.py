@@ -8,7 +8,7 @@ st_yled.init(
 )
 
 
-components = utils.load_components()
+catalog = utils.load_component_catalog()
 
 # region UI
 
@@ -20,7 +20,7 @@ with st.container(key="components-main-container"):
     ix = 0
     component_cols = st.columns([1, 1, 1], gap="medium")
 
-    for component_slug, component in components.items():
+    for component_slug, component in catalog.by_slug.items():
         col_ix = ix % 3
 
         with component_cols[col_ix]:
@@ -0,0 +1,64 @@
+import streamlit as st
+import st_yled
+
+import instrumentation
+import sessiongc
+import uiconfig
+
+st_yled.init(
+    bypass_css_validation = True
+)
+
+# region UI
+
+with st.container(key="debug-main-container"):
+    st.markdown("**> Debug** Timing of script run stages in this process")
+
+    if not instrumentation.is_enabled():
+        st_yled.info(
+            "Instrumentation is disabled, set STUDIO_INSTRUMENTATION=1 to record spans",
+            icon=":material/info:",
+        )
+        st.stop()
+
+    summaries = instrumentation.summaries()
+
+    if summaries:
+        st.dataframe(
+            [{"span": name, **summary} for name, summary in summaries.items()],
+            hide_index=True,
+        )
+    else:
+        st.write("No spans recorded yet")
+
+    for name, gauges in instrumentation.collect().items():
+        st.markdown(f"**{name}**")
+        st.dataframe([gauges], hide_index=True)
+
+    memory_report = sessiongc.session_memory_report()
+    st.markdown(
+        f"**session** {sum(row['keys'] for row in memory_report)} keys, "
+        f"about {sum(row['bytes'] for row in memory_report) / 1024:.1f} KiB"
+    )
+    st.dataframe(memory_report, hide_index=True)
+
+    prometheus_text = instrumentation.render_prometheus()
+
+    with st.container(horizontal=True, key="debug-actions-container"):
+        st.download_button(
+            "Download Prometheus metrics",
+            data=prometheus_text,
+            file_name="studio_metrics.prom",
+            mime="text/plain",
+            icon=":material/download:",
+        )
+
+        if st.button("Write metrics file", icon=":material/save:"):
+            instrumentation.write_prometheus(uiconfig.PROMETHEUS_TEXTFILE_PATH)
+            st.toast(f"Metrics written to {uiconfig.PROMETHEUS_TEXTFILE_PATH}")
+
+        if st.button("Reset", icon=":material/settings_backup_restore:"):
+            instrumentation.reset()
+            st.rerun()
+
+    st.code(prometheus_text, language="text")
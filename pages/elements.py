@@ -7,120 +7,102 @@ import streamlit as st
 import st_yled
 from st_yled import split_button
 
+import cssimport
+import examplecache
+import instrumentation
+import sharelink
 import uiconfig
 import utils
-
-st_yled.init(
-    bypass_css_validation = True
+from elementregistry import get_element_registry
+from elementstate import (
+    ElementCard,
+    add_element_card,
+    get_element_cards,
+    remove_element_card,
 )
 
+with instrumentation.span("st_yled_init"):
+    st_yled.init(
+        bypass_css_validation = True
+    )
+
 
 def add_element_to_selection(element_name: str):
     if element_name in st.session_state["element-select-names"]:
         return
 
-    if "element-select" not in st.session_state:
-        st.session_state["element-select"] = dict()
-
-    element_hash = str(uuid.uuid4())
-
-    # Get styling options for this element
-    variants = st_yled.styler.get_element_variants(element_name)
-
-    element_entry = {"name": element_name, "types": dict()}
+    add_element_card(element_name)
+    st.session_state["element-select-names"].append(element_name)
 
-    if len(variants) == 0:
-        variants = ["default"]
 
-    # Combine variants into the element entry
-    for variant in variants:
-        if variant == "default":
-            element_config = st_yled.styler.get_element_style(element_name)
-        else:
-            element_config = st_yled.styler.get_element_style(
-                element_name + "_" + variant
-            )
-
-        element_config = element_config.copy()
-        # Strip element config to css[element]
-        element_css = dict()
-        for css_prop in list(element_config["css"].keys()):
-            element_css[css_prop] = None
-        element_config["css"] = element_css
+def import_element_css(uploader_key: str):
+    """Apply an uploaded st-styled.css to the element cards in one step"""
+    uploaded_file = st.session_state[uploader_key]
+    if uploaded_file is None:
+        return
 
-        element_entry["types"][variant] = element_config
+    element_cards = get_element_cards()
 
-    st.session_state["element-select"][element_hash] = element_entry
-    st.session_state["element-select-names"].append(element_name)
+    try:
+        # Elements with a card win over elements with the same selectors
+        css_import = cssimport.import_css(
+            uploaded_file.getvalue().decode("utf-8"),
+            preferred=tuple(card.name for card in element_cards.values()),
+        )
+    except UnicodeDecodeError as e:
+        st.session_state["elements-import-message"] = ("error", str(e))
+        return
 
+    # Elements without a card are added, existing cards keep other styles
+    for element_name, variant_styles in css_import.styles.items():
+        add_element_to_selection(element_name)
 
+        for element_card in element_cards.values():
+            if element_card.name == element_name:
+                element_card.update(variant_styles)
 
-def remove_element_from_selection(
-    element_hash: str, element_key_base: str, element_name: str
-):
-    element_name_prefix = "element-" + element_name
+    # Clear the uploader with a new key
+    st.session_state["elements-import-seed"] = str(uuid.uuid4())
 
-    # Remove from selection and available elements for selection
-    del st.session_state["element-select"][element_hash]
-    st.session_state["element-select-names"].remove(element_name)
-
-    # Remove all associated session state keys
-    keys_to_remove = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith(element_name_prefix) and key.endswith("-value")
-    ]
-    input_seed_keys_to_remove = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith(element_name_prefix) and key.endswith("-value-seed")
-    ]
+    if not css_import.styles:
+        st.session_state["elements-import-message"] = (
+            "error",
+            "No element styles found in the uploaded file",
+        )
+        return
 
-    for key in keys_to_remove:
-        del st.session_state[key]
+    message = f"Imported styles of {len(css_import.styles)} elements"
+    if css_import.unmatched:
+        message += f", skipped {css_import.unmatched} unknown declarations"
+    if css_import.skipped:
+        message += f", skipped {'; '.join(css_import.skipped)}"
+    st.session_state["elements-import-message"] = ("success", message)
 
-    for key in input_seed_keys_to_remove:
-        del st.session_state[key]
 
+def remove_element_from_selection(element_hash: str):
+    element_card = remove_element_card(element_hash)
 
-def reset_element_styles(element_key_base: str):
-    # Remove all associated session state keys
-    value_keys_to_remove = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith(element_key_base) and key.endswith("-value")
-    ]
-    input_seed_keys_to_remove = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith(element_key_base) and key.endswith("-value-seed")
-    ]
+    # Remove from available elements for selection, styles are removed with the card
+    st.session_state["element-select-names"].remove(element_card.name)
 
-    for key in value_keys_to_remove:
-        del st.session_state[key]
 
-    for key in input_seed_keys_to_remove:
-        del st.session_state[key]
+def reset_element_styles(element_hash: str):
+    get_element_cards()[element_hash].reset()
 
 
 def get_element_styles_to_python(
-    element_name: str, element_key_base: str, type_select: Optional[str] = None
+    element_card: ElementCard, type_select: Optional[str] = None
 ) -> str:
-    # Get values for all associated session state keys
-    keys_to_copy = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith(element_key_base) and key.endswith("-value")
-    ]
+    variant = type_select or element_card.variants[0]
+    element_style = element_registry.get(element_card.name, variant)
+    values = element_card.values(variant)
 
-    # Extract properties from keys
+    # Get values for the properties of this element in registry order
     all_args = []
-    for key in keys_to_copy:
-        assert key.endswith("-value") and key.startswith("element-")
-        css_prop_format = key.split("-")[-2]
-        value = st.session_state[key]
-        arg_str = f'{css_prop_format}="{value}"'
-        all_args.append(arg_str)
+    for css_prop_format in element_style.properties:
+        if css_prop_format in values:
+            arg_str = f'{css_prop_format}="{values[css_prop_format]}"'
+            all_args.append(arg_str)
     all_args_str = ", ".join(all_args)
 
     if type_select:
@@ -129,37 +111,40 @@ def get_element_styles_to_python(
         type_args_str = ""
 
     if all_args_str:
-        python_cmd = f"st_yled.{element_name}(*{type_args_str}, {all_args_str})"
+        python_cmd = f"st_yled.{element_card.name}(*{type_args_str}, {all_args_str})"
     else:
-        python_cmd = f"st_yled.{element_name}(*{type_args_str})"
+        python_cmd = f"st_yled.{element_card.name}(*{type_args_str})"
 
     return python_cmd
 
 
 def elements_color_picker(
-    key: str, label: str, label_font_size: str = "20px", label_field_width: int = 130
+    key: str,
+    label: str,
+    values: dict,
+    prop: str,
+    seed_value: str,
+    label_font_size: str = "20px",
+    label_field_width: int = 130,
 ):
-    if key in st.session_state:
-        color_state_value = st.session_state[key]
+    if prop in values:
+        color_state_value = values[prop]
         code_color = None
     else:
         color_state_value = "default"
         code_color = "grey"
 
-    input_seed_key = key + "-seed"
-
-    if input_seed_key not in st.session_state:
-        st.session_state[input_seed_key] = str(uuid.uuid4())
-
     utils.base_color_picker(
         key=key,
-        seed_value=st.session_state[input_seed_key],
+        seed_value=seed_value,
         label=label,
         label_font_size=label_font_size,
         label_field_width=label_field_width,
         color_state_value=color_state_value,
         code_color=code_color,
         caption_width=80,
+        state=values,
+        state_key=prop,
     )
 
 
@@ -167,17 +152,13 @@ def elements_selectbox(
     key: str,
     label: str,
     options: list[str],
+    values: dict,
+    prop: str,
+    seed_value: str,
     label_font_size: str = "16px",
     label_field_width: int = 130,
     format_func=lambda x: x,
 ):
-    input_seed_key = key + "-seed"
-
-    if input_seed_key not in st.session_state:
-        st.session_state[input_seed_key] = str(uuid.uuid4())
-
-    seed_value = st.session_state[input_seed_key]
-
     with st.container(horizontal=True, vertical_alignment="center"):
         st_yled.markdown(label, font_size=label_font_size, width=label_field_width)
 
@@ -190,7 +171,7 @@ def elements_selectbox(
             label_visibility="collapsed",
             on_change=utils.update_st_from_input,
             placeholder="default",
-            args=(key, key + "-selectbox-" + seed_value),
+            args=(prop, key + "-selectbox-" + seed_value, values),
             width=160,
         )
 
@@ -202,11 +183,14 @@ def elements_size_input(
     label: str,
     allowed_units: list[str],
     unit_step_sizes: list[float],
+    values: dict,
+    prop: str,
+    seed_value: str,
     label_font_size: str = "16px",
     label_field_width: int = 130,
 ):
-    if key in st.session_state:
-        size_state_value = st.session_state[key]
+    if prop in values:
+        size_state_value = values[prop]
 
         if size_state_value.startswith("None"):
             size_state_value = size_state_value.replace("None", "")
@@ -219,22 +203,23 @@ def elements_size_input(
             current_number = None
 
         # Filter out potentila None values
-        current_unit = re.findall(r"[a-zA-Z]+", size_state_value)[0]
+        current_unit = re.findall(r"[a-zA-Z]+", size_state_value)
+        current_unit = current_unit[0] if current_unit else None
     else:
         current_number = None
         current_unit = allowed_units[0]
 
-    input_seed_key = key + "-seed"
-
-    if input_seed_key not in st.session_state:
-        st.session_state[input_seed_key] = str(uuid.uuid4())
+    # Values from older share links or imports may carry other units
+    if current_unit not in allowed_units:
+        current_number = None
+        current_unit = allowed_units[0]
 
     step_size = unit_step_sizes[allowed_units.index(current_unit)]
 
     # TODO Fix None
     utils.base_size_input(
         key=key,
-        seed_value=st.session_state[input_seed_key],
+        seed_value=seed_value,
         label=label,
         value=current_number,
         step_size=step_size,
@@ -243,11 +228,13 @@ def elements_size_input(
         label_font_size=label_font_size,
         label_field_width=label_field_width,
         return_value_type="str",
+        state=values,
+        state_key=prop,
     )
 
 
 def weight_display_func(option):
-    options = ["100", "200", "300", "400", "500", "600", "700", "800", "900"]
+    options = uiconfig.FONT_WEIGHT_OPTIONS
     display_options = [
         "thin",
         "extra-light",
@@ -266,41 +253,40 @@ def weight_display_func(option):
         return display_options[options.index(option)]
 
 
-def get_input_widget_for_property(prop: str, key: str, display_name: str):
+def get_input_widget_for_property(
+    prop: str, key: str, display_name: str, values: dict, seed_value: str
+):
     widget_type = uiconfig.css_properties_input_widget[prop]
+    state_args = (values, prop, seed_value)
 
     if widget_type == "color_picker":
-        elements_color_picker(key, display_name, label_font_size="16px")
+        elements_color_picker(key, display_name, *state_args, label_font_size="16px")
 
     elif widget_type == "size_input":
-        allowed_units = ["px", "em", "rem"]
-        unit_step_sizes = [1.0, 0.1, 0.1]
         elements_size_input(
-            key, display_name, allowed_units, unit_step_sizes, label_font_size="16px"
+            key,
+            display_name,
+            uiconfig.ELEMENT_SIZE_UNITS,
+            uiconfig.ELEMENT_SIZE_STEPS,
+            *state_args,
+            label_font_size="16px",
         )
 
     elif widget_type == "selectbox":
         if prop == "border_style":
-            options = [
-                "none",
-                "solid",
-                "dashed",
-                "dotted",
-                "double",
-                "groove",
-                "ridge",
-                "inset",
-                "outset",
-                "hidden",
-            ]
-            elements_selectbox(key, display_name, options, label_font_size="16px")
+            elements_selectbox(
+                key,
+                display_name,
+                uiconfig.BORDER_STYLE_OPTIONS,
+                *state_args,
+                label_font_size="16px",
+            )
         elif prop.endswith("font_weight"):
-            options = ["100", "200", "300", "400", "500", "600", "700", "800", "900"]
-
             elements_selectbox(
                 key,
                 display_name,
-                options,
+                uiconfig.FONT_WEIGHT_OPTIONS,
+                *state_args,
                 format_func=lambda x: weight_display_func(x),
                 label_font_size="16px",
             )
@@ -308,10 +294,188 @@ def get_input_widget_for_property(prop: str, key: str, display_name: str):
         pass
 
 
+@st.fragment
+@instrumentation.timed("element_card_render")
+def render_element_card(element_hash: str):
+    """Render an element card, edits rerun only this card
+
+    A full rerun is triggered only when the card set changes.
+    """
+    if element_hash not in element_cards:
+        return
+
+    # Extract features like element name and types (e.g., primary, secondary)
+    element_card = element_cards[element_hash]
+    element_types = list(element_card.variants)
+    element_name = element_card.name
+
+    # Check if multiple types like primary, secondary are defined for this element
+    # Source is in the element card
+    if len(element_types) == 1:
+        type_selector = False
+        type_select = element_types[0]
+    else:
+        type_selector = True
+        if "secondary" in element_types:
+            type_select = "secondary"
+        else:
+            type_select = element_types[0]
+
+    # Get available css properties for this element type
+    # Each css property is associated with a tab
+    css_props = element_registry.get(element_name, type_select).properties
+    css_tabs = {uiconfig.css_properties_tabs[prop] for prop in css_props}
+
+    tabs_render = []
+    if "Color" in css_tabs:
+        tabs_render.append("Color")
+    if "Font" in css_tabs:
+        tabs_render.append("Font")
+    if "Border" in css_tabs:
+        tabs_render.append("Border")
+    if "Padding" in css_tabs:
+        tabs_render.append("Padding")
+    if "Label" in css_tabs:
+        tabs_render.append("Label")
+    if "Value" in css_tabs:
+        tabs_render.append("Value")
+
+    # Create element card
+    with st_yled.container(
+        background_color="#F6F6F6", key=f"element-card-container-{element_hash}"
+    ):
+        # Card styles are shared for all cards, see assets/studio.css
+
+        col1, col2 = st.columns([1, 2], gap="medium")
+
+        with col1:
+            st_yled.subheader(element_name, font_size=24)
+
+            # type_select is defined in the beginning of the card
+            # type_select
+
+            # Check if multiple types
+            if type_selector:
+                type_select = st_yled.selectbox(
+                    "Select Type",
+                    options=element_types,
+                    index=element_types.index(type_select),
+                    key=f"element-{element_hash}-type-select",
+                    format_func=lambda x: uiconfig.element_type_format.get(x),
+                    label_visibility="collapsed",
+                    font_size="14px",
+                    width=180,
+                )
+            else:
+                st.write("")
+
+            # Define a name base for the element widget keys
+            element_key_base = f"element-{element_hash}-{type_select}"
+            element_values = element_card.values(type_select)
+            element_style = element_registry.get(element_name, type_select)
+            example_code = examplecache.get_example_code(element_style)
+
+            # Create example container
+            with st_yled.container(
+                horizontal_alignment="center",
+                key=f"element-{element_hash}-example-container",
+                background_color="#FFFFFF",
+            ):
+                # Style properties of this element type rendered in example
+                kwargs = dict(element_values)
+
+                # Add cases where example should be defined custom, like for containers
+                if element_name == "container":
+                    with st_yled.container(**kwargs):
+                        st.write("Container Content")
+
+                elif element_name == "expander":
+                    with st_yled.expander(
+                        "Expander Title", **kwargs, expanded=True
+                    ):
+                        st.write("Expander Content")
+
+                elif element_name == "popover":
+                    with st_yled.popover(
+                        "Popover Title", **kwargs, key=f"example-popover-{element_hash}"
+                    ):
+                        st.write("Popover Content")
+
+                # Create example to displa changes
+                elif example_code:
+                    # Evaluate on this page, st_yled derives element keys from the caller
+                    with instrumentation.span("example_eval"):
+                        eval(example_code, examplecache.example_namespace(kwargs))
+
+            res = split_button(
+                label="Copy Python",
+                key=element_card.split_key,
+                options=["Remove", "Reset"],
+            )
+
+            if res == "Remove":
+                # Removes styles of all variants with the card
+                # The card set changed, rerun the full page
+                remove_element_from_selection(element_hash)
+                st.rerun()
+
+            elif res == "Reset":
+                # Resets styles of all variants and renders new input widgets
+                reset_element_styles(element_hash)
+
+                # Required to render new key for split button on action and reset state
+                element_card.renew_split_key()
+                st.rerun(scope="fragment")
+
+        with col2:
+            tabs = st.tabs(tabs_render)
+
+            for ix, tab in enumerate(tabs):
+                with tab:
+                    for prop in css_props:
+                        if uiconfig.css_properties_tabs[prop] == tabs_render[ix]:
+                            display_name = uiconfig.css_properties_display_name.get(
+                                prop, prop
+                            )
+
+                            element_key = element_key_base + f"-{prop}"
+                            get_input_widget_for_property(
+                                prop,
+                                element_key,
+                                display_name,
+                                element_values,
+                                element_card.seed,
+                            )
+
+                            # Get the right display function and def
+
+        # Final bottom
+        if res == "Copy Python":
+            if type_selector:
+                type_select_arg = type_select
+            else:
+                type_select_arg = None
+
+            python_cmd = get_element_styles_to_python(element_card, type_select_arg)
+
+            st_yled.code(python_cmd, background_color="#FFFFFF", language="python")
+
+            # Required to render new key for split button on action and reset state
+            element_card.renew_split_key()
+
+    # Card edits rerun only this fragment, keep the share link current
+    sharelink.write_fragment_query_params()
+
+
 # region data
 
-if "element-select" not in st.session_state:
-    st.session_state["element-select"] = dict()
+element_registry = get_element_registry()
+
+# Compile element examples once per process, errors are logged here
+examplecache.get_example_cache()
+
+element_cards = get_element_cards()
+
 if "element-select-names" not in st.session_state:
     st.session_state["element-select-names"] = list()
 if "element-first-open" not in st.session_state:
@@ -341,7 +505,38 @@ if st.session_state["element-first-open"]:
 # region UI
 
 with st.container(key="elements-main-container"):
-    st.markdown("**> Elements** Style and customize your Streamlit UI elements")
+    with st.container(
+        horizontal=True,
+        horizontal_alignment="distribute",
+        vertical_alignment="center",
+        key="elements-header-container",
+    ):
+        st.markdown("**> Elements** Style and customize your Streamlit UI elements")
+
+        with st.popover(
+            "Import st-styled.css", icon=":material/upload_file:", key="elements-import"
+        ):
+            if "elements-import-seed" not in st.session_state:
+                st.session_state["elements-import-seed"] = str(uuid.uuid4())
+
+            uploader_key = (
+                "elements-import-file-" + st.session_state["elements-import-seed"]
+            )
+
+            st.file_uploader(
+                "Upload a st-styled.css exported by the studio",
+                type=["css"],
+                key=uploader_key,
+                on_change=import_element_css,
+                args=(uploader_key,),
+            )
+
+    if "elements-import-message" in st.session_state:
+        message_type, message = st.session_state.pop("elements-import-message")
+        if message_type == "error":
+            st.toast(message, icon=":material/error:")
+        else:
+            st.toast(message, icon=":material/check_circle:")
 
     # Window to add new element styles
     with st_yled.popover(
@@ -436,231 +631,22 @@ with st.container(key="elements-main-container"):
                 ):
                     st_yled.subheader(element_select, font_size=24)
 
-                    element_config = st_yled.styler.get_element_style(
-                        element_select
-                    )
+                    element_style = element_registry.styles[element_select]
+
+                    example_code = examplecache.get_example_code(element_style)
 
                     # Preview example if example code is available
-                    if "example" in element_config:
+                    if example_code:
                         kwargs = {"key": f"preview-example-{element_select}"}
-                        eval(element_config["example"])
+                        with instrumentation.span("example_eval"):
+                            eval(example_code, examplecache.example_namespace(kwargs))
                     else:
                         st_yled.info("No preview available", icon=":material/info:")
 
     # Get all selected elements to render as cards in main UI
-    elements_display = st.session_state["element-select"]
-    display_keys = list(elements_display.keys())[::-1]  # Reverse order for display
+    display_keys = list(element_cards.keys())[::-1]  # Reverse order for display
 
     # region Render Cards
 
-    for ix, element_hash in enumerate(display_keys):
-        # Extract features like element name and types (e.g., primary, secondary)
-        element_card_props = elements_display[element_hash]
-        element_types = list(element_card_props["types"].keys())
-        element_name = element_card_props["name"]
-
-        # Define a random key for the element card split button
-        if "element-card-split-" + element_hash not in st.session_state:
-            st.session_state["element-card-split-" + element_hash] = str(uuid.uuid4())
-
-        # Check if multiple types like primary, secondary are defined for this element
-        # Source is in the element_card_props
-        if len(element_types) == 1:
-            type_selector = False
-            type_select = element_types[0]
-        else:
-            type_selector = True
-            if "secondary" in element_types:
-                type_select = "secondary"
-            else:
-                type_select = element_types[0]
-
-        # Get available css properties for this element type
-        # Each css property is associated with a tab
-        css_props = list(element_card_props["types"][type_select]["css"].keys())
-        css_tabs = {uiconfig.css_properties_tabs[prop] for prop in css_props}
-
-        tabs_render = []
-        if "Color" in css_tabs:
-            tabs_render.append("Color")
-        if "Font" in css_tabs:
-            tabs_render.append("Font")
-        if "Border" in css_tabs:
-            tabs_render.append("Border")
-        if "Padding" in css_tabs:
-            tabs_render.append("Padding")
-        if "Label" in css_tabs:
-            tabs_render.append("Label")
-        if "Value" in css_tabs:
-            tabs_render.append("Value")
-
-        # Create element card
-        with st_yled.container(
-            background_color="#F6F6F6", key=f"element-card-container-{element_hash}"
-        ):
-            # Apply card css
-            css = f"""
-                .st-key-element-card-container-{element_hash} {{
-                    padding: 16px 16px;
-                }}
-
-                .st-key-element-{element_hash}-type-select .stSelectbox div {{
-                    height: 32px;
-                    line-height: 32px;
-                    display: flex;
-                    align-items: center;
-                }}
-
-                .st-key-element-card-container-{element_hash} .stTabs {{
-                    margin-top: 12px;
-                }}
-
-                .st-key-element-card-container-{element_hash} .stTabs div[data-baseweb="tab-panel"]{{
-                    margin-top: 12px;
-                }}
-
-                .st-key-element-card-container-{element_hash} .stTabs p {{
-                    font-weight: 500;
-                }}
-
-                .st-key-element-card-container-{element_hash} .stTabs .stVerticalBlock {{
-                    gap: 32px;
-                }}
-
-                .st-key-element-{element_hash}-example-container {{
-                    padding: 32px 16px;
-                    margin-top: 24px;
-                    margin-bottom: 24px;
-                }}
-                """
-            st.html(f"<style>{css}</style>")
-
-            col1, col2 = st.columns([1, 2], gap="medium")
-
-            with col1:
-                st_yled.subheader(element_name, font_size=24)
-
-                # type_select is defined in the beginning of the card
-                # type_select
-
-                # Check if multiple types
-                if type_selector:
-                    type_select = st_yled.selectbox(
-                        "Select Type",
-                        options=element_types,
-                        index=element_types.index(type_select),
-                        key=f"element-{element_hash}-type-select",
-                        format_func=lambda x: uiconfig.element_type_format.get(x),
-                        label_visibility="collapsed",
-                        font_size="14px",
-                        width=180,
-                    )
-                else:
-                    st.write("")
-
-                # Define a name base for the element keys
-                element_key_base = "element-" + element_name
-                if type_selector:
-                    element_key_base = element_key_base + "-" + type_select
-
-                # Create example container
-                with st_yled.container(
-                    horizontal_alignment="center",
-                    key=f"element-{element_hash}-example-container",
-                    background_color="#FFFFFF",
-                ):
-                    kwargs = {}
-                    # Extract all css properties for this element type
-                    # Get the values from session state if defined to be rendered in example page
-                    for key in st.session_state.keys():
-                        if key.startswith(element_key_base) and key.endswith("-value"):
-                            css_prop = key.split("-")[-2]
-                            css_value = st.session_state[key]
-                            kwargs[css_prop] = css_value
-
-                    # Add cases where example should be defined custom, like for containers
-                    if element_name == "container":
-                        with st_yled.container(**kwargs):
-                            st.write("Container Content")
-
-                    elif element_name == "expander":
-                        with st_yled.expander(
-                            "Expander Title", **kwargs, expanded=True
-                        ):
-                            st.write("Expander Content")
-                    
-                    elif element_name == "popover":
-                        with st_yled.popover(
-                            "Popover Title", **kwargs, key=f"example-popover-{element_hash}"
-                        ):
-                            st.write("Popover Content")
-
-                    # Create example to displa changes
-                    elif "example" in element_card_props["types"][type_select]:
-                        eval(element_card_props["types"][type_select]["example"])
-
-                res = split_button(
-                    label="Copy Python",
-                    key=st.session_state["element-card-split-" + element_hash],
-                    options=["Remove", "Reset"],
-                )
-
-                if res == "Remove":
-                    # Make sure to delete variants if any
-                    remove_element_from_selection(
-                        element_hash, element_key_base, element_name
-                    )
-
-                    # Required to render new key for split button on action and reset state
-                    st.session_state["element-card-split-" + element_hash] = str(
-                        uuid.uuid4()
-                    )
-                    st.rerun()
-
-                elif res == "Reset":
-                    reset_element_styles(element_key_base)
-                    # Required to render new key for split button on action and reset state
-                    st.session_state["element-card-split-" + element_hash] = str(
-                        uuid.uuid4()
-                    )
-
-                    # Delete all input seed keys associated with this element
-                    # input_seed_keys_to_remove = [key for key in st.session_state.keys() if key
-
-                    st.rerun()
-
-            with col2:
-                tabs = st.tabs(tabs_render)
-
-                for ix, tab in enumerate(tabs):
-                    with tab:
-                        for prop in css_props:
-                            if uiconfig.css_properties_tabs[prop] == tabs_render[ix]:
-                                display_name = uiconfig.css_properties_display_name.get(
-                                    prop, prop
-                                )
-
-                                element_key = element_key_base + f"-{prop}-value"
-                                get_input_widget_for_property(
-                                    prop, element_key, display_name
-                                )
-
-                                # Get the right display function and def
-
-            # Final bottom
-            if res == "Copy Python":
-                if type_selector:
-                    type_select_arg = type_select
-                else:
-                    type_select_arg = None
-
-                python_cmd = get_element_styles_to_python(
-                    element_name, element_key_base, type_select_arg
-                )
-
-                st_yled.code(python_cmd, background_color="#FFFFFF", language="python")
-
-                # Required to render new key for split button on action and reset state
-                st.session_state["element-card-split-" + element_hash] = str(
-                    uuid.uuid4()
-                )
+    for element_hash in display_keys:
+        render_element_card(element_hash)
@@ -3,63 +3,91 @@ from typing import Literal, Optional
 import streamlit as st
 import st_yled
 
+import colorengine
+import configimport
+import instrumentation
 import uiconfig
 import utils
+import themeschema
+from themestate import get_theme_state, replace_theme_values
 
 import uuid
 
-st_yled.init(
-    bypass_css_validation = True
-)
-
-
-def init_theme_session_state(key: str, default_value: str):
-    """Initialize session state variables for theme settings with default values."""
-
-    if key not in st.session_state:
-        st.session_state[key] = default_value
-        st.session_state[f"{key}-default"] = default_value
+with instrumentation.span("st_yled_init"):
+    st_yled.init(
+        bypass_css_validation = True
+    )
 
 
 def update_st_from_input(theme_property: str, input_selector_key: str):
-    st.session_state[theme_property] = st.session_state[input_selector_key]
+    get_theme_state()[theme_property] = st.session_state[input_selector_key]
 
 
 def reset_defaults(keys: list[str]):
-    for key in keys:
-        default_key = f"{key}-default"
-        if default_key in st.session_state:
-            st.session_state[key] = st.session_state[default_key]
+    # Only dirty keys are reassigned, clean keys keep their default
+    get_theme_state().reset(keys)
 
+    for key in keys:
         key_seed = key + "-seed"
 
         if key_seed in st.session_state:
             del st.session_state[key_seed]
 
 
+def import_config_toml(uploader_key: str):
+    """Apply an uploaded config.toml to the theme state in one step"""
+    uploaded_file = st.session_state[uploader_key]
+    if uploaded_file is None:
+        return
+
+    try:
+        config_import = configimport.parse_config_toml(
+            uploaded_file.getvalue().decode("utf-8")
+        )
+    except (UnicodeDecodeError, ValueError) as e:
+        st.session_state["theme-import-message"] = ("error", str(e))
+        return
+
+    replace_theme_values(config_import.values)
+
+    # Clear the uploader with a new key
+    st.session_state["theme-import-seed"] = str(uuid.uuid4())
+
+    message = f"Imported {len(config_import.values)} theme values"
+    if config_import.skipped:
+        message += f", skipped {'; '.join(config_import.skipped)}"
+    st.session_state["theme-import-message"] = ("success", message)
+
+
 def reset_seed(key: str):
     del st.session_state[key]
 
 
-def frame_select_reset_bar(key: str, reset_keys: list[str]):
+def frame_select_reset_bar(key: str, tab: str):
     with st.container(
         key=f"{key}-container", horizontal=True, horizontal_alignment="distribute"
     ):
+        # Keep the frame selection when the tab is built again after a switch
+        frame_index_key = f"{key}-frame-index"
+
         frame_type = utils.segmented_control_toggle(
             ":material/width_full: Main",
             ":material/side_navigation: Sidebar",
             key=f"{key}-toggle",
+            index=st.session_state.get(frame_index_key, 0),
         )
 
         if frame_type == ":material/side_navigation: Sidebar":
             frame_type_select = "sidebar"
             preview_selector_prefix = "theme-sidebar"
+            st.session_state[frame_index_key] = 1
         else:
             frame_type_select = "main"
             preview_selector_prefix = "theme"
+            st.session_state[frame_index_key] = 0
 
-        # Append whether to reset sidebar or main keys
-        reset_keys = [f"{preview_selector_prefix}-{rk}" for rk in reset_keys]
+        # Reset the properties of the tab in the selected frame
+        reset_keys = list(themeschema.get_tab_keys(tab, frame_type_select))
 
         st_yled.button(
             "Reset",
@@ -85,7 +113,6 @@ def theme_color_picker(
         theme_property = "sidebar-" + theme_property
 
     session_state_key = f"theme-{theme_property}"
-    session_state_key_default = f"{session_state_key}-default"
 
     # Create a unique seed for component
     input_seed_key = f"theme-{theme_property}-seed"
@@ -93,12 +120,14 @@ def theme_color_picker(
     if input_seed_key not in st.session_state:
         st.session_state[input_seed_key] = str(uuid.uuid4())
 
-    color_state_value = st.session_state[session_state_key]
+    color_state_value = theme_state[session_state_key]
 
-    color_is_default = color_state_value == st.session_state[session_state_key_default]
+    color_is_default = not theme_state.is_dirty(session_state_key)
 
     code_color = "grey" if color_is_default else None
 
+    contrast_warning = contrast_issues.get(session_state_key)
+
     utils.base_color_picker(
         key=session_state_key,
         seed_value=st.session_state[input_seed_key],
@@ -108,9 +137,67 @@ def theme_color_picker(
         color_state_value=color_state_value,
         code_color=code_color,
         caption_width=100,
+        state=theme_state,
+        warning="\n\n".join(contrast_warning) if contrast_warning else None,
     )
 
 
+def get_contrast_issues() -> dict[str, list[str]]:
+    """Check theme color pairs for WCAG contrast, main and sidebar in one pass
+
+    Colors with alpha are resolved against the background of their frame.
+
+    Returns:
+        dict: notes on failing pairs by theme state key of both colors,
+            e.g. {'theme-textColor': ['2.1:1 on Background, needs 4.5:1']}
+    """
+    color_keys = []
+    colors = []
+    backgrounds = []
+
+    for prefix in ("theme", "theme-sidebar"):
+        background = theme_state[f"{prefix}-backgroundColor"]
+        if not colorengine.is_hex_color(background):
+            background = colorengine.DEFAULT_BACKGROUND
+
+        for prop in uiconfig.THEME_COLOR_LABELS:
+            key = f"{prefix}-{prop}"
+            if colorengine.is_hex_color(theme_state[key]):
+                color_keys.append(key)
+                colors.append(theme_state[key])
+                # Page backgrounds are shown over white
+                if prop == "backgroundColor":
+                    backgrounds.append(colorengine.DEFAULT_BACKGROUND)
+                else:
+                    backgrounds.append(background)
+
+    ratios = colorengine.contrast_matrix(colorengine.blend_colors(colors, backgrounds))
+    color_index = {key: ix for ix, key in enumerate(color_keys)}
+
+    contrast_issues = {}
+    for prefix in ("theme", "theme-sidebar"):
+        for fg_prop, bg_prop, min_ratio in uiconfig.THEME_CONTRAST_PAIRS:
+            fg_ix = color_index.get(f"{prefix}-{fg_prop}")
+            bg_ix = color_index.get(f"{prefix}-{bg_prop}")
+            if fg_ix is None or bg_ix is None:
+                continue
+
+            ratio = ratios[fg_ix, bg_ix]
+            if ratio >= min_ratio:
+                continue
+
+            fg_label = uiconfig.THEME_COLOR_LABELS[fg_prop]
+            bg_label = uiconfig.THEME_COLOR_LABELS[bg_prop]
+            contrast_issues.setdefault(f"{prefix}-{fg_prop}", []).append(
+                f"{ratio:.1f}:1 on {bg_label}, needs {min_ratio:g}:1"
+            )
+            contrast_issues.setdefault(f"{prefix}-{bg_prop}", []).append(
+                f"{ratio:.1f}:1 with {fg_label}, needs {min_ratio:g}:1"
+            )
+
+    return contrast_issues
+
+
 def theme_checkbox(
     theme_property: str,
     label: str,
@@ -135,7 +222,7 @@ def theme_checkbox(
         st_yled.checkbox(
             "Enable",
             label_visibility="collapsed",
-            value=st.session_state[session_state_key],
+            value=theme_state[session_state_key],
             key=theme_property + "-checkbox-" + st.session_state[input_seed_key],
             on_change=update_st_from_input,
             args=(
@@ -152,9 +239,7 @@ def theme_size_input(
     label: str,
     label_font_size: str = "20px",
     label_field_width: int = 140,
-    allowed_units: list[str] = ["px", "rem"],
     frame_type: Literal["main", "sidebar"] = "main",
-    return_value_type: Literal["tuple", "int"] = "tuple",
 ):
     if frame_type == "sidebar":
         theme_property = "sidebar-" + theme_property
@@ -167,8 +252,12 @@ def theme_size_input(
     if input_seed_key not in st.session_state:
         st.session_state[input_seed_key] = str(uuid.uuid4())
 
-    # Get current value tuple or parse from string
-    current_value = st.session_state[session_state_key]
+    # Sizes with unit are tuples, sizes in px only are integers
+    theme_property = themeschema.THEME_PROPERTIES[session_state_key]
+    allowed_units = list(theme_property.allowed_units)
+    return_value_type = "tuple" if theme_property.value_type is tuple else "int"
+
+    current_value = theme_state[session_state_key]
 
     if return_value_type == "tuple":
         current_number, current_unit = current_value
@@ -189,6 +278,7 @@ def theme_size_input(
         label_font_size=label_font_size,
         label_field_width=label_field_width,
         return_value_type=return_value_type,
+        state=theme_state,
     )
 
 
@@ -212,12 +302,12 @@ def theme_font_input(
         st.session_state[input_seed_key] = str(uuid.uuid4())
 
     # Get current value tuple or parse from string
-    current_value = st.session_state[session_state_key]
+    current_value = theme_state[session_state_key]
 
     with st.container(horizontal=True, vertical_alignment="center", key=key):
         st_yled.markdown(label, font_size=label_font_size, width=label_field_width)
 
-        options = ["sans-serif", "serif", "monospace", "Google Fonts"]
+        options = uiconfig.FONT_FAMILY_OPTIONS + ["Google Fonts"]
         index_select = options.index(current_value) if current_value in options else 3
 
         # Number input
@@ -240,31 +330,33 @@ def theme_font_input(
             family_name = st.text_input(
                 "Name",
                 value=family_name_value,
-                key=theme_property + "-font-family",
+                key=theme_property + "-font-family-" + st.session_state[input_seed_key],
                 width=100,
             )
 
             font_url = st.text_input(
                 "Google Fonts URL",
                 value=font_url_value,
-                key=theme_property + "-font-url",
+                key=theme_property + "-font-url-" + st.session_state[input_seed_key],
                 help="More information on \n[Google Fonts in Streamlit](https://docs.streamlit.io/develop/tutorials/configuration-and-theming/external-fonts)",
                 width=240,
             )
 
             font_value = f"'{family_name}':{font_url}"
 
-        # Update session state with tuple value
-        st.session_state[session_state_key] = font_value
+        # Update theme state with font value
+        theme_state[session_state_key] = font_value
 
 
 def update_base_weight_from_input(theme_property: str, input_selector_key: str):
+    theme_state = get_theme_state()
+
     # Reset if input selector is none
     if st.session_state[input_selector_key] is None:
-        del st.session_state[theme_property]
+        del theme_state[theme_property]
     else:
         new_value = st.session_state[input_selector_key]
-        st.session_state[theme_property] = new_value
+        theme_state[theme_property] = new_value
 
 
 def theme_weight_input(
@@ -286,7 +378,7 @@ def theme_weight_input(
         st.session_state[input_seed_key] = str(uuid.uuid4())
 
     # Get current value tuple or parse from string
-    current_value = st.session_state[session_state_key]
+    current_value = theme_state[session_state_key]
 
     with st.container(horizontal=True, vertical_alignment="center", width=400):
         st_yled.markdown(label, font_size=label_font_size, width=label_field_width)
@@ -309,597 +401,521 @@ def theme_weight_input(
         )
 
 
-# Initialize main theme session state
-init_theme_session_state("theme-primaryColor", uiconfig.PRIMARY_COLOR_DEFAULT)
-init_theme_session_state("theme-backgroundColor", uiconfig.BACKGROUND_COLOR_DEFAULT)
-init_theme_session_state(
-    "theme-secondaryBackgroundColor", uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT
-)
-init_theme_session_state("theme-textColor", uiconfig.TEXT_COLOR_DEFAULT)
-init_theme_session_state("theme-linkColor", uiconfig.LINK_COLOR_DEFAULT)
-init_theme_session_state("theme-codeBackgroundColor", uiconfig.CODE_BG_COLOR_DEFAULT)
-init_theme_session_state(
-    "theme-dataframeBorderColor", uiconfig.DATAFRAME_BORDER_COLOR_DEFAULT
-)
-init_theme_session_state(
-    "theme-dataframeHeaderBackgroundColor", uiconfig.DATAFRAME_HEADER_BG_COLOR_DEFAULT
-)
-
-# Initialize sidebar theme session state
-init_theme_session_state(
-    "theme-sidebar-primaryColor", uiconfig.SIDEBAR_PRIMARY_COLOR_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-backgroundColor", uiconfig.SIDEBAR_BACKGROUND_COLOR_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-secondaryBackgroundColor",
-    uiconfig.SIDEBAR_SECONDARY_BACKGROUND_COLOR_DEFAULT,
-)
-init_theme_session_state("theme-sidebar-textColor", uiconfig.SIDEBAR_TEXT_COLOR_DEFAULT)
-init_theme_session_state("theme-sidebar-linkColor", uiconfig.SIDEBAR_LINK_COLOR_DEFAULT)
-init_theme_session_state(
-    "theme-sidebar-codeBackgroundColor", uiconfig.SIDEBAR_CODE_BG_COLOR_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-dataframeBorderColor",
-    uiconfig.SIDEBAR_DATAFRAME_BORDER_COLOR_DEFAULT,
-)
-init_theme_session_state(
-    "theme-sidebar-dataframeHeaderBackgroundColor",
-    uiconfig.SIDEBAR_DATAFRAME_HEADER_BG_COLOR_DEFAULT,
-)
-
-# Initialize border theme session state
-init_theme_session_state("theme-borderColor", uiconfig.BORDER_COLOR_DEFAULT)
-init_theme_session_state(
-    "theme-showWidgetBorder", uiconfig.SHOW_INPUT_WIDGET_BORDER_DEFAULT
-)
-init_theme_session_state(
-    "theme-showSidebarBorder", uiconfig.SHOW_SIDEBAR_BORDER_DEFAULT
-)
-
-# Initialize sidebar border theme session state
-init_theme_session_state(
-    "theme-sidebar-borderColor", uiconfig.SIDEBAR_BORDER_COLOR_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-showWidgetBorder", uiconfig.SIDEBAR_SHOW_INPUT_WIDGET_BORDER_DEFAULT
-)
-
-# Initialize radius theme session state
-init_theme_session_state("theme-baseRadius", uiconfig.BASE_RADIUS_DEFAULT)
-init_theme_session_state("theme-buttonRadius", uiconfig.BUTTON_RADIUS_DEFAULT)
-
-# Initialize sidebar radius theme session state
-init_theme_session_state(
-    "theme-sidebar-baseRadius", uiconfig.SIDEBAR_BASE_RADIUS_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-buttonRadius", uiconfig.SIDEBAR_BUTTON_RADIUS_DEFAULT
-)
-
-# Initialize sidebar font theme session state
-init_theme_session_state("theme-font", uiconfig.FONT_DEFAULT)
-init_theme_session_state("theme-headingFont", uiconfig.HEADING_FONT_DEFAULT)
-init_theme_session_state("theme-baseFontSize", uiconfig.BASE_FONT_SIZE_DEFAULT)
-init_theme_session_state("theme-baseFontWeight", uiconfig.BASE_FONT_WEIGHT_DEFAULT)
-
-init_theme_session_state("theme-codeFont", uiconfig.CODE_FONT_DEFAULT)
-init_theme_session_state("theme-codeFontSize", uiconfig.CODE_FONT_SIZE_DEFAULT)
-init_theme_session_state("theme-codeFontWeight", uiconfig.CODE_FONT_WEIGHT_DEFAULT)
-
-init_theme_session_state("theme-sidebar-font", uiconfig.SIDEBAR_FONT_DEFAULT)
-init_theme_session_state(
-    "theme-sidebar-headingFont", uiconfig.SIDEBAR_HEADING_FONT_DEFAULT
-)
-
-init_theme_session_state("theme-sidebar-codeFont", uiconfig.SIDEBAR_CODE_FONT_DEFAULT)
-init_theme_session_state(
-    "theme-sidebar-codeFontSize", uiconfig.SIDEBAR_CODE_FONT_SIZE_DEFAULT
-)
-init_theme_session_state(
-    "theme-sidebar-codeFontWeight", uiconfig.SIDEBAR_CODE_FONT_WEIGHT_DEFAULT
-)
+with instrumentation.span("theme_state_init"):
+    theme_state = get_theme_state()
+
+    # Resolve all theme colors shown on this page in one pass, pickers hit the cache
+    colorengine.resolve_colors(
+        [value for _, value in theme_state.items() if colorengine.is_hex_color(value)]
+    )
+
+    # Contrast of main and sidebar colors, recomputed on every rerun
+    contrast_issues = get_contrast_issues()
 
 # region UI
 
 
 with st.container(key="theme-main-container"):
-    st.markdown("**> Theme** Configure global styling of your Streamlit app")
+    with st.container(
+        horizontal=True,
+        horizontal_alignment="distribute",
+        vertical_alignment="center",
+        key="theme-header-container",
+    ):
+        st.markdown("**> Theme** Configure global styling of your Streamlit app")
+
+        with st.popover(
+            "Import config.toml", icon=":material/upload_file:", key="theme-import"
+        ):
+            if "theme-import-seed" not in st.session_state:
+                st.session_state["theme-import-seed"] = str(uuid.uuid4())
+
+            uploader_key = "theme-import-file-" + st.session_state["theme-import-seed"]
+
+            st.file_uploader(
+                "Upload your config.toml, [theme] and [theme.sidebar] are imported",
+                type=["toml"],
+                key=uploader_key,
+                on_change=import_config_toml,
+                args=(uploader_key,),
+            )
 
+    if "theme-import-message" in st.session_state:
+        message_type, message = st.session_state.pop("theme-import-message")
+        if message_type == "error":
+            st.toast(message, icon=":material/error:")
+        else:
+            st.toast(message, icon=":material/check_circle:")
+
+    # Only the selected tab is built, switching tabs triggers a rerun
     tab_color, tab_font, tab_border, tab_radius = st_yled.tabs(
-        ["Color", "Font", "Border", "Radius"], key="theme-tabs"
+        ["Color", "Font", "Border", "Radius"], key="theme-tabs", on_change="rerun"
     )
 
     # region Color Tabs
-    with tab_color:
-        frame_type_select, preview_selector_prefix = frame_select_reset_bar(
-            key="theme-color-frame-reset-bar",
-            reset_keys=[
-                "primaryColor",
-                "backgroundColor",
-                "secondaryBackgroundColor",
-                "textColor",
-                "linkColor",
-                "codeBackgroundColor",
-                "dataframeBorderColor",
-                "dataframeHeaderBackgroundColor",
-            ],
-        )
-
-        color_cont = st.container(key="theme-color-container")
+    if tab_color.open:
+        with tab_color:
+            frame_type_select, preview_selector_prefix = frame_select_reset_bar(
+                key="theme-color-frame-reset-bar",
+                tab="Color",
+            )
 
-        col1, col2 = color_cont.columns([2, 1])
+            color_cont = st.container(key="theme-color-container")
 
-        # Define Color Pickers
-        with col1.container(key="color-selectors"):
-            theme_color_picker("primaryColor", "Primary", frame_type=frame_type_select)
+            col1, col2 = color_cont.columns([2, 1])
 
-            theme_color_picker(
-                "backgroundColor", "Background", frame_type=frame_type_select
-            )
+            # Define Color Pickers
+            with col1.container(key="color-selectors"):
+                theme_color_picker("primaryColor", "Primary", frame_type=frame_type_select)
 
-            theme_color_picker(
-                "secondaryBackgroundColor",
-                "Secondary Background",
-                frame_type=frame_type_select,
-            )
+                theme_color_picker(
+                    "backgroundColor", "Background", frame_type=frame_type_select
+                )
 
-            theme_color_picker("textColor", "Text", frame_type=frame_type_select)
-
-        # Preview Pane
-        with col2:
-            with st_yled.container(
-                key="color-preview",
-                background_color=st.session_state[
-                    f"{preview_selector_prefix}-backgroundColor"
-                ],
-                border=False,
-                padding="16px",
-                padding_bottom="64px",
-            ):
-                bg_test = st.container(
-                    horizontal=True,
-                    horizontal_alignment="right",
+                theme_color_picker(
+                    "secondaryBackgroundColor",
+                    "Secondary Background",
+                    frame_type=frame_type_select,
                 )
 
-                bg_test.markdown("**Background**", width="content")
+                theme_color_picker("textColor", "Text", frame_type=frame_type_select)
 
+            # Preview Pane
+            with col2:
                 with st_yled.container(
-                    key="primary-color-preview",
-                    background_color=st.session_state[
-                        f"{preview_selector_prefix}-primaryColor"
+                    key="color-preview",
+                    background_color=theme_state[
+                        f"{preview_selector_prefix}-backgroundColor"
                     ],
-                    height=128,
-                    width=112,
-                    padding="8px",
+                    border=False,
+                    padding="16px",
+                    padding_bottom="64px",
                 ):
-                    st_yled.markdown(
-                        "**Primary**",
-                        width="content",
-                        color="#FFFFFF",
-                        key="primary-color-preview-text",
+                    bg_test = st.container(
+                        horizontal=True,
+                        horizontal_alignment="right",
                     )
 
-                with st.container(horizontal=True, horizontal_alignment="right"):
+                    bg_test.markdown("**Background**", width="content")
+
                     with st_yled.container(
-                        key="secondary-color-preview",
-                        background_color=st.session_state[
-                            f"{preview_selector_prefix}-secondaryBackgroundColor"
+                        key="primary-color-preview",
+                        background_color=theme_state[
+                            f"{preview_selector_prefix}-primaryColor"
                         ],
-                        height=112,
+                        height=128,
                         width=112,
-                        horizontal=True,
-                        horizontal_alignment="right",
                         padding="8px",
                     ):
                         st_yled.markdown(
-                            "**Secondary Background**",
+                            "**Primary**",
                             width="content",
+                            color="#FFFFFF",
+                            key="primary-color-preview-text",
                         )
 
-                st_yled.markdown(
-                    "Textcolor",
-                    font_size="26px",
-                    key="textcolor-preview",
-                    color=st.session_state[f"{preview_selector_prefix}-textColor"],
-                )
-
-                st.markdown("")
-
-        # TODO: Expander BG Color
-        with st_yled.expander(
-            "More Color Options",
-            key="theme-color-ext-expander",
-            border_style="none",
-            padding="0px",
-            background_color=uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT,
-        ):
-            color_ext_cont = st.container(key="theme-color-ext-container")
-
-            col1, col2 = color_ext_cont.columns([2, 1])
+                    with st.container(horizontal=True, horizontal_alignment="right"):
+                        with st_yled.container(
+                            key="secondary-color-preview",
+                            background_color=theme_state[
+                                f"{preview_selector_prefix}-secondaryBackgroundColor"
+                            ],
+                            height=112,
+                            width=112,
+                            horizontal=True,
+                            horizontal_alignment="right",
+                            padding="8px",
+                        ):
+                            st_yled.markdown(
+                                "**Secondary Background**",
+                                width="content",
+                            )
 
-            with col1:
-                with st_yled.container(key="color-ext-selectors", padding="16px"):
-                    theme_color_picker(
-                        "linkColor",
-                        "Link",
-                        label_font_size="16px",
-                        label_field_width=100,
-                        frame_type=frame_type_select,
+                    st_yled.markdown(
+                        "Textcolor",
+                        font_size="26px",
+                        key="textcolor-preview",
+                        color=theme_state[f"{preview_selector_prefix}-textColor"],
                     )
 
-                    theme_color_picker(
-                        "codeBackgroundColor",
-                        "Code Background",
-                        label_font_size="16px",
-                        label_field_width=100,
-                        frame_type=frame_type_select,
-                    )
+                    st.markdown("")
 
-                    theme_color_picker(
-                        "dataframeHeaderBackgroundColor",
-                        "DataFrame Header",
-                        label_font_size="16px",
-                        label_field_width=100,
-                        frame_type=frame_type_select,
-                    )
+            # TODO: Expander BG Color
+            with st_yled.expander(
+                "More Color Options",
+                key="theme-color-ext-expander",
+                border_style="none",
+                padding="0px",
+                background_color=uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT,
+            ):
+                color_ext_cont = st.container(key="theme-color-ext-container")
+
+                col1, col2 = color_ext_cont.columns([2, 1])
+
+                with col1:
+                    with st_yled.container(key="color-ext-selectors", padding="16px"):
+                        theme_color_picker(
+                            "linkColor",
+                            "Link",
+                            label_font_size="16px",
+                            label_field_width=100,
+                            frame_type=frame_type_select,
+                        )
 
-                    theme_color_picker(
-                        "dataframeBorderColor",
-                        "DataFrame Border",
-                        label_font_size="16px",
-                        label_field_width=100,
-                        frame_type=frame_type_select,
-                    )
+                        theme_color_picker(
+                            "codeBackgroundColor",
+                            "Code Background",
+                            label_font_size="16px",
+                            label_field_width=100,
+                            frame_type=frame_type_select,
+                        )
 
-            with col2:
-                with st_yled.container(
-                    key="color-ext-preview",
-                    background_color=st.session_state[
-                        f"{preview_selector_prefix}-backgroundColor"
-                    ],
-                    border=False,
-                    padding="16px",
-                ):
-                    st_yled.markdown(
-                        "[Link Color](https://www.google.com)",
-                        color=st.session_state[f"{preview_selector_prefix}-linkColor"],
-                        key="linkcolor-preview",
-                    )
+                        theme_color_picker(
+                            "dataframeHeaderBackgroundColor",
+                            "DataFrame Header",
+                            label_font_size="16px",
+                            label_field_width=100,
+                            frame_type=frame_type_select,
+                        )
 
-                    st_yled.code(
-                        '# Code Background\nprint("Hello")',
-                        background_color=st.session_state[
-                            f"{preview_selector_prefix}-codeBackgroundColor"
-                        ],
-                    )
+                        theme_color_picker(
+                            "dataframeBorderColor",
+                            "DataFrame Border",
+                            label_font_size="16px",
+                            label_field_width=100,
+                            frame_type=frame_type_select,
+                        )
 
+                with col2:
                     with st_yled.container(
-                        key="dataframe-border-color-preview",
-                        border_width="3px",
-                        border_style="solid",
-                        border_color=st.session_state[
-                            f"{preview_selector_prefix}-dataframeBorderColor"
+                        key="color-ext-preview",
+                        background_color=theme_state[
+                            f"{preview_selector_prefix}-backgroundColor"
                         ],
-                        padding="8px",
+                        border=False,
+                        padding="16px",
                     ):
+                        st_yled.markdown(
+                            "[Link Color](https://www.google.com)",
+                            color=theme_state[f"{preview_selector_prefix}-linkColor"],
+                            key="linkcolor-preview",
+                        )
+
+                        st_yled.code(
+                            '# Code Background\nprint("Hello")',
+                            background_color=theme_state[
+                                f"{preview_selector_prefix}-codeBackgroundColor"
+                            ],
+                        )
+
                         with st_yled.container(
-                            background_color=st.session_state[
-                                f"{preview_selector_prefix}-dataframeHeaderBackgroundColor"
+                            key="dataframe-border-color-preview",
+                            border_width="3px",
+                            border_style="solid",
+                            border_color=theme_state[
+                                f"{preview_selector_prefix}-dataframeBorderColor"
                             ],
-                            key="dataframe-header-background-preview",
+                            padding="8px",
                         ):
-                            st_yled.markdown("", width=24)
+                            with st_yled.container(
+                                background_color=theme_state[
+                                    f"{preview_selector_prefix}-dataframeHeaderBackgroundColor"
+                                ],
+                                key="dataframe-header-background-preview",
+                            ):
+                                st_yled.markdown("", width=24)
 
     # region Font Tabs
-    with tab_font:
-        frame_type_select, preview_selector_prefix = frame_select_reset_bar(
-            key="theme-font-frame-reset-bar",
-            reset_keys=[
-                "font",
-                "headingFont",
-                "baseFontSize",
-                "baseFontWeight",
-                "codeFont",
-                "codeFontSize",
-                "codeFontWeight",
-            ],
-        )
+    if tab_font.open:
+        with tab_font:
+            frame_type_select, preview_selector_prefix = frame_select_reset_bar(
+                key="theme-font-frame-reset-bar",
+                tab="Font",
+            )
 
-        font_cont = st.container(key="theme-font-container")
+            font_cont = st.container(key="theme-font-container")
 
-        with font_cont:
-            with st_yled.container(
-                key="theme-base-font-container", horizontal=True, gap="large"
-            ):
+            with font_cont:
                 with st_yled.container(
-                    key="theme-base-font-input-container",
-                    horizontal=True,
-                    horizontal_alignment="left",
+                    key="theme-base-font-container", horizontal=True, gap="large"
                 ):
-                    theme_font_input(
-                        "font",
-                        "Base Font",
-                        frame_type=frame_type_select,
-                        key="theme-base-font-input",
-                    )
-
-                # Get preview font, size and weight
-                preview_font = st.session_state[f"{preview_selector_prefix}-font"]
-
-                if frame_type_select == "main":
-                    preview_size = st.session_state[
-                        f"{preview_selector_prefix}-baseFontSize"
-                    ]
-                    preview_weight = st.session_state[
-                        f"{preview_selector_prefix}-baseFontWeight"
-                    ]
-                else:
-                    preview_size = 16
-                    preview_weight = 400
-
-                # Show Preview, only if one of default fonts(sans-serif, serif, monospace) is selected. Skip for Google Fonts.
-                if preview_font in ["sans-serif", "serif", "monospace"]:
-                    with st.container(
-                        key="theme-base-font-weight-input-container",
-                        horizontal_alignment="right",
-                        vertical_alignment="bottom",
+                    with st_yled.container(
+                        key="theme-base-font-input-container",
+                        horizontal=True,
+                        horizontal_alignment="left",
                     ):
-                        st.html(
-                            f"<span style='font-family:{preview_font}; font-size:{preview_size}px; font-weight:{preview_weight};'>Base Font Preview</span>"
+                        theme_font_input(
+                            "font",
+                            "Base Font",
+                            frame_type=frame_type_select,
+                            key="theme-base-font-input",
                         )
-                        st_yled.divider()
 
-            with st_yled.container(
-                key="theme-heading-font-container", horizontal=True, gap="large"
-            ):
+                    # Get preview font, size and weight
+                    preview_font = theme_state[f"{preview_selector_prefix}-font"]
+
+                    if frame_type_select == "main":
+                        preview_size = theme_state[
+                            f"{preview_selector_prefix}-baseFontSize"
+                        ]
+                        preview_weight = theme_state[
+                            f"{preview_selector_prefix}-baseFontWeight"
+                        ]
+                    else:
+                        preview_size = 16
+                        preview_weight = 400
+
+                    # Show Preview, only if one of default fonts(sans-serif, serif, monospace) is selected. Skip for Google Fonts.
+                    if preview_font in uiconfig.FONT_FAMILY_OPTIONS:
+                        with st.container(
+                            key="theme-base-font-weight-input-container",
+                            horizontal_alignment="right",
+                            vertical_alignment="bottom",
+                        ):
+                            st.html(
+                                f"<span style='font-family:{preview_font}; font-size:{preview_size}px; font-weight:{preview_weight};'>Base Font Preview</span>"
+                            )
+                            st_yled.divider()
+
                 with st_yled.container(
-                    key="theme-heading-font-input-container",
-                    horizontal=True,
-                    horizontal_alignment="left",
+                    key="theme-heading-font-container", horizontal=True, gap="large"
                 ):
-                    theme_font_input(
-                        "headingFont",
-                        "Heading Font",
-                        frame_type=frame_type_select,
-                        key="theme-heading-font-input",
-                    )
-
-                heading_preview_font = st.session_state[
-                    f"{preview_selector_prefix}-headingFont"
-                ]
-
-                # Show Preview, only if one of default fonts(sans-serif, serif, monospace) is selected. Skip for Google Fonts.
-                if heading_preview_font in ["sans-serif", "serif", "monospace"]:
-                    with st.container(
-                        key="theme-heading-font-weight-input-container",
-                        horizontal_alignment="right",
-                        vertical_alignment="bottom",
+                    with st_yled.container(
+                        key="theme-heading-font-input-container",
+                        horizontal=True,
+                        horizontal_alignment="left",
                     ):
-                        st.html(
-                            f"<span style='font-family:{heading_preview_font}; font-size:20px; font-weight:600;'>Heading Font Preview</span>"
+                        theme_font_input(
+                            "headingFont",
+                            "Heading Font",
+                            frame_type=frame_type_select,
+                            key="theme-heading-font-input",
                         )
-                        st_yled.divider()
 
-            if frame_type_select == "main":
-                theme_size_input(
-                    "baseFontSize",
-                    "Base Size",
-                    frame_type=frame_type_select,
-                    return_value_type="int",
-                    allowed_units=["px"],
-                )
-                theme_weight_input(
-                    "baseFontWeight", "Base Weight", frame_type=frame_type_select
-                )
+                    heading_preview_font = theme_state[
+                        f"{preview_selector_prefix}-headingFont"
+                    ]
 
-        with st_yled.expander(
-            "More Font Options",
-            key="theme-font-ext-expander",
-            border_width="0px",
-            padding="0px",
-            background_color=uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT,
-        ):
-            font_ext_cont = st.container(key="theme-font-ext-container")
-
-            with font_ext_cont:
-                theme_font_input(
-                    "codeFont",
-                    "Code Font",
-                    label_font_size="16px",
-                    label_field_width=120,
-                    frame_type=frame_type_select,
-                )
+                    # Show Preview, only if one of default fonts(sans-serif, serif, monospace) is selected. Skip for Google Fonts.
+                    if heading_preview_font in uiconfig.FONT_FAMILY_OPTIONS:
+                        with st.container(
+                            key="theme-heading-font-weight-input-container",
+                            horizontal_alignment="right",
+                            vertical_alignment="bottom",
+                        ):
+                            st.html(
+                                f"<span style='font-family:{heading_preview_font}; font-size:20px; font-weight:600;'>Heading Font Preview</span>"
+                            )
+                            st_yled.divider()
 
-                theme_size_input(
-                    "codeFontSize",
-                    "Code Size",
-                    label_font_size="16px",
-                    label_field_width=120,
-                    frame_type=frame_type_select,
-                    return_value_type="tuple",
-                    allowed_units=["px", "rem"],
-                )
+                if frame_type_select == "main":
+                    theme_size_input(
+                        "baseFontSize",
+                        "Base Size",
+                        frame_type=frame_type_select,
+                    )
+                    theme_weight_input(
+                        "baseFontWeight", "Base Weight", frame_type=frame_type_select
+                    )
 
-                theme_weight_input(
-                    "codeFontWeight",
-                    "Code Weight",
-                    label_font_size="16px",
-                    label_field_width=120,
-                    frame_type=frame_type_select,
-                )
+            with st_yled.expander(
+                "More Font Options",
+                key="theme-font-ext-expander",
+                border_width="0px",
+                padding="0px",
+                background_color=uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT,
+            ):
+                font_ext_cont = st.container(key="theme-font-ext-container")
 
-    # region Border Tab
+                with font_ext_cont:
+                    theme_font_input(
+                        "codeFont",
+                        "Code Font",
+                        label_font_size="16px",
+                        label_field_width=120,
+                        frame_type=frame_type_select,
+                    )
 
-    with tab_border:
-        frame_type_select, preview_selector_prefix = frame_select_reset_bar(
-            key="theme-border-frame-reset-bar",
-            reset_keys=[
-                "borderColor",
-                "showWidgetBorder",
-                "showSidebarBorder",
-            ],
-        )
+                    theme_size_input(
+                        "codeFontSize",
+                        "Code Size",
+                        label_font_size="16px",
+                        label_field_width=120,
+                        frame_type=frame_type_select,
+                    )
 
-        border_cont = st.container(key="theme-border-container")
+                    theme_weight_input(
+                        "codeFontWeight",
+                        "Code Weight",
+                        label_font_size="16px",
+                        label_field_width=120,
+                        frame_type=frame_type_select,
+                    )
 
-        col1, col2 = border_cont.columns([2, 1])
+    # region Border Tab
 
-        # Define Color Pickers
-        with col1.container(key="border-selectors"):
-            theme_color_picker(
-                "borderColor",
-                "Border Color",
-                label_font_size="20px",
-                frame_type=frame_type_select,
+    if tab_border.open:
+        with tab_border:
+            frame_type_select, preview_selector_prefix = frame_select_reset_bar(
+                key="theme-border-frame-reset-bar",
+                tab="Border",
             )
 
-            theme_checkbox(
-                "showWidgetBorder",
-                "Widget Border",
-                label_font_size="20px",
-                frame_type=frame_type_select,
-            )
+            border_cont = st.container(key="theme-border-container")
+
+            col1, col2 = border_cont.columns([2, 1])
+
+            # Define Color Pickers
+            with col1.container(key="border-selectors"):
+                theme_color_picker(
+                    "borderColor",
+                    "Border Color",
+                    label_font_size="20px",
+                    frame_type=frame_type_select,
+                )
 
-            if frame_type_select == "main":
                 theme_checkbox(
-                    "showSidebarBorder",
-                    "Sidebar Border",
+                    "showWidgetBorder",
+                    "Widget Border",
                     label_font_size="20px",
                     frame_type=frame_type_select,
                 )
 
-        # Preview Pane
-        with col2:
-            with st_yled.container(
-                key="border-preview",
-                background_color=st.session_state[
-                    f"{preview_selector_prefix}-backgroundColor"
-                ],
-                border=False,
-                padding="16px",
-            ):
-                # Border Color Preview
+                if frame_type_select == "main":
+                    theme_checkbox(
+                        "showSidebarBorder",
+                        "Sidebar Border",
+                        label_font_size="20px",
+                        frame_type=frame_type_select,
+                    )
+
+            # Preview Pane
+            with col2:
                 with st_yled.container(
-                    border_width="3px",
-                    border_style="solid",
-                    border_color=st.session_state[
-                        f"{preview_selector_prefix}-borderColor"
+                    key="border-preview",
+                    background_color=theme_state[
+                        f"{preview_selector_prefix}-backgroundColor"
                     ],
-                    key="bordercolor-preview",
-                    padding="8px",
+                    border=False,
+                    padding="16px",
                 ):
-                    st_yled.markdown("**Border Color**")
-
-                # Input Widget Border Preview
-                if st.session_state[f"{preview_selector_prefix}-showWidgetBorder"]:
-                    st_yled.text_input(
-                        "Input Widget Border",
-                        border_width="2px",
+                    # Border Color Preview
+                    with st_yled.container(
+                        border_width="3px",
                         border_style="solid",
-                        border_color=st.session_state[
+                        border_color=theme_state[
                             f"{preview_selector_prefix}-borderColor"
                         ],
-                    )
-                else:
-                    st_yled.text_input("Input Widget Border")
-
-                # Sidebar Border Preview
-                if frame_type_select == "main":
-                    with st_yled.container(
-                        key="sidebar-border-preview", width=120, horizontal=True
+                        key="bordercolor-preview",
+                        padding="8px",
                     ):
-                        if st.session_state[
-                            f"{preview_selector_prefix}-showSidebarBorder"
-                        ]:
-                            css = f"""
-                            .st-key-sidebar-border-box-preview {{
-                                border-right: 2px solid {st.session_state[f'{preview_selector_prefix}-borderColor']};
-                            }}
-                            """
-                            st.html(f"<style>{css}</style>")
-
-                        with st.container(width=40, key="sidebar-border-box-preview"):
-                            st.write(" ")
+                        st_yled.markdown("**Border Color**")
+
+                    # Input Widget Border Preview
+                    if theme_state[f"{preview_selector_prefix}-showWidgetBorder"]:
+                        st_yled.text_input(
+                            "Input Widget Border",
+                            border_width="2px",
+                            border_style="solid",
+                            border_color=theme_state[
+                                f"{preview_selector_prefix}-borderColor"
+                            ],
+                        )
+                    else:
+                        st_yled.text_input("Input Widget Border")
 
-    # region Radius Tab
+                    # Sidebar Border Preview
+                    if frame_type_select == "main":
+                        with st_yled.container(
+                            key="sidebar-border-preview", width=120, horizontal=True
+                        ):
+                            if theme_state[
+                                f"{preview_selector_prefix}-showSidebarBorder"
+                            ]:
+                                css = f"""
+                                .st-key-sidebar-border-box-preview {{
+                                    border-right: 2px solid {theme_state[f'{preview_selector_prefix}-borderColor']};
+                                }}
+                                """
+                                st.html(f"<style>{css}</style>")
+
+                            with st.container(width=40, key="sidebar-border-box-preview"):
+                                st.write(" ")
 
-    with tab_radius:
-        frame_type_select, preview_selector_prefix = frame_select_reset_bar(
-            key="theme-radius-frame-reset-bar",
-            reset_keys=[
-                "baseRadius",
-                "buttonRadius",
-            ],
-        )
+    # region Radius Tab
 
-        radius_cont = st.container(key="theme-radius-container")
+    if tab_radius.open:
+        with tab_radius:
+            frame_type_select, preview_selector_prefix = frame_select_reset_bar(
+                key="theme-radius-frame-reset-bar",
+                tab="Radius",
+            )
 
-        col1, col2 = radius_cont.columns([2, 1])
+            radius_cont = st.container(key="theme-radius-container")
 
-        # Define Radius Selectors
-        with col1.container(key="radius-selectors"):
-            theme_size_input(
-                "baseRadius",
-                "Base Radius",
-                label_font_size="20px",
-                frame_type=frame_type_select,
-            )
-            theme_size_input(
-                "buttonRadius",
-                "Button Radius",
-                label_font_size="20px",
-                frame_type=frame_type_select,
-            )
+            col1, col2 = radius_cont.columns([2, 1])
 
-        # Preview Pane
-        with col2:
-            with st_yled.container(
-                key="radius-preview",
-            ):
-                base_radius_val = st.session_state[
-                    f"{preview_selector_prefix}-baseRadius"
-                ][0]
-                base_radius_unit = st.session_state[
-                    f"{preview_selector_prefix}-baseRadius"
-                ][1]
-
-                css = f"""
-                .st-key-radius-preview-base {{
-                    border-radius: {base_radius_val}{base_radius_unit};
-                    width: calc(100% - 48px);
-                }}
-                """
-                st.html(f"<style>{css}</style>")
+            # Define Radius Selectors
+            with col1.container(key="radius-selectors"):
+                theme_size_input(
+                    "baseRadius",
+                    "Base Radius",
+                    label_font_size="20px",
+                    frame_type=frame_type_select,
+                )
+                theme_size_input(
+                    "buttonRadius",
+                    "Button Radius",
+                    label_font_size="20px",
+                    frame_type=frame_type_select,
+                )
 
+            # Preview Pane
+            with col2:
                 with st_yled.container(
-                    key="radius-preview-base",
-                    height=68,
-                    background_color=st.session_state[
-                        f"{preview_selector_prefix}-primaryColor"
-                    ],
+                    key="radius-preview",
                 ):
-                    st_yled.markdown(
-                        "**Base Radius**", color="#FFFFFF", width="content"
-                    )
+                    base_radius_val = theme_state[
+                        f"{preview_selector_prefix}-baseRadius"
+                    ][0]
+                    base_radius_unit = theme_state[
+                        f"{preview_selector_prefix}-baseRadius"
+                    ][1]
+
+                    css = f"""
+                    .st-key-radius-preview-base {{
+                        border-radius: {base_radius_val}{base_radius_unit};
+                        width: calc(100% - 48px);
+                    }}
+                    """
+                    st.html(f"<style>{css}</style>")
 
-                button_radius_val = st.session_state[
-                    f"{preview_selector_prefix}-buttonRadius"
-                ][0]
-                button_radius_unit = st.session_state[
-                    f"{preview_selector_prefix}-buttonRadius"
-                ][1]
+                    with st_yled.container(
+                        key="radius-preview-base",
+                        height=68,
+                        background_color=theme_state[
+                            f"{preview_selector_prefix}-primaryColor"
+                        ],
+                    ):
+                        st_yled.markdown(
+                            "**Base Radius**", color="#FFFFFF", width="content"
+                        )
 
-                css = f"""
-                .st-key-radius-preview-button button {{
-                    border-radius: {button_radius_val}{button_radius_unit};
-                }}
-                """
+                    button_radius_val = theme_state[
+                        f"{preview_selector_prefix}-buttonRadius"
+                    ][0]
+                    button_radius_unit = theme_state[
+                        f"{preview_selector_prefix}-buttonRadius"
+                    ][1]
 
-                st.html(f"<style>{css}</style>")
+                    css = f"""
+                    .st-key-radius-preview-button button {{
+                        border-radius: {button_radius_val}{button_radius_unit};
+                    }}
+                    """
 
-                st_yled.button(
-                    "Button Radius", key="radius-preview-button", type="primary"
-                )
+                    st.html(f"<style>{css}</style>")
+
+                    st_yled.button(
+                        "Button Radius", key="radius-preview-button", type="primary"
+                    )
@@ -0,0 +1,164 @@
+from typing import Hashable, Iterator, Optional
+
+# Hash bits consumed per trie level, nodes hold 2**NODE_BITS slots
+NODE_BITS = 3
+NODE_WIDTH = 1 << NODE_BITS
+NODE_MASK = NODE_WIDTH - 1
+HASH_MASK = (1 << 64) - 1
+
+# Value of a change which removes the key
+REMOVED = object()
+
+
+class _Leaf:
+    """Entries of one key hash, several only on hash collisions"""
+
+    __slots__ = ("key_hash", "entries")
+
+    def __init__(self, key_hash: int, entries: tuple):
+        self.key_hash = key_hash
+        self.entries = entries
+
+
+def _slot(key_hash: int, shift: int) -> int:
+    return (key_hash >> shift) & NODE_MASK
+
+
+def _replace(node: tuple, ix: int, slot) -> tuple:
+    return node[:ix] + (slot,) + node[ix + 1 :]
+
+
+def _set(node: tuple, shift: int, key_hash: int, key, value) -> tuple[tuple, bool]:
+    # Returns the copied node and whether the key was added
+    ix = _slot(key_hash, shift)
+    slot = node[ix]
+
+    if slot is None:
+        return _replace(node, ix, _Leaf(key_hash, ((key, value),))), True
+
+    if isinstance(slot, _Leaf):
+        if slot.key_hash == key_hash:
+            entries = tuple((k, v) for k, v in slot.entries if k != key)
+            added = len(entries) == len(slot.entries)
+            return _replace(node, ix, _Leaf(key_hash, entries + ((key, value),))), added
+
+        # Different hashes sharing a slot move one level down
+        child_ix = _slot(slot.key_hash, shift + NODE_BITS)
+        child = _replace((None,) * NODE_WIDTH, child_ix, slot)
+    else:
+        child = slot
+
+    child, added = _set(child, shift + NODE_BITS, key_hash, key, value)
+    return _replace(node, ix, child), added
+
+
+def _delete(node: tuple, shift: int, key_hash: int, key) -> Optional[tuple]:
+    # Returns the copied node or None if the key is missing
+    ix = _slot(key_hash, shift)
+    slot = node[ix]
+
+    if slot is None:
+        return None
+
+    if isinstance(slot, _Leaf):
+        if slot.key_hash != key_hash or all(k != key for k, _ in slot.entries):
+            return None
+        entries = tuple((k, v) for k, v in slot.entries if k != key)
+        return _replace(node, ix, _Leaf(key_hash, entries) if entries else None)
+
+    child = _delete(slot, shift + NODE_BITS, key_hash, key)
+    if child is None:
+        return None
+
+    # A node left with a single leaf is replaced by the leaf
+    remaining = [s for s in child if s is not None]
+    if not remaining:
+        child = None
+    elif len(remaining) == 1 and isinstance(remaining[0], _Leaf):
+        child = remaining[0]
+    return _replace(node, ix, child)
+
+
+def _iter_entries(node: tuple) -> Iterator:
+    for slot in node:
+        if slot is None:
+            continue
+        if isinstance(slot, _Leaf):
+            yield from slot.entries
+        else:
+            yield from _iter_entries(slot)
+
+
+class PersistentMap:
+    """Immutable mapping sharing unchanged nodes between versions
+
+    Keys are stored in a trie over their hash, each level consumes NODE_BITS
+    bits. set() and delete() return a new map which copies only the nodes on
+    the path to the key, NODE_WIDTH slots per level, and references all
+    other nodes of the old map. A version costs O(log n) per changed key.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: Optional[tuple] = None, size: int = 0):
+        self._root = root or (None,) * NODE_WIDTH
+        self._size = size
+
+    def __getitem__(self, key: Hashable):
+        value = self.get(key, REMOVED)
+        if value is REMOVED:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, REMOVED) is not REMOVED
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        for key, _ in self.items():
+            yield key
+
+    def get(self, key: Hashable, default=None):
+        key_hash = hash(key) & HASH_MASK
+        node = self._root
+        shift = 0
+
+        while True:
+            slot = node[_slot(key_hash, shift)]
+            if slot is None:
+                return default
+            if isinstance(slot, _Leaf):
+                if slot.key_hash == key_hash:
+                    for k, v in slot.entries:
+                        if k == key:
+                            return v
+                return default
+            node = slot
+            shift += NODE_BITS
+
+    def items(self) -> Iterator:
+        return _iter_entries(self._root)
+
+    def set(self, key: Hashable, value) -> "PersistentMap":
+        """Return a new map with key set to value"""
+        root, added = _set(self._root, 0, hash(key) & HASH_MASK, key, value)
+        return PersistentMap(root, self._size + added)
+
+    def delete(self, key: Hashable) -> "PersistentMap":
+        """Return a new map without key, the map itself if key is missing"""
+        root = _delete(self._root, 0, hash(key) & HASH_MASK, key)
+        if root is None:
+            return self
+        return PersistentMap(root, self._size - 1)
+
+    def update(self, changes: dict) -> "PersistentMap":
+        """Return a new map with changes applied, REMOVED values delete keys"""
+        result = self
+        for key, value in changes.items():
+            if value is REMOVED:
+                result = result.delete(key)
+            else:
+                result = result.set(key, value)
+        return result
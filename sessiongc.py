@@ -0,0 +1,118 @@
+import logging
+import re
+import sys
+from typing import Optional
+
+import streamlit as st
+
+import uiconfig
+from elementstate import get_element_cards
+
+logger = logging.getLogger(__name__)
+
+UUID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+# Input widget keys built as <base>-<widget>-<seed>, e.g.
+# 'theme-primaryColor-picker-<uuid>' or 'element-<uuid>-primary-color-number-<uuid>'
+SEEDED_WIDGET_KEY_PATTERN = re.compile(
+    rf"^(?P<base>.+)-(?P<widget>picker|code|number|unit|selectbox|checkbox"
+    rf"|font-select|font-family|font-url)"
+    rf"-(?P<seed>{UUID_PATTERN})$"
+)
+UUID_KEY_PATTERN = re.compile(UUID_PATTERN)
+
+
+def get_current_seeds() -> set[str]:
+    """Return the seeds of all input widgets rendered with current values"""
+    seeds = {
+        value
+        for key, value in st.session_state.items()
+        if isinstance(key, str) and key.endswith("-seed") and isinstance(value, str)
+    }
+    seeds.update(element_card.seed for element_card in get_element_cards().values())
+    return seeds
+
+
+def collect_stale_widget_keys() -> int:
+    """Delete widget states of seeds which are no longer current
+
+    Streamlit drops states of widgets not rendered in a full run, widgets
+    left behind by fragment reruns or resets are removed here. Called at
+    the end of each full run, returns the number of deleted keys.
+    """
+    current_seeds = get_current_seeds()
+
+    stale_keys = []
+    for key in st.session_state.keys():
+        # Session state accepts keys of any type, widget keys are strings
+        if not isinstance(key, str):
+            continue
+        match = SEEDED_WIDGET_KEY_PATTERN.match(key)
+        if match and match.group("seed") not in current_seeds:
+            stale_keys.append(key)
+
+    for key in stale_keys:
+        del st.session_state[key]
+
+    key_count = len(st.session_state.keys())
+    if key_count > uiconfig.SESSION_KEYS_WARNING_LIMIT:
+        logger.warning("Session holds %d keys after widget key collection", key_count)
+
+    return len(stale_keys)
+
+
+def approx_size(value, seen: Optional[set] = None) -> int:
+    """Approximate deep size in bytes of a session value"""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(
+            approx_size(k, seen) + approx_size(v, seen) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item, seen) for item in value)
+    elif hasattr(value, "__slots__"):
+        size += sum(
+            approx_size(getattr(value, slot), seen)
+            for slot in value.__slots__
+            if hasattr(value, slot)
+        )
+    elif hasattr(value, "__dict__"):
+        size += approx_size(vars(value), seen)
+
+    return size
+
+
+def key_prefix(key: str) -> str:
+    """Group a session key by its family, e.g. 'element-*-picker'"""
+    match = SEEDED_WIDGET_KEY_PATTERN.match(key)
+    if match:
+        return f"{key.split('-', 1)[0]}-*-{match.group('widget')}"
+    if key.endswith("-seed"):
+        return f"{key.split('-', 1)[0]}-*-seed"
+    return UUID_KEY_PATTERN.sub("*", key)
+
+
+def session_memory_report() -> list[dict]:
+    """Return key count and approximate bytes of the session by key prefix
+
+    Rows are sorted by bytes, largest first.
+    """
+    report: dict[str, dict] = {}
+    for key in st.session_state.keys():
+        prefix = key_prefix(key) if isinstance(key, str) else type(key).__name__
+        row = report.setdefault(prefix, {"keys": 0, "bytes": 0})
+        row["keys"] += 1
+        row["bytes"] += sys.getsizeof(key) + approx_size(st.session_state[key])
+
+    return sorted(
+        ({"prefix": prefix, **row} for prefix, row in report.items()),
+        key=lambda row: row["bytes"],
+        reverse=True,
+    )
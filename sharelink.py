@@ -0,0 +1,215 @@
+import base64
+import binascii
+import json
+import zlib
+from dataclasses import dataclass
+from typing import Iterable
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from configimport import convert_value
+from elementregistry import get_element_registry
+from elementstate import (
+    get_element_cards,
+    is_valid_element_value,
+    replace_element_cards,
+)
+from themeschema import THEME_PROPERTIES
+from themestate import get_theme_state, replace_theme_values
+
+SHARE_LINK_VERSION = 1
+
+# Query parameter holding the encoded state, e.g. ?s=eNqrVkrLz...
+SHARE_QUERY_PARAM = "s"
+
+# Token of the state last written to or read from the query parameter
+SHARE_TOKEN_KEY = "share-link-token"
+
+# Upper bound of a decoded payload, larger links are rejected before parsing
+SHARE_PAYLOAD_MAX_BYTES = 64 * 1024
+
+THEME_KEY_PREFIX = "theme-"
+
+
+@dataclass(frozen=True)
+class ShareState:
+    """Theme and element state decoded from a share link
+
+    theme maps theme state keys to values in the editor format, e.g.
+    {'theme-baseRadius': (0.5, 'rem')}. elements lists element cards as
+    (element name, styles by variant) in card order.
+    """
+
+    theme: dict
+    elements: tuple
+
+
+def _encode_theme_value(value):
+    # Sizes are written as in config.toml, e.g. '0.5rem'
+    if isinstance(value, tuple):
+        size_value, size_unit = value
+        return f"{size_value}{size_unit}"
+    return value
+
+
+def encode_share_state(changed_theme: dict, element_cards: Iterable) -> str:
+    """Encode the delta of a session against the defaults into a url-safe token
+
+    Only changed theme values and cards with styles are written, keys are
+    sorted so that the same state always gives the same token.
+    """
+    theme = {
+        key.removeprefix(THEME_KEY_PREFIX): _encode_theme_value(value)
+        for key, value in changed_theme.items()
+    }
+    elements = [
+        [
+            card.name,
+            {variant: values for variant, values in card.styles.items() if values},
+        ]
+        for card in element_cards
+        if any(card.styles.values())
+    ]
+
+    payload = json.dumps(
+        [SHARE_LINK_VERSION, theme, elements], sort_keys=True, separators=(",", ":")
+    )
+    compressed = zlib.compress(payload.encode(), level=9)
+    return base64.urlsafe_b64encode(compressed).decode("ascii").rstrip("=")
+
+
+def _decompress(token: str) -> bytes:
+    try:
+        compressed = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Share link is not valid base64") from e
+
+    decompressor = zlib.decompressobj()
+    try:
+        payload = decompressor.decompress(compressed, SHARE_PAYLOAD_MAX_BYTES)
+    except zlib.error as e:
+        raise ValueError("Share link is not valid") from e
+
+    if decompressor.unconsumed_tail:
+        raise ValueError("Share link is too large")
+    if not decompressor.eof:
+        raise ValueError("Share link is incomplete")
+    return payload
+
+
+def decode_share_state(token: str) -> ShareState:
+    """Decode a share link token, unknown properties and elements are dropped
+
+    Values are checked against the input of their property, e.g. colors must
+    be hex colors, invalid values are dropped as well.
+
+    Raises:
+        ValueError: if the token is malformed or of another version
+    """
+    payload = _decompress(token)
+    try:
+        version, theme, elements = json.loads(payload)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Share link is not valid: {e}") from e
+
+    if version != SHARE_LINK_VERSION:
+        raise ValueError(f"Unsupported share link version {version}")
+    if not isinstance(theme, dict) or not isinstance(elements, list):
+        raise ValueError("Share link is not valid")
+
+    theme_values = {}
+    for key, value in theme.items():
+        theme_key = THEME_KEY_PREFIX + key
+        if theme_key in THEME_PROPERTIES:
+            try:
+                theme_values[theme_key] = convert_value(
+                    value, THEME_PROPERTIES[theme_key]
+                )
+            except ValueError:
+                continue
+
+    registry = get_element_registry()
+    element_styles = []
+    for element in elements:
+        if not isinstance(element, list) or len(element) != 2:
+            continue
+        name, styles = element
+        if name not in registry.variants or not isinstance(styles, dict):
+            continue
+
+        card_styles = {}
+        for variant, values in styles.items():
+            if variant not in registry.variants[name] or not isinstance(values, dict):
+                continue
+            properties = registry.get(name, variant).properties
+            card_styles[variant] = {
+                prop: value
+                for prop, value in values.items()
+                if prop in properties and is_valid_element_value(prop, value)
+            }
+        element_styles.append((name, card_styles))
+
+    return ShareState(theme=theme_values, elements=tuple(element_styles))
+
+
+def hydrate_session(share_state: ShareState):
+    """Replace theme and element state of the session in one step"""
+    replace_theme_values(share_state.theme)
+    replace_element_cards(
+        (None, name, styles) for name, styles in share_state.elements
+    )
+
+
+def sync_query_params():
+    """Hydrate the session from a new share link, else write the session state
+
+    Called once per full run. A token differing from the one last seen is a
+    newly opened link, the session state is then replaced by the link.
+    """
+    token = st.query_params.get(SHARE_QUERY_PARAM)
+
+    if token and token != st.session_state.get(SHARE_TOKEN_KEY):
+        st.session_state[SHARE_TOKEN_KEY] = token
+        try:
+            hydrate_session(decode_share_state(token))
+        except ValueError as e:
+            st.toast(str(e), icon=":material/error:")
+        return
+
+    write_query_params()
+
+
+def write_query_params():
+    """Write the state of the session to the query parameter if it changed
+
+    Called by sync_query_params once per full run and by
+    write_fragment_query_params.
+    """
+    token = st.query_params.get(SHARE_QUERY_PARAM)
+    changed_theme = get_theme_state().changed()
+    element_cards = list(get_element_cards().values())
+
+    if not changed_theme and not any(any(card.styles.values()) for card in element_cards):
+        st.session_state.pop(SHARE_TOKEN_KEY, None)
+        st.query_params.pop(SHARE_QUERY_PARAM, None)
+        return
+
+    share_token = encode_share_state(changed_theme, element_cards)
+    st.session_state[SHARE_TOKEN_KEY] = share_token
+
+    if token != share_token:
+        st.query_params[SHARE_QUERY_PARAM] = share_token
+
+
+def write_fragment_query_params():
+    """Write the share link at the end of a fragment rerun
+
+    Card edits rerun only their fragment and skip sync_query_params. On full
+    runs all card fragments run and the link is already written once.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None or not ctx.fragment_ids_this_run:
+        return
+
+    write_query_params()
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+import colorengine
+
+
+def hex_with_alpha_to_hex(hex_color, bg_color="#FFFFFF"):
+    """Converter replaced by colorengine, kept as reference"""
+    hex_color = hex_color.strip("#")
+    bg_color = bg_color.strip("#")
+
+    if len(hex_color) == 8:
+        r_fg, g_fg, b_fg, a = [int(hex_color[i : i + 2], 16) for i in (0, 2, 4, 6)]
+    elif len(hex_color) == 4:  # shorthand #RGBA
+        r_fg, g_fg, b_fg, a = [int(hex_color[i] * 2, 16) for i in range(4)]
+    else:
+        raise ValueError("Expected #RRGGBBAA or #RGBA format.")
+
+    r_bg, g_bg, b_bg = [int(bg_color[i : i + 2], 16) for i in (0, 2, 4)]
+
+    alpha = a / 255.0
+    r_out = round((1 - alpha) * r_bg + alpha * r_fg)
+    g_out = round((1 - alpha) * g_bg + alpha * g_fg)
+    b_out = round((1 - alpha) * b_bg + alpha * b_fg)
+
+    return f"#{r_out:02X}{g_out:02X}{b_out:02X}"
+
+
+def test_parity_with_old_converter():
+    rng = random.Random(0)
+    colors = [f"#{rng.getrandbits(32):08x}" for _ in range(500)]
+    colors += [f"#{rng.getrandbits(16):04X}" for _ in range(500)]
+    backgrounds = [f"#{rng.getrandbits(24):06x}" for _ in colors]
+
+    assert colorengine.resolve_colors(colors, backgrounds) == [
+        hex_with_alpha_to_hex(color, background)
+        for color, background in zip(colors, backgrounds)
+    ]
+
+
+def test_opaque_and_short_colors():
+    assert colorengine.resolve_colors(["#abc", "#A1B2C3", "#31333f20"]) == [
+        "#AABBCC",
+        "#A1B2C3",
+        hex_with_alpha_to_hex("#31333f20"),
+    ]
+    assert colorengine.resolve_color("#00000080", "#FFFFFF") == "#7F7F7F"
+
+
+def test_invalid_color():
+    with pytest.raises(ValueError):
+        colorengine.resolve_colors(["#12345"])
+    with pytest.raises(ValueError):
+        colorengine.resolve_colors(["#gggggg"])
+
+
+def test_contrast_ratio():
+    ratios = colorengine.contrast_matrix(
+        colorengine.blend_colors(["#000000", "#FFFFFF", "#777777"])
+    )
+
+    assert ratios[0, 1] == pytest.approx(21.0)
+    assert ratios[1, 0] == pytest.approx(21.0)
+    assert ratios[0, 0] == pytest.approx(1.0)
+    # WCAG reference value of #777777 on white
+    assert ratios[1, 2] == pytest.approx(4.48, abs=0.01)
@@ -0,0 +1,84 @@
+import os
+
+import uiconfig
+from configimport import parse_config_toml
+from configtemplate import load_config_template
+from themeschema import THEME_DEFAULTS, THEME_PROPERTIES
+
+
+def render(values: dict) -> str:
+    template = load_config_template(uiconfig.CONFIG_TOML_TEMPLATE_PATH)
+    config_toml, _, _ = template.render(
+        {key: THEME_PROPERTIES[key].to_toml(value) for key, value in values.items()}
+    )
+    return config_toml
+
+
+def test_round_trip():
+    values = {
+        "theme-primaryColor": "#1a73e8",
+        "theme-sidebar-textColor": "#22222280",
+        "theme-baseRadius": (0.75, "rem"),
+        "theme-baseFontSize": 14,
+        "theme-showWidgetBorder": True,
+        "theme-font": "'Inter':https://fonts.googleapis.com/css2?family=Inter",
+    }
+
+    config_import = parse_config_toml(render(values))
+
+    assert config_import.values == values
+    assert config_import.skipped == ()
+
+
+def test_round_trip_of_all_defaults():
+    defaults = {key: THEME_DEFAULTS[key] for key in THEME_PROPERTIES}
+
+    config_import = parse_config_toml(render(defaults))
+
+    assert config_import.values == defaults
+
+
+def test_sections_are_rendered_in_template_order():
+    template = load_config_template(uiconfig.CONFIG_TOML_TEMPLATE_PATH)
+
+    _, theme_lines, sidebar_lines = template.render(
+        {
+            "theme-textColor": '"#000000"',
+            "theme-primaryColor": '"#1a73e8"',
+            "theme-sidebar-primaryColor": '"#00ff00"',
+            "theme-unknownKey": '"ignored"',
+        }
+    )
+
+    assert theme_lines == 'primaryColor = "#1a73e8"\ntextColor = "#000000"'
+    assert sidebar_lines == 'primaryColor = "#00ff00"'
+
+
+def test_unsupported_values_are_skipped():
+    config_import = parse_config_toml(
+        "[theme]\n"
+        'primaryColor = "red"\n'
+        'baseRadius = "2em"\n'
+        'textColor = "#000000"\n'
+        "unknownKey = 1\n"
+    )
+
+    assert config_import.values == {"theme-textColor": "#000000"}
+    assert [line.split(":")[0] for line in config_import.skipped] == [
+        "theme.primaryColor",
+        "theme.baseRadius",
+        "theme.unknownKey",
+    ]
+
+
+def test_template_is_recompiled_on_change(tmp_path):
+    template_path = tmp_path / "config.toml"
+    template_path.write_text("[theme]\n# primaryColor =\n")
+    first = load_config_template(str(template_path))
+
+    template_path.write_text("[theme]\n\n# textColor =\n")
+    os.utime(template_path, ns=(0, os.stat(template_path).st_mtime_ns + 1))
+    second = load_config_template(str(template_path))
+
+    assert dict(first.slots) == {("theme", "primaryColor"): 1}
+    assert dict(second.slots) == {("theme", "textColor"): 2}
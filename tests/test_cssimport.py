@@ -0,0 +1,58 @@
+import cssimport
+from elementregistry import get_element_registry
+
+
+def make_css(element: str, variant: str, values: dict) -> str:
+    element_style = get_element_registry().get(element, variant)
+    rules = []
+    for prop, value in values.items():
+        for selector, css_prop in element_style.targets[prop]:
+            rules.append(f"{selector} {{ {css_prop}: {value} !important; }}")
+    return "\n".join(rules)
+
+
+def test_round_trip():
+    values = {
+        "background_color": "#ff0000",
+        "color": "#ffffff80",
+        "font_size": "14.0px",
+        "font_weight": "700",
+        "border_style": "dashed",
+        "border_width": "2px",
+    }
+
+    css_import = cssimport.import_css(make_css("button", "primary", values))
+
+    assert css_import.styles == {"button": {"primary": values}}
+    assert css_import.unmatched == 0
+    assert css_import.skipped == ()
+
+
+def test_unsupported_values_are_skipped():
+    css = make_css(
+        "button",
+        "primary",
+        {
+            "color": "#00ff00",
+            "font_size": "2vw",
+            "border_style": "wavy",
+            "border_width": "0",
+        },
+    )
+
+    css_import = cssimport.import_css(css)
+
+    assert css_import.styles == {
+        "button": {"primary": {"color": "#00ff00", "border_width": "0px"}}
+    }
+    assert css_import.skipped == (
+        "button_primary.font_size: unsupported value '2vw'",
+        "button_primary.border_style: unsupported value 'wavy'",
+    )
+
+
+def test_unknown_declarations_are_counted():
+    css_import = cssimport.import_css(".unknown { color: red; } /* note */")
+
+    assert css_import.styles == {}
+    assert css_import.unmatched == 1
@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+import feedback
+from feedback import FeedbackOutbox, FeedbackWorker
+
+
+class StubTransport:
+    """Records sent messages, fails the first fail_count sends"""
+
+    def __init__(self, fail_count: int = 0):
+        self.fail_count = fail_count
+        self.sent = []
+
+    def send(self, subject: str, body: str) -> None:
+        if self.fail_count > 0:
+            self.fail_count -= 1
+            raise RuntimeError("send failed")
+        self.sent.append((subject, body))
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(feedback.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = FeedbackOutbox(str(tmp_path / "outbox.sqlite3"))
+    yield outbox
+    outbox.close()
+
+
+def outbox_rows(outbox: FeedbackOutbox) -> list[tuple]:
+    return outbox._conn.execute(
+        "SELECT status, attempts, next_attempt_at FROM outbox"
+    ).fetchall()
+
+
+def test_retry_with_backoff(outbox, clock):
+    transport = StubTransport(fail_count=2)
+    worker = FeedbackWorker(outbox, transport, base_delay=2.0, max_delay=300.0)
+    outbox.add("subject", "body")
+
+    worker.deliver_due()
+    assert outbox_rows(outbox) == [("pending", 1, clock.now + 2.0)]
+
+    # Not due before the backoff delay
+    clock.now += 1.0
+    worker.deliver_due()
+    assert outbox_rows(outbox)[0][1] == 1
+
+    clock.now += 1.0
+    worker.deliver_due()
+    assert outbox_rows(outbox) == [("pending", 2, clock.now + 4.0)]
+
+    clock.now += 4.0
+    worker.deliver_due()
+    assert transport.sent == [("subject", "body")]
+    assert outbox_rows(outbox) == []
+
+
+def test_backoff_delay_is_capped(outbox):
+    worker = FeedbackWorker(outbox, StubTransport(), base_delay=2.0, max_delay=10.0)
+    assert [worker.backoff_delay(n) for n in range(5)] == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+def test_mark_failed_after_max_attempts(outbox, clock):
+    transport = StubTransport(fail_count=10)
+    worker = FeedbackWorker(outbox, transport, max_attempts=3, max_delay=1.0)
+    outbox.add("subject", "body")
+
+    for _ in range(5):
+        worker.deliver_due()
+        clock.now += 1.0
+
+    status, attempts, _ = outbox_rows(outbox)[0]
+    assert (status, attempts) == ("failed", 3)
+    assert transport.fail_count == 7
+    assert outbox.next_due_at() is None
+
+
+def test_stop_drains_submitted_messages(outbox):
+    transport = StubTransport()
+    worker = FeedbackWorker(outbox, transport, poll_interval=60.0, warm_delay=60.0)
+    worker.start()
+
+    worker.submit("first", "body")
+    worker.submit("second", "body")
+    worker.stop()
+
+    assert sorted(subject for subject, _ in transport.sent) == ["first", "second"]
+
+
+def test_outbox_survives_restart(tmp_path):
+    db_path = str(tmp_path / "outbox.sqlite3")
+
+    outbox = FeedbackOutbox(db_path)
+    outbox.add("subject", "body")
+    outbox.close()
+
+    outbox = FeedbackOutbox(db_path)
+    transport = StubTransport()
+    FeedbackWorker(outbox, transport).deliver_due()
+
+    assert transport.sent == [("subject", "body")]
+    assert outbox.next_due_at() is None
+    outbox.close()
@@ -0,0 +1,78 @@
+import random
+
+from persistentmap import REMOVED, PersistentMap
+
+
+class CollidingKey:
+    """Key with a fixed hash, to store several keys in one leaf"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+
+def test_set_and_delete():
+    first = PersistentMap().set("a", 1).set("b", 2)
+    second = first.set("a", 3).delete("b")
+
+    assert dict(first.items()) == {"a": 1, "b": 2}
+    assert dict(second.items()) == {"a": 3}
+    assert len(first) == 2
+    assert len(second) == 1
+    assert "b" not in second
+    assert second.get("b") is None
+    assert second.delete("missing") is second
+
+
+def test_update_matches_dict():
+    rng = random.Random(0)
+    expected = {}
+    persistent = PersistentMap()
+
+    for _ in range(2000):
+        key = ("style", rng.randrange(300), rng.choice(["color", "font_size"]))
+        if rng.random() < 0.3:
+            expected.pop(key, None)
+            persistent = persistent.update({key: REMOVED})
+        else:
+            expected[key] = rng.random()
+            persistent = persistent.update({key: expected[key]})
+
+    assert dict(persistent.items()) == expected
+    assert len(persistent) == len(expected)
+    assert all(persistent[key] == value for key, value in expected.items())
+
+
+def test_hash_collisions():
+    a, b = CollidingKey("a"), CollidingKey("b")
+    persistent = PersistentMap().set(a, 1).set(b, 2).set(a, 3)
+
+    assert persistent[a] == 3
+    assert persistent[b] == 2
+    assert len(persistent) == 2
+    assert dict(persistent.delete(a).items()) == {b: 2}
+
+
+def test_unchanged_nodes_are_shared():
+    persistent = PersistentMap().update({key: key for key in range(1000)})
+    changed = persistent.set(7, "seven")
+
+    def nodes(node):
+        found = {id(node)}
+        for slot in node:
+            if isinstance(slot, tuple):
+                found |= nodes(slot)
+        return found
+
+    old_nodes = nodes(persistent._root)
+    new_nodes = nodes(changed._root)
+
+    # Only the path to the changed key is copied
+    assert len(new_nodes - old_nodes) <= 5
+    assert changed[7] == "seven"
+    assert persistent[7] == 7
@@ -0,0 +1,71 @@
+import base64
+import json
+import zlib
+
+import sharelink
+from elementstate import is_valid_element_value
+
+
+def make_token(theme: dict, elements: list) -> str:
+    payload = json.dumps([sharelink.SHARE_LINK_VERSION, theme, elements])
+    compressed = zlib.compress(payload.encode())
+    return base64.urlsafe_b64encode(compressed).decode("ascii").rstrip("=")
+
+
+def test_round_trip():
+    card = type("Card", (), {})()
+    card.name = "button"
+    card.styles = {"primary": {"background_color": "#ff0000", "font_size": "14.0px"}}
+
+    share_state = sharelink.decode_share_state(
+        sharelink.encode_share_state({"theme-primaryColor": "#123456"}, [card])
+    )
+
+    assert share_state.theme == {"theme-primaryColor": "#123456"}
+    assert share_state.elements == (("button", card.styles),)
+
+
+def test_hostile_values_are_dropped():
+    injection = "red} .stApp{display:none} x{"
+    token = make_token(
+        theme={
+            "primaryColor": injection,
+            "font": "sans-serif</style><script>alert(1)</script>",
+            "textColor": "#000000",
+        },
+        elements=[
+            [
+                "button",
+                {
+                    "primary": {
+                        "background_color": injection,
+                        "color": "#00ff00",
+                        "font_size": "12px; position: fixed",
+                        "border_width": "2px",
+                        "border_style": "solid} body{display:none",
+                        "font_weight": "700",
+                    }
+                },
+            ]
+        ],
+    )
+
+    share_state = sharelink.decode_share_state(token)
+
+    assert share_state.theme == {"theme-textColor": "#000000"}
+    assert share_state.elements == (
+        (
+            "button",
+            {"primary": {"color": "#00ff00", "border_width": "2px", "font_weight": "700"}},
+        ),
+    )
+
+
+def test_element_values_are_checked_by_input():
+    assert is_valid_element_value("label_color", "#ff000080")
+    assert is_valid_element_value("padding", "1.5rem")
+    assert is_valid_element_value("border_style", "dashed")
+    assert not is_valid_element_value("label_color", "red")
+    assert not is_valid_element_value("padding", "1.5vw")
+    assert not is_valid_element_value("border_style", "wavy")
+    assert not is_valid_element_value("value_font_weight", 700)
@@ -0,0 +1,87 @@
+import sqlite3
+import threading
+import time
+from functools import cache
+from typing import Optional
+
+
+class ThemeLibrary:
+    """sqlite-backed library of named theme snapshots per owner
+
+    A snapshot is a share link token of the theme and element state, see
+    sharelink.encode_share_state. Saving a name again replaces its snapshot.
+    All statements are served from indexes, so their cost does not grow with
+    the number of saved themes.
+    """
+
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS themes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    owner TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    snapshot TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS themes_owner_name "
+                "ON themes (owner, name)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS themes_owner_updated "
+                "ON themes (owner, updated_at DESC)"
+            )
+
+    def save(self, owner: str, name: str, snapshot: str):
+        """Save a snapshot under a name, replaces an existing snapshot of the name"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO themes (owner, name, snapshot, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (owner, name) DO UPDATE SET "
+                "snapshot = excluded.snapshot, updated_at = excluded.updated_at",
+                (owner, name, snapshot, now, now),
+            )
+
+    def load(self, owner: str, name: str) -> Optional[str]:
+        """Return the snapshot saved under a name, None if not found"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot FROM themes WHERE owner = ? AND name = ?",
+                (owner, name),
+            ).fetchone()
+        return row[0] if row else None
+
+    def list(self, owner: str, limit: int = 50) -> list[tuple[str, float]]:
+        """Return the most recently updated themes as (name, updated_at)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT name, updated_at FROM themes WHERE owner = ? "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (owner, limit),
+            ).fetchall()
+
+    def delete(self, owner: str, name: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM themes WHERE owner = ? AND name = ?", (owner, name)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@cache
+def get_theme_library(db_path: str) -> ThemeLibrary:
+    """Return the process-wide theme library of a database file"""
+    return ThemeLibrary(db_path)
@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Literal
+
+import uiconfig
+
+SECTION_PREFIXES = {
+    "theme": "theme",
+    "theme.sidebar": "theme-sidebar",
+}
+
+
+def toml_string(value: str) -> str:
+    return f'"{value}"'
+
+
+def toml_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def toml_int(value: int) -> str:
+    return f"{value}"
+
+
+def toml_size(value: tuple) -> str:
+    size_value, size_unit = value
+
+    # Round float values to 2 decimal places
+    if isinstance(size_value, float):
+        size_value = round(size_value, 2)
+
+    return f'"{size_value}{size_unit}"'
+
+
+TOML_SERIALIZERS = {
+    str: toml_string,
+    bool: toml_bool,
+    int: toml_int,
+    tuple: toml_size,
+}
+
+
+@dataclass(frozen=True)
+class ThemeProperty:
+    """A property of the theme editor in one config.toml section
+
+    key is the theme state key, e.g. 'theme-sidebar-baseRadius', for
+    config_key 'baseRadius' in section 'theme.sidebar'. Sizes have value type
+    tuple, e.g. (0.5, 'rem'), with units out of allowed_units.
+    """
+
+    key: str
+    config_key: str
+    section: str
+    tab: str
+    default: object
+    value_type: type
+    allowed_units: tuple[str, ...] = ()
+    to_toml: Callable[[object], str] = field(default=toml_string, repr=False)
+
+
+# config key, tab, value type, allowed units, main default, sidebar default
+# A sidebar default of None marks a property of the main section only
+# fmt: off
+THEME_SCHEMA_ROWS = (
+    ("primaryColor", "Color", str, (), uiconfig.PRIMARY_COLOR_DEFAULT, uiconfig.SIDEBAR_PRIMARY_COLOR_DEFAULT),
+    ("backgroundColor", "Color", str, (), uiconfig.BACKGROUND_COLOR_DEFAULT, uiconfig.SIDEBAR_BACKGROUND_COLOR_DEFAULT),
+    ("secondaryBackgroundColor", "Color", str, (), uiconfig.SECONDARY_BACKGROUND_COLOR_DEFAULT, uiconfig.SIDEBAR_SECONDARY_BACKGROUND_COLOR_DEFAULT),
+    ("textColor", "Color", str, (), uiconfig.TEXT_COLOR_DEFAULT, uiconfig.SIDEBAR_TEXT_COLOR_DEFAULT),
+    ("linkColor", "Color", str, (), uiconfig.LINK_COLOR_DEFAULT, uiconfig.SIDEBAR_LINK_COLOR_DEFAULT),
+    ("codeBackgroundColor", "Color", str, (), uiconfig.CODE_BG_COLOR_DEFAULT, uiconfig.SIDEBAR_CODE_BG_COLOR_DEFAULT),
+    ("dataframeBorderColor", "Color", str, (), uiconfig.DATAFRAME_BORDER_COLOR_DEFAULT, uiconfig.SIDEBAR_DATAFRAME_BORDER_COLOR_DEFAULT),
+    ("dataframeHeaderBackgroundColor", "Color", str, (), uiconfig.DATAFRAME_HEADER_BG_COLOR_DEFAULT, uiconfig.SIDEBAR_DATAFRAME_HEADER_BG_COLOR_DEFAULT),
+    ("borderColor", "Border", str, (), uiconfig.BORDER_COLOR_DEFAULT, uiconfig.SIDEBAR_BORDER_COLOR_DEFAULT),
+    ("showWidgetBorder", "Border", bool, (), uiconfig.SHOW_INPUT_WIDGET_BORDER_DEFAULT, uiconfig.SIDEBAR_SHOW_INPUT_WIDGET_BORDER_DEFAULT),
+    ("showSidebarBorder", "Border", bool, (), uiconfig.SHOW_SIDEBAR_BORDER_DEFAULT, None),
+    ("baseRadius", "Radius", tuple, ("px", "rem"), uiconfig.BASE_RADIUS_DEFAULT, uiconfig.SIDEBAR_BASE_RADIUS_DEFAULT),
+    ("buttonRadius", "Radius", tuple, ("px", "rem"), uiconfig.BUTTON_RADIUS_DEFAULT, uiconfig.SIDEBAR_BUTTON_RADIUS_DEFAULT),
+    ("font", "Font", str, (), uiconfig.FONT_DEFAULT, uiconfig.SIDEBAR_FONT_DEFAULT),
+    ("headingFont", "Font", str, (), uiconfig.HEADING_FONT_DEFAULT, uiconfig.SIDEBAR_HEADING_FONT_DEFAULT),
+    ("baseFontSize", "Font", int, ("px",), uiconfig.BASE_FONT_SIZE_DEFAULT, None),
+    ("baseFontWeight", "Font", int, (), uiconfig.BASE_FONT_WEIGHT_DEFAULT, None),
+    ("codeFont", "Font", str, (), uiconfig.CODE_FONT_DEFAULT, uiconfig.SIDEBAR_CODE_FONT_DEFAULT),
+    ("codeFontSize", "Font", tuple, ("px", "rem"), uiconfig.CODE_FONT_SIZE_DEFAULT, uiconfig.SIDEBAR_CODE_FONT_SIZE_DEFAULT),
+    ("codeFontWeight", "Font", int, (), uiconfig.CODE_FONT_WEIGHT_DEFAULT, uiconfig.SIDEBAR_CODE_FONT_WEIGHT_DEFAULT),
+)
+# fmt: on
+
+
+def build_theme_properties(rows) -> dict[str, ThemeProperty]:
+    """Expand schema rows into properties of the main and sidebar section"""
+    properties = {}
+
+    for config_key, tab, value_type, allowed_units, default, sidebar_default in rows:
+        section_defaults = {"theme": default, "theme.sidebar": sidebar_default}
+
+        for section, section_default in section_defaults.items():
+            if section_default is None:
+                continue
+
+            key = f"{SECTION_PREFIXES[section]}-{config_key}"
+            properties[key] = ThemeProperty(
+                key=key,
+                config_key=config_key,
+                section=section,
+                tab=tab,
+                default=section_default,
+                value_type=value_type,
+                allowed_units=allowed_units,
+                to_toml=TOML_SERIALIZERS[value_type],
+            )
+
+    return properties
+
+
+THEME_PROPERTIES = MappingProxyType(build_theme_properties(THEME_SCHEMA_ROWS))
+
+THEME_DEFAULTS = MappingProxyType(
+    {key: theme_property.default for key, theme_property in THEME_PROPERTIES.items()}
+)
+
+# Properties by (section, config key), e.g. ('theme.sidebar', 'font')
+CONFIG_PROPERTIES = MappingProxyType(
+    {
+        (theme_property.section, theme_property.config_key): theme_property
+        for theme_property in THEME_PROPERTIES.values()
+    }
+)
+
+
+def _tab_keys() -> dict[tuple[str, str], tuple[str, ...]]:
+    tab_keys = {}
+    for theme_property in THEME_PROPERTIES.values():
+        frame = "sidebar" if theme_property.section == "theme.sidebar" else "main"
+        tab_keys.setdefault((theme_property.tab, frame), []).append(theme_property.key)
+
+    return {tab_frame: tuple(keys) for tab_frame, keys in tab_keys.items()}
+
+
+# Theme state keys by (tab, frame), e.g. ('Radius', 'sidebar'), for resets
+TAB_KEYS = MappingProxyType(_tab_keys())
+
+
+def get_tab_keys(tab: str, frame: Literal["main", "sidebar"]) -> tuple[str, ...]:
+    return TAB_KEYS.get((tab, frame), ())
@@ -0,0 +1,106 @@
+from typing import Mapping
+
+import streamlit as st
+
+import editlog
+from themeschema import THEME_DEFAULTS
+
+
+THEME_STATE_KEY = "theme-state"
+
+
+class ThemeState:
+    """Theme values of a session stored as overrides of shared defaults
+
+    Keys follow the theme session naming, e.g. 'theme-primaryColor' or
+    'theme-sidebar-primaryColor'. Defaults are read from a process-wide
+    mapping, a session only holds the values which differ from them. Every
+    write compares the new value against the default, so changed properties
+    are known without scanning the session state. Writes are noted in the
+    edit log for undo and redo.
+    """
+
+    __slots__ = ("_defaults", "_overrides")
+
+    def __init__(self, defaults: Mapping = THEME_DEFAULTS):
+        self._defaults = defaults
+        self._overrides = {}
+
+    def __getstate__(self):
+        # Serialized sessions hold only their overrides
+        return self._overrides
+
+    def __setstate__(self, overrides: dict):
+        self._defaults = THEME_DEFAULTS
+        self._overrides = overrides
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._defaults
+
+    def __getitem__(self, key: str):
+        if key in self._overrides:
+            return self._overrides[key]
+        return self._defaults[key]
+
+    def __setitem__(self, key: str, value):
+        editlog.log_edit(editlog.theme_key(key))
+        if value == self._defaults[key]:
+            self._overrides.pop(key, None)
+        else:
+            self._overrides[key] = value
+
+    def __delitem__(self, key: str):
+        # Deleting a theme property falls back to its default
+        self.reset([key])
+
+    def items(self):
+        return ((key, self[key]) for key in self._defaults)
+
+    def default(self, key: str):
+        return self._defaults[key]
+
+    def is_dirty(self, key: str) -> bool:
+        return key in self._overrides
+
+    def reset(self, keys: list[str]):
+        """Reset given keys to their defaults"""
+        for key in keys:
+            if key in self._overrides:
+                editlog.log_edit(editlog.theme_key(key))
+                del self._overrides[key]
+
+    def replace(self, values: dict):
+        """Set all properties in one step, properties not in values are reset
+
+        All keys are checked before the state is modified.
+        """
+        unknown = [key for key in values if key not in self._defaults]
+        if unknown:
+            raise KeyError(f"Unknown theme properties: {', '.join(unknown)}")
+
+        self.reset(list(self._overrides))
+        for key, value in values.items():
+            self[key] = value
+
+    def changed(self) -> dict:
+        """Return all properties which differ from their default values"""
+        return dict(self._overrides)
+
+
+def get_theme_state() -> ThemeState:
+    """Return the theme state of the current session, create if missing"""
+    if THEME_STATE_KEY not in st.session_state:
+        st.session_state[THEME_STATE_KEY] = ThemeState()
+
+    return st.session_state[THEME_STATE_KEY]
+
+
+def replace_theme_values(values: dict):
+    """Replace the theme of the session, e.g. by an import or an undo step
+
+    All theme inputs get new seeds and render with the new values.
+    """
+    get_theme_state().replace(values)
+
+    for key in THEME_DEFAULTS:
+        st.session_state.pop(key + "-seed", None)
@@ -1,4 +1,19 @@
 CONFIG_TOML_TEMPLATE_PATH = "assets/template_config.toml"
+STUDIO_CSS_PATH = "assets/studio.css"
+FEEDBACK_OUTBOX_PATH = "feedback_outbox.sqlite3"
+PROMETHEUS_TEXTFILE_PATH = "studio_metrics.prom"
+THEME_LIBRARY_PATH = "theme_library.sqlite3"
+
+# Owner of saved themes without login, only with STUDIO_LOCAL_THEME_LIBRARY set
+THEME_LIBRARY_LOCAL_OWNER = "local"
+THEME_LIBRARY_LIST_LIMIT = 50
+THEME_LIBRARY_NAME_MAX_CHARS = 64
+
+# Sessions with more keys are logged after widget key collection
+SESSION_KEYS_WARNING_LIMIT = 1000
+
+# Undo steps kept per session
+EDIT_HISTORY_MAX_STEPS = 200
 
 css_properties_display_name = {
     "background_color": "Background Color",
@@ -69,11 +84,54 @@ css_properties_input_widget = {
     "value_font_weight": "selectbox",
 }
 
+# Values offered by the element inputs, imported and shared values are
+# checked against them before they are written into the element CSS
+ELEMENT_SIZE_UNITS = ["px", "em", "rem"]
+ELEMENT_SIZE_STEPS = [1.0, 0.1, 0.1]
+BORDER_STYLE_OPTIONS = [
+    "none",
+    "solid",
+    "dashed",
+    "dotted",
+    "double",
+    "groove",
+    "ridge",
+    "inset",
+    "outset",
+    "hidden",
+]
+FONT_WEIGHT_OPTIONS = ["100", "200", "300", "400", "500", "600", "700", "800", "900"]
+
+# Font families of the theme font select, other fonts are Google Fonts
+FONT_FAMILY_OPTIONS = ["sans-serif", "serif", "monospace"]
+
 
 # Elements not exported to CSS
 ELEMENTS_EXCLUDED_FROM_CSS = ["container"]
 
 
+# Theme color pairs checked for WCAG 2 contrast on the theme page,
+# (foreground, background, minimum ratio): 4.5 for text, 3 for UI components
+THEME_CONTRAST_PAIRS = [
+    ("textColor", "backgroundColor", 4.5),
+    ("textColor", "secondaryBackgroundColor", 4.5),
+    ("textColor", "codeBackgroundColor", 4.5),
+    ("linkColor", "backgroundColor", 4.5),
+    ("primaryColor", "backgroundColor", 3.0),
+    ("borderColor", "backgroundColor", 3.0),
+]
+
+THEME_COLOR_LABELS = {
+    "primaryColor": "Primary",
+    "backgroundColor": "Background",
+    "secondaryBackgroundColor": "Secondary Background",
+    "textColor": "Text",
+    "linkColor": "Link",
+    "codeBackgroundColor": "Code Background",
+    "borderColor": "Border",
+}
+
+
 # theme default values - COLOR
 PRIMARY_COLOR_DEFAULT = "#ff4b4b"
 BACKGROUND_COLOR_DEFAULT = "#ffffff"
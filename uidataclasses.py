@@ -1,8 +1,9 @@
-from pydantic import BaseModel
-from typing import List, Dict
+from dataclasses import dataclass, fields
+from typing import Dict, List, Mapping
 
 
-class StyledComponent(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StyledComponent:
     name: str
     preview_description: str
     description: str
@@ -14,3 +15,37 @@ class StyledComponent(BaseModel):
     main_image_url: str
     code_examples: List[Dict]
     code_copy_template: str
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "StyledComponent":
+        """Validate a component of st_yled, unknown keys are ignored
+
+        Raises:
+            ValueError: if a field is missing or of the wrong type
+        """
+        values = {}
+        for field in fields(cls):
+            if field.name not in data:
+                raise ValueError(f"Component field {field.name} is missing")
+
+            value = data[field.name]
+            if field.type is str:
+                valid = isinstance(value, str)
+            else:
+                valid = isinstance(value, list) and all(
+                    isinstance(item, dict) for item in value
+                )
+            if not valid:
+                raise ValueError(f"Component field {field.name} has type {type(value)}")
+
+            values[field.name] = value
+
+        return cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentCatalog:
+    """Validated st_yled components by slug"""
+
+    version: str
+    by_slug: Mapping[str, StyledComponent]
@@ -1,10 +1,14 @@
-from typing import Dict, Literal
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Literal, Optional
 
 import streamlit as st
 import st_yled
 
-import converters
-from uidataclasses import StyledComponent
+import colorengine
+import instrumentation
+import uiconfig
+from uidataclasses import ComponentCatalog, StyledComponent
 
 
 CATEGORY_SLUGS = {
@@ -31,58 +35,44 @@ def revert_category_slugs():
 def segmented_control_toggle(
     option1: str, option2: str, key: str, index: int = 0
 ) -> str:
-    css = f"""
-    .st-key-{key} label[data-baseweb="radio"]:has(input) {{
-    border-radius: 4px;
-    background-color: #b9b9b933;
-    border-width: 1px;
-    border-color: #31333f80;
-    border-style: none;
-    padding: 8px 16px;
-    margin: 0px;
-    }}
-
-    .st-key-{key} label[data-baseweb="radio"]:has(input) p {{
-        color: #31333f80;
-    }}
-
-    .st-key-{key} label[data-baseweb="radio"]:has(input[tabindex="0"]) {{
-        background-color: #ff4b4b33;
-        border: 1px none #ff4b4b;
-        margin: 0px;
-    }}
-
-    .st-key-{key} label[data-baseweb="radio"]:has(input[tabindex="0"]) p {{
-        color: #ff4b4b;
-    }}
-
-    .st-key-{key} label[data-baseweb="radio"] > div:first-child {{
-        display: none;
-    }}
-
-    .st-key-{key} label[data-baseweb="radio"] > div {{
-        padding: 0px;
-    }}
-    """
-
-    st.html(f"<style>{css}</style>")
-
-    return st_yled.radio(
-        "Frame Type",
-        options=[option1, option2],
-        key=key,
-        horizontal=True,
-        label_visibility="collapsed",
-        font_size="14px",
-        index=index,
-    )
+    # Toggle styles are shared for all toggles, see assets/studio.css
+    with st.container(key=f"segmented-toggle-{key}"):
+        return st_yled.radio(
+            "Frame Type",
+            options=[option1, option2],
+            key=key,
+            horizontal=True,
+            label_visibility="collapsed",
+            font_size="14px",
+            index=index,
+        )
+
+
+@cache
+def load_studio_css() -> str:
+    """Read the shared studio stylesheet once per process"""
+    with open(uiconfig.STUDIO_CSS_PATH, "r") as f:
+        return f.read()
+
+
+def inject_studio_css():
+    """Emit the shared studio stylesheet, called once per script run"""
+    st.html(f"<style>{load_studio_css()}</style>")
+
+
+def _target_state(state):
+    """Return the state mapping callbacks write to, session state by default"""
+    return st.session_state if state is None else state
+
+
+def update_st_from_input(theme_property: str, input_selector_key: str, state=None):
+    state = _target_state(state)
 
-def update_st_from_input(theme_property: str, input_selector_key: str):
     # Reset if input selector is none
     if st.session_state[input_selector_key] is None:
-        del st.session_state[theme_property]
+        del state[theme_property]
     else:
-        st.session_state[theme_property] = st.session_state[input_selector_key]
+        state[theme_property] = st.session_state[input_selector_key]
 
 
 def update_st_size_value_from_input(
@@ -90,19 +80,22 @@ def update_st_size_value_from_input(
     input_selector_key: str,
     current_unit: str,
     return_value_type: str,
+    state=None,
 ):
+    state = _target_state(state)
+
     # Reset if input selector is none
     if st.session_state[input_selector_key] is None:
-        del st.session_state[theme_property]
+        del state[theme_property]
     else:
         new_value = st.session_state[input_selector_key]
 
         if return_value_type == "str":
-            st.session_state[theme_property] = f"{new_value}{current_unit}"
+            state[theme_property] = f"{new_value}{current_unit}"
         elif return_value_type == "tuple":
-            st.session_state[theme_property] = (new_value, current_unit)
+            state[theme_property] = (new_value, current_unit)
         else:  # int
-            st.session_state[theme_property] = int(new_value)
+            state[theme_property] = int(new_value)
 
 
 def update_st_size_unit_from_input(
@@ -110,19 +103,22 @@ def update_st_size_unit_from_input(
     input_selector_key: str,
     current_number: float,
     return_value_type: str,
+    state=None,
 ):
+    state = _target_state(state)
+
     # Reset if input selector is none
     if st.session_state[input_selector_key] is None:
-        del st.session_state[theme_property]
+        del state[theme_property]
     else:
         new_value = st.session_state[input_selector_key]
 
         if return_value_type == "str":
-            st.session_state[theme_property] = f"{current_number}{new_value}"
+            state[theme_property] = f"{current_number}{new_value}"
         elif return_value_type == "tuple":
-            st.session_state[theme_property] = (current_number, new_value)
+            state[theme_property] = (current_number, new_value)
         else:  # int
-            st.session_state[theme_property] = int(current_number)
+            state[theme_property] = int(current_number)
 
 
 def base_color_picker(
@@ -134,6 +130,9 @@ def base_color_picker(
     color_state_value: str,
     code_color: str,
     caption_width: int,
+    state=None,
+    state_key: Optional[str] = None,
+    warning: Optional[str] = None,
 ):
     with st.container(horizontal=True, vertical_alignment="center"):
         st_yled.markdown(
@@ -152,8 +151,9 @@ def base_color_picker(
             key=key + "-code-" + seed_value,
         )
 
-        if color_state_value.startswith("#") and len(color_state_value) == 9:
-            display_color = converters.hex_with_alpha_to_hex(color_state_value)
+        # Colors with alpha are shown blended over white, resolved once per color
+        if colorengine.is_hex_color(color_state_value) and len(color_state_value) != 7:
+            display_color = colorengine.resolve_color(color_state_value)
         elif color_state_value.startswith("#"):
             display_color = color_state_value
         else:
@@ -165,11 +165,15 @@ def base_color_picker(
             key=key + "-picker-" + seed_value,
             label_visibility="collapsed",
             on_change=update_st_from_input,
-            args=(key, key + "-picker-" + seed_value),
+            args=(state_key or key, key + "-picker-" + seed_value, state),
         )
 
         st.caption("Select Color", width=caption_width)
 
+        # Flag e.g. low contrast, details in the tooltip
+        if warning:
+            st.caption(":orange[:material/contrast: Low contrast]", help=warning)
+
 
 def base_size_input(
     key,
@@ -182,6 +186,8 @@ def base_size_input(
     label_font_size: str = "16px",
     label_field_width: int = 140,
     return_value_type: Literal["int", "tuple", "str"] = "str",
+    state=None,
+    state_key: Optional[str] = None,
 ):
     with st.container(horizontal=True, vertical_alignment="center", width=400):
         st_yled.markdown(
@@ -201,7 +207,13 @@ def base_size_input(
             label_visibility="collapsed",
             on_change=update_st_size_value_from_input,
             placeholder="default",
-            args=(key, key + "-number-" + seed_value, unit, return_value_type),
+            args=(
+                state_key or key,
+                key + "-number-" + seed_value,
+                unit,
+                return_value_type,
+                state,
+            ),
         )
 
         index_select = allowed_units.index(unit)
@@ -217,12 +229,30 @@ def base_size_input(
             width=90,
             disabled=unit_disabled,
             on_change=update_st_size_unit_from_input,
-            args=(key, key + "-unit-" + seed_value, number_value, return_value_type),
+            args=(
+                state_key or key,
+                key + "-unit-" + seed_value,
+                number_value,
+                return_value_type,
+                state,
+            ),
         )
 
 
-def load_components() -> Dict[str, StyledComponent]:
-    components = st_yled.constants.COMPONENTS
-    return {
-        slug: StyledComponent(**component) for slug, component in components.items()
+@lru_cache(maxsize=1)
+def _build_component_catalog(st_yled_version: str) -> ComponentCatalog:
+    components = {
+        slug: StyledComponent.from_dict(component)
+        for slug, component in st_yled.constants.COMPONENTS.items()
     }
+
+    return ComponentCatalog(
+        version=st_yled_version,
+        by_slug=MappingProxyType(components),
+    )
+
+
+@instrumentation.timed("component_catalog_load")
+def load_component_catalog() -> ComponentCatalog:
+    """Return the component catalog, validated once per st_yled version"""
+    return _build_component_catalog(st_yled.__version__)